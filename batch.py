@@ -0,0 +1,192 @@
+"""
+Batch bucket fill over many .in files.
+
+Each input is parsed, validated and filled from its own start index and color
+in a worker process, and the result (final colors, stats and optionally the
+adjacency matrix) is written to OUTPUT_DIR/<name>.json; inputs from different
+directories that share a file name get a short hash of their path appended to
+<name>, so no result overwrites another. At most
+--max-in-flight files are queued at once, so arbitrarily long input lists do
+not pile up in memory.
+
+Usage: python3 batch.py OUTPUT_DIR INPUT [INPUT ...] [--jobs N] [--method bfs|dfs]
+                        [--matrix] [--max-in-flight N]
+
+INPUT may be a path or a glob pattern such as "scans/*.in".
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from graph import create_graph
+
+
+def expand_inputs(patterns):
+    """
+    Expands paths and glob patterns into a sorted, duplicate-free list of paths.
+
+    post: patterns without glob characters are kept as given, even if the
+          file does not exist, so the error is reported for that file.
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def output_names(paths):
+    """
+    Maps every path to the name of its result file, without the extension.
+
+    post: the name is the file name without its extension; names shared by
+          different files get "-" and 8 hex digits of a hash of the absolute
+          path appended, so every file gets its own result.
+    """
+    stems = {}
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        stems.setdefault(stem, set()).add(os.path.abspath(path))
+    names = {}
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if len(stems[stem]) > 1:
+            digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+            stem += "-" + digest[:8]
+        names[path] = stem
+    return names
+
+
+def process_file(path, output_dir, method="bfs", with_matrix=False, name=None):
+    """
+    Parses, fills and writes the result for one .in file.
+
+    pre: path is an .in file and output_dir an existing directory.
+
+    post: writes output_dir/<name>.json, name defaulting to the file name
+          without its extension, and returns the stats dictionary.
+    """
+    started = time.perf_counter()
+    with open(path, encoding="utf-8") as f:
+        data = f.read()
+    graph, start_index, color = create_graph(data, validate=True)
+    parsed = time.perf_counter()
+    recolored = getattr(graph, method)(start_index, color, verbose=False)
+    filled = time.perf_counter()
+
+    if name is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+    output = os.path.join(output_dir, name + ".json")
+    stats = {
+        "input": path,
+        "output": output,
+        "vertices": len(graph.vertices),
+        "edges": sum(len(vertex.edges) for vertex in graph.vertices) // 2,
+        "dropped_edges": graph.dropped_edges,
+        "start": start_index,
+        "color": color,
+        "method": method,
+        "recolored": recolored,
+        "parse_seconds": parsed - started,
+        "fill_seconds": filled - parsed,
+    }
+    result = {"stats": stats, "colors": [vertex.color for vertex in graph.vertices]}
+    if with_matrix:
+        result["matrix"] = graph.create_adjacency_matrix()
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+    return stats
+
+
+def run_batch(
+    paths, output_dir, jobs=None, method="bfs", with_matrix=False, max_in_flight=None
+):
+    """
+    Processes every path in a process pool with bounded in-flight work.
+
+    post: returns a tuple (results, failures, seconds) where results is the
+          list of stats dictionaries of successful files, failures is a list
+          of (path, error message) tuples and seconds is the wall time.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    max_in_flight = max_in_flight or jobs * 2
+    names = output_names(paths)
+    results = []
+    failures = []
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = {}
+        remaining = iter(paths)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_in_flight:
+                path = next(remaining, None)
+                if path is None:
+                    exhausted = True
+                    break
+                future = executor.submit(
+                    process_file, path, output_dir, method, with_matrix, names[path]
+                )
+                pending[future] = path
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    results.append(future.result())
+                except Exception as error:  # pylint: disable=broad-except
+                    failures.append((path, f"{type(error).__name__}: {error}"))
+
+    return results, failures, time.perf_counter() - started
+
+
+def main():
+    """Run the batch CLI."""
+    parser = argparse.ArgumentParser(description="Bucket fill many .in files.")
+    parser.add_argument("output_dir", help="directory for the <name>.json results")
+    parser.add_argument("inputs", nargs="+", help=".in paths or glob patterns")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--method", choices=("bfs", "dfs"), default="bfs")
+    parser.add_argument(
+        "--matrix", action="store_true", help="include the adjacency matrix"
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=None, help="files queued at once"
+    )
+    args = parser.parse_args()
+
+    paths = expand_inputs(args.inputs)
+    results, failures, seconds = run_batch(
+        paths, args.output_dir, args.jobs, args.method, args.matrix, args.max_in_flight
+    )
+
+    for path, message in failures:
+        print(f"FAILED {path}: {message}", file=sys.stderr)
+    vertices = sum(stats["vertices"] for stats in results)
+    recolored = sum(stats["recolored"] for stats in results)
+    rate = seconds if seconds > 0 else float("inf")
+    print(
+        f"Processed {len(results)} of {len(paths)} files in {seconds:.2f}s: "
+        f"{len(results) / rate:.1f} files/s, {vertices / rate:.0f} vertices/s, "
+        f"{recolored} vertices recolored."
+    )
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark of the bucket fill engines on large synthetic images.
+
+Builds a width x height 4-neighbor grid image made of random colored blocks
+with one large region around the center, then times every engine in
+engines.ENGINES filling from the center. Colors are restored between runs so
+every engine sees the same image.
+
+Usage: python3 benchmark.py [--size N] [--block N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import random
+import time
+
+from engines import ENGINES
+from graph import COLOR_DICT, grid_graph
+
+
+def make_grid_image(width, height, block=16, seed=0):
+    """
+    Builds a synthetic 4-neighbor grid ImageGraph.
+
+    The image is tiled with block x block squares of random colors, and the
+    middle half of the image is one solid color so the fill has a large
+    region to cover.
+
+    post: a tuple (graph, start_index) where start_index is the center pixel.
+    """
+    rng = random.Random(seed)
+    palette = list(COLOR_DICT)
+    blocks_wide = (width + block - 1) // block
+    block_colors = [
+        [rng.choice(palette) for _ in range(blocks_wide)]
+        for _ in range((height + block - 1) // block)
+    ]
+
+    def color_at(x, y):
+        if width // 4 <= x < 3 * width // 4 and height // 4 <= y < 3 * height // 4:
+            return "white"
+        return block_colors[y // block][x // block]
+
+    graph = grid_graph(
+        width, height, ([color_at(x, y) for x in range(width)] for y in range(height))
+    )
+
+    start_index = (height // 2) * width + width // 2
+    return graph, start_index
+
+
+def benchmark(graph, start_index, color, repeat=3):
+    """
+    Times every engine on the graph.
+
+    post: a dictionary mapping engine name to (best seconds, recolored count).
+    """
+    original = [vertex.color for vertex in graph.vertices]
+    results = {}
+    for name, engine in ENGINES.items():
+        best = None
+        recolored = 0
+        for _ in range(repeat):
+            for vertex, vertex_color in zip(graph.vertices, original):
+                vertex.color = vertex_color
+            graph.colors_changed()
+            started = time.perf_counter()
+            recolored = engine(graph, start_index, color)
+            seconds = time.perf_counter() - started
+            best = seconds if best is None else min(best, seconds)
+        results[name] = (best, recolored)
+    for vertex, vertex_color in zip(graph.vertices, original):
+        vertex.color = vertex_color
+    graph.colors_changed()
+    return results
+
+
+def main():
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description="Benchmark bucket fill engines.")
+    parser.add_argument("--size", type=int, default=1000, help="image width and height")
+    parser.add_argument("--block", type=int, default=16, help="random block size")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph, start_index = make_grid_image(args.size, args.size, args.block, args.seed)
+    print(
+        f"Built {len(graph.vertices)} vertices in {time.perf_counter() - started:.2f}s"
+    )
+
+    results = benchmark(graph, start_index, "magenta", args.repeat)
+    print(f"{'engine':<8} {'seconds':>9} {'recolored':>10} {'vertices/s':>12}")
+    for name, (seconds, recolored) in results.items():
+        rate = recolored / seconds if seconds else float("inf")
+        print(f"{name:<8} {seconds:>9.3f} {recolored:>10} {rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
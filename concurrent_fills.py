@@ -0,0 +1,191 @@
+"""
+Thread-safe bucket fills on one ImageGraph.
+
+The image is split into square tiles by vertex coordinates, each with its own
+lock. A fill first finds its region without locks (a hint that may be stale),
+then takes the locks of every tile holding a region vertex or a neighbor of
+one, always in sorted tile order so fills cannot deadlock. Under the locks the
+region is found again; if it reaches a tile that is not locked, another fill
+changed the image in the meantime, so the locks are dropped and the fill
+retries with the larger tile set. Otherwise the region is recolored exactly
+as ImageGraph.bfs would and the fill commits.
+
+Fills whose regions (with their borders) lie in different tiles run in
+parallel and commute. Conflicting fills are ordered by ticket: every fill
+gets a ticket when it is submitted and publishes the tiles it needs as a
+claim, and a fill waits while an earlier ticket still claims one of its
+tiles, so fills whose claims overlap always commit in ticket order. The
+commit order is recorded in history; replaying it with ImageGraph.bfs gives
+the same image, so the results are serializable.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ConcurrentFiller:
+    """
+    Runs bucket fills from many threads with tile-level locking.
+
+    Instance Variables:
+        graph: The ImageGraph being filled.
+        tile_size: The width and height of a lock tile in pixels.
+        history: (ticket, start_index, color, recolored) tuples in commit order.
+        retries: The number of times a fill found a conflict and retried.
+    """
+
+    def __init__(self, graph, tile_size=16):
+        self.graph = graph
+        self.tile_size = tile_size
+        self.history = []
+        self.retries = 0
+        tiles_wide = (graph.width + tile_size - 1) // tile_size
+        self._tile_of = [
+            (vertex.y // tile_size) * tiles_wide + vertex.x // tile_size
+            for vertex in graph.vertices
+        ]
+        tiles_high = (graph.height + tile_size - 1) // tile_size
+        self._locks = [threading.Lock() for _ in range(tiles_wide * tiles_high)]
+        self._state = threading.Condition()
+        self._next_ticket = 0
+        self._claims = {}
+
+    def _discover(self, start_index, allowed=None):
+        """
+        Find the region of start_index and the tiles it and its border touch.
+
+        post: returns (region, tiles, complete); complete is False if
+              allowed is given and the search read outside those tiles, in
+              which case region and tiles are only a hint for the retry.
+        """
+        vertices = self.graph.vertices
+        tile_of = self._tile_of
+        initial_color = vertices[start_index].color
+        region = [start_index]
+        seen = {start_index}
+        tiles = {tile_of[start_index]}
+        complete = True
+        position = 0
+        while position < len(region):
+            for neighbor_index in vertices[region[position]].edges:
+                tile = tile_of[neighbor_index]
+                if allowed is not None and tile not in allowed:
+                    complete = False
+                tiles.add(tile)
+                if neighbor_index not in seen and vertices[neighbor_index].color == initial_color:
+                    seen.add(neighbor_index)
+                    region.append(neighbor_index)
+            position += 1
+        return region, tiles, complete
+
+    def submit(self, start_index):
+        """
+        Reserves a ticket for a fill from start_index and claims its tiles.
+
+        post: returns the ticket; tickets are handed out in call order.
+        """
+        _, tiles, _ = self._discover(start_index)
+        with self._state:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._claims[ticket] = tiles
+        return ticket
+
+    def _release(self, ticket):
+        """Drops a ticket's claim and wakes the fills waiting on it."""
+        with self._state:
+            if self._claims.pop(ticket, None) is not None:
+                self._state.notify_all()
+
+    def _blocked(self, ticket, tiles):
+        return any(
+            other < ticket and not claim.isdisjoint(tiles)
+            for other, claim in self._claims.items()
+        )
+
+    def execute(self, ticket, start_index, color):
+        """
+        Performs a submitted fill, waiting for earlier conflicting tickets.
+
+        post: the vertices ImageGraph.bfs(start_index, color) would recolor at
+              commit time are recolored; returns their number. The ticket's
+              claim is dropped whether the fill commits or raises.
+        """
+        try:
+            return self._execute(ticket, start_index, color)
+        finally:
+            self._release(ticket)
+
+    def _execute(self, ticket, start_index, color):
+        vertices = self.graph.vertices
+        locks = self._locks
+        tiles = self._claims[ticket]
+        while True:
+            with self._state:
+                self._claims[ticket] = tiles
+                while self._blocked(ticket, tiles):
+                    self._state.wait()
+            held = sorted(tiles)
+            for tile in held:
+                locks[tile].acquire()
+            try:
+                region, tiles, complete = self._discover(start_index, set(held))
+                if not complete:
+                    tiles.update(held)
+                    with self._state:
+                        self.retries += 1
+                    continue
+
+                recolored = 0
+                if vertices[start_index].color != color:
+                    for index in region:
+                        vertex = vertices[index]
+                        vertex.prev_color = vertex.color
+                        vertex.color = color
+                    recolored = len(region)
+                with self._state:
+                    if recolored:
+                        self.graph.colors_changed()
+                        self.graph.mark_dirty(region)
+                    self.history.append((ticket, start_index, color, recolored))
+                    del self._claims[ticket]
+                    self._state.notify_all()
+                return recolored
+            finally:
+                for tile in held:
+                    locks[tile].release()
+
+    def fill(self, start_index, color):
+        """Bucket fills from start_index; safe to call from any thread."""
+        return self.execute(self.submit(start_index), start_index, color)
+
+    def run(self, fills, workers=4):
+        """
+        Runs many fills on a thread pool.
+
+        Tickets are handed out in list order before any fill starts, so
+        conflicting fills always commit in list order.
+
+        pre: fills is a list of (start_index, color) pairs.
+
+        post: returns the recolored counts in list order; raises IndexError
+              before taking any ticket if a start index is out of range.
+        """
+        num_vertices = len(self.graph.vertices)
+        for start_index, _ in fills:
+            if not 0 <= start_index < num_vertices:
+                raise IndexError(f"Start index {start_index} is out of range.")
+        tickets = []
+        try:
+            for start_index, _ in fills:
+                tickets.append(self.submit(start_index))
+        except BaseException:
+            for ticket in tickets:
+                self._release(ticket)
+            raise
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self.execute, ticket, start_index, color)
+                for ticket, (start_index, color) in zip(tickets, fills)
+            ]
+            return [future.result() for future in futures]
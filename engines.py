@@ -0,0 +1,250 @@
+"""
+Bucket fill engines over the CSR form of an ImageGraph.
+
+These engines work on flat arrays (ImageGraph.to_csr() plus a list of vertex
+colors) instead of walking ColoredVertex objects through the linked-list
+Queue and Stack, and never print. They recolor the same set of vertices as
+ImageGraph.bfs and ImageGraph.dfs.
+
+NumPy is optional: numpy_fill is only usable when it is installed, and
+fill(engine="auto") falls back to the pure-Python level-synchronous engine
+without it.
+"""
+
+from array import array
+
+from graph import COLOR_DICT
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+def bfs_levels(graph, start_index, color=None):
+    """
+    Level-synchronous BFS from start_index over same-colored vertices.
+
+    Each step expands the whole current frontier at once, so the result is
+    grouped by distance from the start vertex.
+
+    pre: start_index is a valid vertex index; color is the color to change
+         the reached vertices to, or None to leave colors untouched.
+
+    post: a tuple (level_offsets, order) of array("l") where the vertices at
+          distance d from the start are order[level_offsets[d]:level_offsets[d + 1]].
+    """
+    offsets, targets = graph.to_csr()
+    vertices = graph.vertices
+    colors = [vertex.color for vertex in vertices]
+    initial_color = colors[start_index]
+
+    visited = bytearray(len(vertices))
+    visited[start_index] = 1
+    order = array("l", [start_index])
+    level_offsets = array("l", [0])
+    level_start = 0
+
+    while level_start < len(order):
+        level_end = len(order)
+        level_offsets.append(level_end)
+        for position in range(level_start, level_end):
+            vertex_index = order[position]
+            for neighbor in targets[offsets[vertex_index] : offsets[vertex_index + 1]]:
+                if not visited[neighbor] and colors[neighbor] == initial_color:
+                    visited[neighbor] = 1
+                    order.append(neighbor)
+        level_start = level_end
+
+    if color is not None and color != initial_color:
+        _recolor(graph, order, color)
+
+    return level_offsets, order
+
+
+def distance_map(level_offsets, order, num_vertices):
+    """
+    Expands the output of bfs_levels into a per-vertex distance array.
+
+    post: an array("l") of length num_vertices holding each vertex's distance
+          from the start vertex, or -1 where the fill did not reach.
+    """
+    distances = array("l", [-1]) * num_vertices
+    for level in range(len(level_offsets) - 1):
+        for position in range(level_offsets[level], level_offsets[level + 1]):
+            distances[order[position]] = level
+    return distances
+
+
+def _recolor(graph, indices, color):
+    """Write color to the given vertices, keeping prev_color like bfs does."""
+    vertices = graph.vertices
+    for vertex_index in indices:
+        vertex = vertices[vertex_index]
+        vertex.prev_color = vertex.color
+        vertex.color = color
+    graph.colors_changed()
+    graph.mark_dirty(indices)
+
+
+# Code of every color string seen, for the per-vertex code arrays. Colors are
+# compared exactly as bfs compares them, so names outside COLOR_DICT (and
+# other spellings) get codes of their own on first use.
+_COLOR_CODES = {name: code for code, name in enumerate(COLOR_DICT)}
+
+
+def _color_code(color):
+    code = _COLOR_CODES.get(color)
+    if code is None:
+        code = _COLOR_CODES.setdefault(color, len(_COLOR_CODES))
+    return code
+
+
+def _numpy_csr(graph):
+    """
+    Return the graph's CSR as int64 arrays, cached on the graph.
+
+    The cache is dropped with the list form whenever the topology changes.
+    """
+    # pylint: disable=protected-access
+    csr = graph.to_csr()
+    cached = graph._csr_arrays
+    if cached is None or cached[0] is not csr:
+        offsets, targets = csr
+        cached = (
+            csr,
+            np.asarray(offsets, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+        )
+        graph._csr_arrays = cached
+    return cached[1], cached[2]
+
+
+def _numpy_color_codes(graph):
+    """
+    Return the color code of every vertex as an array, cached on the graph.
+
+    The cache is stored with the graph revision it was built at, so any
+    recolor, fill_region or vertex change since then rebuilds it.
+    """
+    # pylint: disable=protected-access
+    cached = graph._color_codes
+    if cached is None or cached[0] != graph.revision:
+        codes = np.fromiter(
+            (_color_code(vertex.color) for vertex in graph.vertices),
+            dtype=np.int32,
+            count=len(graph.vertices),
+        )
+        cached = graph._color_codes = (graph.revision, codes)
+    return cached[1]
+
+
+def numpy_fill(graph, start_index, color):
+    """
+    Vectorized frontier-expansion bucket fill.
+
+    Every iteration gathers all CSR neighbors of the frontier in one shot,
+    masks them by color and visited state, and marks the survivors as the
+    next frontier. The vertex objects are recolored in bulk at the end.
+
+    pre: NumPy is installed; start_index is a valid vertex index.
+
+    post: the same vertices as bfs are recolored; returns their number.
+    """
+    if np is None:
+        raise ImportError("numpy_fill requires NumPy.")
+    vertices = graph.vertices
+    initial_color = vertices[start_index].color
+    if initial_color == color:
+        return 0
+
+    offsets, targets = _numpy_csr(graph)
+    codes = _numpy_color_codes(graph)
+    same_color = codes == _color_code(initial_color)
+
+    visited = np.zeros(len(vertices), dtype=bool)
+    visited[start_index] = True
+    frontier = np.array([start_index], dtype=np.int64)
+
+    while frontier.size:
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        # Position of every neighbor slot of the frontier in targets.
+        row_base = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        neighbors = targets[row_base + np.arange(total)]
+        neighbors = neighbors[same_color[neighbors] & ~visited[neighbors]]
+        frontier = np.unique(neighbors)
+        visited[frontier] = True
+
+    filled = np.flatnonzero(visited)
+    _recolor(graph, filled.tolist(), color)
+    # _recolor dropped the codes; patching them keeps the next fill O(frontier).
+    codes[filled] = _color_code(color)
+    graph._color_codes = (graph.revision, codes)  # pylint: disable=protected-access
+    return int(filled.size)
+
+
+def levels_fill(graph, start_index, color):
+    """
+    Bucket fill with the pure-Python level-synchronous engine.
+
+    post: the same vertices as bfs are recolored; returns their number.
+    """
+    if graph.vertices[start_index].color == color:
+        return 0
+    _, order = bfs_levels(graph, start_index, color)
+    return len(order)
+
+
+def regions_fill(graph, start_index, color):
+    """
+    Bucket fill from the graph's cached region census.
+
+    The first call labels every region; later calls on the same graph only
+    touch the filled region and its border.
+
+    post: the same vertices as bfs are recolored; returns their number.
+    """
+    return graph.fill_region(start_index, color)
+
+
+def _reference_fill(method):
+    def run(graph, start_index, color):
+        return getattr(graph, method)(start_index, color, verbose=False)
+
+    run.__name__ = method + "_fill"
+    run.__doc__ = f"Bucket fill with the reference ImageGraph.{method}."
+    return run
+
+
+# All available engines by name; each is called as engine(graph, start, color)
+# and returns the number of recolored vertices.
+ENGINES = {
+    "bfs": _reference_fill("bfs"),
+    "dfs": _reference_fill("dfs"),
+    "levels": levels_fill,
+    "regions": regions_fill,
+}
+if np is not None:
+    ENGINES["numpy"] = numpy_fill
+
+
+def fill(graph, start_index, color, engine="auto"):
+    """
+    Bucket fill with the named engine.
+
+    pre: engine is a key of ENGINES or "auto", which picks "numpy" when NumPy
+         is installed and "levels" otherwise.
+
+    post: returns the number of recolored vertices.
+    """
+    if engine == "auto":
+        engine = "numpy" if "numpy" in ENGINES else "levels"
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown engine {engine!r}; available: {', '.join(ENGINES)}."
+        )
+    return ENGINES[engine](graph, start_index, color)
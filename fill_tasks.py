@@ -0,0 +1,205 @@
+"""
+Resumable, budgeted bucket fills.
+
+A FillTask performs the same traversal as ImageGraph.bfs or ImageGraph.dfs,
+but in slices: its Queue or Stack frontier is kept between calls, so a fill
+can advance a bounded number of vertices (or for a bounded time), yield to
+other work and continue later. A cancelled task restores every color it
+changed. FillScheduler interleaves many tasks round-robin.
+"""
+
+import time
+
+from graph import Queue, Stack
+
+# How many vertices to process between clock reads when a time budget is set.
+_CLOCK_INTERVAL = 64
+
+
+class FillTask:
+    """
+    A bucket fill that can be advanced in steps, paused and cancelled.
+
+    The task keeps its own visited set instead of the vertices' visited flags,
+    so several tasks may be in progress on one graph at a time.
+
+    Instance Variables:
+        graph: The ImageGraph being filled.
+        start_index: The index of the vertex the fill starts from.
+        color: The color to change vertices to.
+        method: "bfs" (Queue frontier) or "dfs" (Stack frontier).
+        recolored: The number of vertices recolored so far.
+        done: True once the frontier is exhausted.
+        cancelled: True once the task has been cancelled and rolled back.
+    """
+
+    def __init__(self, graph, start_index, color, method="bfs"):
+        if method not in ("bfs", "dfs"):
+            raise ValueError(f"Unknown fill method {method!r}.")
+        self.graph = graph
+        self.start_index = start_index
+        self.color = color
+        self.method = method
+        self.recolored = 0
+        self.done = False
+        self.cancelled = False
+
+        self._initial_color = graph.vertices[start_index].color
+        self._visited = set()
+        self._changes = []
+        if method == "bfs":
+            self._frontier = Queue()
+            self._add = self._frontier.enqueue
+            self._take = self._frontier.dequeue
+        else:
+            self._frontier = Stack()
+            self._add = self._frontier.push
+            self._take = self._frontier.pop
+
+        if self._initial_color == color:
+            self.done = True
+        else:
+            self._add(start_index)
+
+    def run(self, max_vertices=None, max_seconds=None):
+        """
+        Advances the fill until it finishes or a budget runs out.
+
+        pre: max_vertices is the most vertices to recolor in this call and
+             max_seconds the most wall time to spend; None means unbounded.
+
+        post: returns True if the fill is finished (or cancelled); raises
+              ValueError if max_vertices is less than 1, since such a run
+              could never make progress.
+        """
+        if max_vertices is not None and max_vertices < 1:
+            raise ValueError(f"max_vertices must be at least 1, got {max_vertices}.")
+        if self.done or self.cancelled:
+            return True
+
+        vertices = self.graph.vertices
+        visited = self._visited
+        changes = self._changes
+        frontier = self._frontier
+        add = self._add
+        take = self._take
+        initial_color = self._initial_color
+        color = self.color
+        deadline = None if max_seconds is None else time.monotonic() + max_seconds
+        budget = max_vertices
+        since_clock = 0
+        dirty = self.graph.dirty
+
+        recolored_before = self.recolored
+        while not frontier.is_empty():
+            if budget is not None and budget <= 0:
+                break
+            if deadline is not None:
+                since_clock += 1
+                if since_clock >= _CLOCK_INTERVAL:
+                    since_clock = 0
+                    if time.monotonic() >= deadline:
+                        break
+
+            index = take()
+            vertex = vertices[index]
+            if index in visited or vertex.color != initial_color:
+                continue
+            visited.add(index)
+            changes.append((vertex, vertex.color, vertex.prev_color))
+            vertex.prev_color = vertex.color
+            vertex.color = color
+            if dirty is not None:
+                dirty[(vertex.x, vertex.y)] = color
+            self.recolored += 1
+            if budget is not None:
+                budget -= 1
+            for neighbor_index in vertex.edges:
+                add(neighbor_index)
+
+        if self.recolored != recolored_before:
+            self.graph.colors_changed()
+        if not frontier.is_empty():
+            return False
+        self.done = True
+        self._visited = set()
+        return True
+
+    def steps(self, step_size):
+        """
+        Generator form of run().
+
+        post: yields the running recolored count after every step of at most
+              step_size vertices, until the fill is finished or cancelled;
+              raises ValueError if step_size is less than 1.
+        """
+        if step_size < 1:
+            raise ValueError(f"step_size must be at least 1, got {step_size}.")
+        while not self.run(max_vertices=step_size):
+            yield self.recolored
+        yield self.recolored
+
+    def cancel(self):
+        """
+        Stops the fill and restores every vertex it recolored.
+
+        post: the graph colors are as they were before the task started, as
+              far as this task's changes are concerned.
+        """
+        for vertex, color, prev_color in reversed(self._changes):
+            vertex.color = color
+            vertex.prev_color = prev_color
+        if self._changes:
+            self.graph.colors_changed()
+            self.graph.mark_dirty(vertex.index for vertex, _, _ in self._changes)
+        self._changes = []
+        self._visited = set()
+        self.recolored = 0
+        self.cancelled = True
+
+    def commit(self):
+        """Forgets the rollback log of a finished task to free its memory."""
+        if self.done:
+            self._changes = []
+
+
+class FillScheduler:
+    """
+    Round-robin scheduler that gives every pending FillTask an equal slice.
+
+    Instance Variables:
+        tasks: The tasks that have not finished yet, in scheduling order.
+    """
+
+    def __init__(self):
+        self.tasks = []
+
+    def add(self, task):
+        """Schedule a task."""
+        self.tasks.append(task)
+        return task
+
+    def run_round(self, max_vertices=None, max_seconds=None):
+        """
+        Runs each pending task once with the given per-task budget.
+
+        post: finished and cancelled tasks are dropped; returns the number of
+              tasks still pending.
+        """
+        pending = []
+        for task in self.tasks:
+            if not task.run(max_vertices, max_seconds):
+                pending.append(task)
+        self.tasks = pending
+        return len(pending)
+
+    def run(self, max_vertices=None, max_seconds=None):
+        """
+        Runs rounds until every task has finished.
+
+        post: raises ValueError if max_vertices is less than 1.
+        """
+        if max_vertices is not None and max_vertices < 1:
+            raise ValueError(f"max_vertices must be at least 1, got {max_vertices}.")
+        while self.run_round(max_vertices, max_seconds):
+            pass
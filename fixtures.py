@@ -0,0 +1,110 @@
+"""
+This module loads the expected graphs used by the test suite.
+
+The data lives in the fixtures/ directory as compact text files that are
+only read when a test asks for them:
+
+    <name>.list   - one line per vertex: color,x,y,<space-separated edges>
+    <name>.matrix - the vertex count, then one line per matrix row holding the
+                    space-separated columns that are 1
+
+all_lists_dict and all_matrix_dict behave like the dictionaries of the same
+names that used to be built at import time, but each graph is parsed on first
+access (and cached), and matrices are expanded to the dense form on demand.
+
+load_graph parses one of the .in images next to the tests into a fresh graph.
+"""
+
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+
+from graph import create_graph
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_graph(filename):
+    """
+    Parses an .in file into a new graph.
+
+    post: the (graph, start_index, color) tuple returned by create_graph.
+    """
+    with open(filename, encoding="utf-8") as f:
+        return create_graph(f.read())
+
+
+def _parse_indices(text):
+    return [int(index) for index in text.split()]
+
+
+@lru_cache(maxsize=None)
+def load_adjacency_list(name):
+    """
+    Loads the expected adjacency list of a graph.
+
+    post: a dictionary mapping vertex index to (color, x, y, edges).
+    """
+    adjacency_list = {}
+    with open(os.path.join(FIXTURE_DIR, name + ".list"), encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            color, x, y, edges = line.rstrip("\n").split(",")
+            adjacency_list[index] = (color, int(x), int(y), _parse_indices(edges))
+    return adjacency_list
+
+
+@lru_cache(maxsize=None)
+def load_sparse_matrix(name):
+    """
+    Loads the expected adjacency matrix of a graph in sparse form.
+
+    post: a tuple of tuples; entry i holds the columns of row i that are 1.
+    """
+    with open(os.path.join(FIXTURE_DIR, name + ".matrix"), encoding="utf-8") as f:
+        size = int(f.readline())
+        rows = tuple(tuple(_parse_indices(f.readline())) for _ in range(size))
+    return rows
+
+
+def load_adjacency_matrix(name):
+    """
+    Loads the expected adjacency matrix of a graph in dense form.
+
+    post: a fresh 2D list of 0/1 integers.
+    """
+    rows = load_sparse_matrix(name)
+    matrix = [[0] * len(rows) for _ in rows]
+    for row, columns in zip(matrix, rows):
+        for column in columns:
+            row[column] = 1
+    return matrix
+
+
+class LazyFixtures(Mapping):
+    """Read-only mapping from graph name to fixture, loaded on access."""
+
+    def __init__(self, extension, loader):
+        self._extension = extension
+        self._loader = loader
+
+    def _names(self):
+        return sorted(
+            filename[: -len(self._extension)]
+            for filename in os.listdir(FIXTURE_DIR)
+            if filename.endswith(self._extension)
+        )
+
+    def __getitem__(self, name):
+        if not os.path.exists(os.path.join(FIXTURE_DIR, name + self._extension)):
+            raise KeyError(name)
+        return self._loader(name)
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __len__(self):
+        return len(self._names())
+
+
+all_lists_dict = LazyFixtures(".list", load_adjacency_list)
+all_matrix_dict = LazyFixtures(".matrix", load_adjacency_matrix)
@@ -238,6 +238,145 @@ class Queue:
         return self._size
 
 
+class GraphValidationError(ValueError):
+    """
+    Custom exception class for invalid graph input data.
+
+    Instance Variables:
+        errors: A list of messages, one for every bad record that was found.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        shown = "\n".join(errors[:20])
+        if len(errors) > 20:
+            shown += f"\n... and {len(errors) - 20} more"
+        super().__init__(f"{len(errors)} invalid record(s) in graph data:\n{shown}")
+
+    def __reduce__(self):
+        # Rebuild from the error list so the exception survives pickling,
+        # e.g. when it is raised in a worker process.
+        return (GraphValidationError, (self.errors,))
+
+
+class AdjacencyMatrixView:
+    """
+    Read-only view of an ImageGraph adjacency matrix stored sparsely.
+
+    Indexing with a pair gives one entry and indexing with an int gives a
+    dense row as a tuple, so view[i][j] reads like the list matrix.
+
+    Instance Variables:
+        size: The number of rows and columns.
+    """
+
+    def __init__(self, rows):
+        self._rows = rows
+        self.size = len(rows)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            row, column = key
+            return 1 if column in self._rows[row] else 0
+        neighbors = self._rows[key]
+        return tuple(1 if column in neighbors else 0 for column in range(self.size))
+
+    def __iter__(self):
+        for row in range(self.size):
+            yield self[row]
+
+    def neighbors(self, row):
+        """Return the columns that are 1 in the given row, in ascending order."""
+        return sorted(self._rows[row])
+
+    def to_list(self):
+        """Return a dense, mutable 2D list copy of the matrix."""
+        matrix = [[0] * self.size for _ in range(self.size)]
+        for row, neighbors in zip(matrix, self._rows):
+            for column in neighbors:
+                row[column] = 1
+        return matrix
+
+
+class RegionCensus:
+    """
+    The same-color connected regions of an ImageGraph.
+
+    Regions are numbered by label. Labels are never reused: when regions
+    merge, the smaller one is emptied (size 0) and its vertices relabeled.
+
+    Instance Variables:
+        labels: The region label of every vertex, indexed by vertex index.
+        sizes: The number of vertices in every region, indexed by label.
+        colors: The color of every region, indexed by label.
+        members: The vertex indices in every region, indexed by label.
+    """
+
+    def __init__(self, labels, sizes, colors, members):
+        self.labels = labels
+        self.sizes = sizes
+        self.colors = colors
+        self.members = members
+
+    def region_count(self):
+        """Return the number of non-empty regions."""
+        return sum(1 for size in self.sizes if size)
+
+    def counts_by_color(self):
+        """Return a dictionary mapping each color to its number of regions."""
+        counts = {}
+        for size, color in zip(self.sizes, self.colors):
+            if size:
+                counts[color] = counts.get(color, 0) + 1
+        return counts
+
+    def size_histogram(self):
+        """Return a dictionary mapping region size to the number of regions."""
+        histogram = {}
+        for size in self.sizes:
+            if size:
+                histogram[size] = histogram.get(size, 0) + 1
+        return histogram
+
+    def merge(self, first, second):
+        """
+        Merges two regions by relabeling the smaller one.
+
+        post: returns the label of the merged region.
+        """
+        if first == second:
+            return first
+        if self.sizes[first] < self.sizes[second]:
+            first, second = second, first
+        for index in self.members[second]:
+            self.labels[index] = first
+        self.members[first].extend(self.members[second])
+        self.sizes[first] += self.sizes[second]
+        self.members[second] = []
+        self.sizes[second] = 0
+        return first
+
+    def split(self, label, indices):
+        """
+        Moves the given vertices of a region into a new region.
+
+        post: returns the new label.
+        """
+        new_label = len(self.sizes)
+        moved = set(indices)
+        for index in moved:
+            self.labels[index] = new_label
+        self.members[label] = [i for i in self.members[label] if i not in moved]
+        self.sizes[label] -= len(moved)
+        self.members.append(list(moved))
+        self.sizes.append(len(moved))
+        self.colors.append(self.colors[label])
+        return new_label
+
+
 class ColoredVertex:
     """Class for a graph vertex."""
 
@@ -249,34 +388,99 @@ class ColoredVertex:
         self.y = y
         self.edges = []
         self.visited = False
+        self.owner = None
+        self._edge_positions = None
 
     def add_edge(self, vertex_index):
         """Add an edge to another vertex."""
         self.edges.append(vertex_index)
+        self._edge_positions = None
+        if self.owner is not None:
+            self.owner.topology_changed()
+
+    def _positions(self):
+        """Map each neighbor to its position in edges, built on first use."""
+        if self._edge_positions is None:
+            self._edge_positions = {}
+            for position, neighbor in enumerate(self.edges):
+                self._edge_positions.setdefault(neighbor, position)
+        return self._edge_positions
+
+    def has_edge(self, vertex_index):
+        """Return True if there is an edge to the given vertex, in O(1)."""
+        return vertex_index in self._positions()
+
+    def _link(self, vertex_index):
+        """Append an edge, keeping the position map current."""
+        self._positions()[vertex_index] = len(self.edges)
+        self.edges.append(vertex_index)
 
-    def visit_and_set_color(self, color):
+    def _unlink(self, vertex_index):
+        """Remove an edge in O(1) by moving the last edge into its slot."""
+        positions = self._positions()
+        position = positions.pop(vertex_index)
+        last = self.edges.pop()
+        if position < len(self.edges):
+            self.edges[position] = last
+            positions[last] = position
+
+    def _relink(self, old_index, new_index):
+        """Point the edge to old_index at new_index instead."""
+        positions = self._positions()
+        position = positions.pop(old_index)
+        self.edges[position] = new_index
+        positions[new_index] = position
+
+    def visit_and_set_color(self, color, verbose=True):
         """Set the color of the vertex and mark it visited."""
         self.visited = True
         self.prev_color = self.color
         self.color = color
-        print("Visited vertex " + str(self.index))
+        if verbose:
+            print("Visited vertex " + str(self.index))
 
     def __str__(self):
         return f"index: {self.index}, color: {self.color}, x: {self.x}, y: {self.y}"
 
 
 class ImageGraph:
-    """Class for the graph."""
+    """
+    Class for the graph.
 
-    def __init__(self, image_size):
+    Instance Variables:
+        vertices: The list of ColoredVertex objects, indexed by vertex index.
+        width: The image width in pixels.
+        height: The image height in pixels.
+        image_size: The larger of width and height; equal to both for the
+            square images described by a single-number header.
+        dropped_edges: The number of duplicate or self-loop edges create_graph
+            dropped while loading.
+        revision: A counter bumped by every ImageGraph method that changes
+            colors or topology, so derived structures can tell they are stale.
+        dirty: None, or while dirty tracking is on (see track_dirty), a
+            dictionary mapping the (x, y) of every cell recolored since the
+            last take_dirty() to its new color (None for a removed vertex).
+    """
+
+    def __init__(self, image_size, height=None):
         self.vertices = []
-        self.image_size = image_size
+        self.width = image_size
+        self.height = image_size if height is None else height
+        self.image_size = max(self.width, self.height)
+        self.dropped_edges = 0
+        self.revision = 0
+        self.dirty = None
+        self._dirty_pending = {}
+        self._adjacency = None
+        self._csr = None
+        self._csr_arrays = None
+        self._census = None
+        self._color_codes = None
+        self._topology_size = -1
 
     def print_image(self):
         """Print the image formed by the vertices."""
-        img = [
-            ["black" for _ in range(self.image_size)] for _ in range(self.image_size)
-        ]
+        img = [["black" for _ in range(self.width)] for _ in range(self.height)]
 
         # Fill img array
         for vertex in self.vertices:
@@ -289,6 +493,360 @@ class ImageGraph:
         # Print new line/reset color
         print(RESET_CHAR)
 
+    def track_dirty(self, enabled=True, consumer=None):
+        """
+        Turns recording of recolored cells in self.dirty on or off.
+
+        Every fill method records the cells it recolors while tracking is on;
+        code that sets vertex colors directly must call mark_dirty. Several
+        consumers (any hashable key) may track at once; each gets every change
+        from take_dirty, and tracking stops when the last one turns it off.
+        """
+        if enabled:
+            if self.dirty is None:
+                self.dirty = {}
+            self._dirty_pending.setdefault(consumer, {})
+        else:
+            self._dirty_pending.pop(consumer, None)
+            if not self._dirty_pending:
+                self.dirty = None
+
+    def take_dirty(self, consumer=None):
+        """
+        Returns the cells recolored since the consumer's last call.
+
+        Must be called from the thread that runs the fills.
+
+        post: a dictionary mapping (x, y) to color; empty if the consumer is
+              not tracking.
+        """
+        dirty = self.dirty
+        if dirty is None or consumer not in self._dirty_pending:
+            return {}
+        if dirty:
+            for pending in self._dirty_pending.values():
+                pending.update(dirty)
+            self.dirty = {}
+        taken = self._dirty_pending[consumer]
+        self._dirty_pending[consumer] = {}
+        return taken
+
+    def mark_dirty(self, indices):
+        """Records the current colors of the given vertices as dirty."""
+        dirty = self.dirty
+        if dirty is None:
+            return
+        vertices = self.vertices
+        for index in indices:
+            vertex = vertices[index]
+            dirty[(vertex.x, vertex.y)] = vertex.color
+
+    def topology_changed(self):
+        """
+        Drops the cached adjacency matrix, CSR arrays and region census.
+
+        ColoredVertex.add_edge calls this for vertices owned by the graph;
+        code that edits an edges list directly must call it itself.
+        """
+        self._adjacency = None
+        self._csr = None
+        self._csr_arrays = None
+        self._census = None
+        self.revision += 1
+
+    def colors_changed(self):
+        """
+        Drops the cached region census and color codes after vertices were
+        recolored.
+
+        The fill methods call this themselves; code that sets vertex colors
+        directly must call it.
+        """
+        self._census = None
+        self._color_codes = None
+        self.revision += 1
+
+    def region_census(self):
+        """
+        Labels every same-color connected region in one pass over the graph.
+
+        The census is cached and kept up to date by fill_region and the edge
+        mutation methods; other fills and raw edge edits drop it.
+
+        post: a RegionCensus covering every vertex.
+        """
+        self._check_topology()
+        if self._census is None:
+            vertices = self.vertices
+            labels = [-1] * len(vertices)
+            sizes = []
+            colors = []
+            members = []
+            for vertex in vertices:
+                if labels[vertex.index] != -1:
+                    continue
+                label = len(sizes)
+                color = vertex.color
+                labels[vertex.index] = label
+                region = [vertex.index]
+                position = 0
+                while position < len(region):
+                    for neighbor in vertices[region[position]].edges:
+                        if labels[neighbor] == -1 and vertices[neighbor].color == color:
+                            labels[neighbor] = label
+                            region.append(neighbor)
+                    position += 1
+                sizes.append(len(region))
+                colors.append(color)
+                members.append(region)
+            self._census = RegionCensus(labels, sizes, colors, members)
+        return self._census
+
+    def fill_region(self, start_index, color):
+        """
+        Bucket fills using the region census instead of a traversal.
+
+        The region containing start_index is recolored straight from its
+        member list, then merged with the neighboring regions that already
+        had the new color, so the census stays valid for the next call.
+
+        post: the same vertices as bfs(start_index, color) are recolored;
+              returns their number.
+        """
+        census = self.region_census()
+        label = census.labels[start_index]
+        if census.colors[label] == color:
+            return 0
+
+        vertices = self.vertices
+        dirty = self.dirty
+        for index in census.members[label]:
+            vertex = vertices[index]
+            vertex.prev_color = vertex.color
+            vertex.color = color
+            if dirty is not None:
+                dirty[(vertex.x, vertex.y)] = color
+        recolored = census.sizes[label]
+        census.colors[label] = color
+        self.revision += 1
+
+        touching = set()
+        for index in census.members[label]:
+            for neighbor in vertices[index].edges:
+                neighbor_label = census.labels[neighbor]
+                if neighbor_label != label and census.colors[neighbor_label] == color:
+                    touching.add(neighbor_label)
+        for neighbor_label in touching:
+            label = census.merge(label, neighbor_label)
+        return recolored
+
+    def _census_edge_added(self, from_index, to_index):
+        """Merge the two regions an added edge joins, if they share a color."""
+        census = self._census
+        if census is not None and (
+            self.vertices[from_index].color == self.vertices[to_index].color
+        ):
+            census.merge(census.labels[from_index], census.labels[to_index])
+
+    def _census_edge_removed(self, from_index, to_index):
+        """
+        Split a region if a removed edge disconnected it.
+
+        Searches from both endpoints at once inside the region and stops as
+        soon as the searches meet or one side is exhausted, so the cost is
+        bounded by the smaller side.
+        """
+        census = self._census
+        if census is None:
+            return
+        label = census.labels[from_index]
+        if census.labels[to_index] != label:
+            return
+        labels = census.labels
+        vertices = self.vertices
+        sides = ([from_index], [to_index])
+        seen = ({from_index}, {to_index})
+        positions = [0, 0]
+        while True:
+            for side in (0, 1):
+                if positions[side] == len(sides[side]):
+                    census.split(label, sides[side])
+                    return
+                index = sides[side][positions[side]]
+                positions[side] += 1
+                for neighbor in vertices[index].edges:
+                    if labels[neighbor] != label or neighbor in seen[side]:
+                        continue
+                    if neighbor in seen[1 - side]:
+                        return
+                    seen[side].add(neighbor)
+                    sides[side].append(neighbor)
+
+    def _check_topology(self):
+        """Invalidate the caches if vertices were added since they were built."""
+        if self._topology_size != len(self.vertices):
+            self.topology_changed()
+            for vertex in self.vertices:
+                vertex.owner = self
+            self._topology_size = len(self.vertices)
+
+    def add_edge(self, from_index, to_index):
+        """
+        Adds an undirected edge between two vertices in O(1).
+
+        Unlike ColoredVertex.add_edge, duplicates and self-loops are refused,
+        and the cached adjacency matrix is patched instead of rebuilt.
+
+        post: returns True if the edge was added, False if it already existed
+              or is a self-loop.
+        """
+        self._check_topology()
+        if from_index == to_index or self.vertices[from_index].has_edge(to_index):
+            return False
+        self.vertices[from_index]._link(to_index)
+        self.vertices[to_index]._link(from_index)
+        if self._adjacency is not None:
+            self._adjacency._rows[from_index].add(to_index)
+            self._adjacency._rows[to_index].add(from_index)
+        self._csr = None
+        self._csr_arrays = None
+        self.revision += 1
+        self._census_edge_added(from_index, to_index)
+        return True
+
+    def remove_edge(self, from_index, to_index):
+        """
+        Removes the undirected edge between two vertices in O(1).
+
+        The order of the remaining edges of both vertices may change.
+
+        post: returns True if the edge existed.
+        """
+        self._check_topology()
+        if not self.vertices[from_index].has_edge(to_index):
+            return False
+        self.vertices[from_index]._unlink(to_index)
+        if from_index != to_index and self.vertices[to_index].has_edge(from_index):
+            self.vertices[to_index]._unlink(from_index)
+        if self._adjacency is not None:
+            self._adjacency._rows[from_index].discard(to_index)
+            self._adjacency._rows[to_index].discard(from_index)
+        self._csr = None
+        self._csr_arrays = None
+        self.revision += 1
+        self._census_edge_removed(from_index, to_index)
+        return True
+
+    def add_vertex(self, x, y, color):
+        """
+        Appends a new vertex without edges in O(1) amortized.
+
+        post: returns the index of the new vertex.
+        """
+        self._check_topology()
+        vertex = ColoredVertex(len(self.vertices), x, y, color)
+        vertex.owner = self
+        self.vertices.append(vertex)
+        self._topology_size += 1
+        if self._adjacency is not None:
+            self._adjacency._rows.append(set())
+            self._adjacency.size += 1
+        self._csr = None
+        self._csr_arrays = None
+        self.revision += 1
+        if self.dirty is not None:
+            self.dirty[(x, y)] = color
+        if self._census is not None:
+            census = self._census
+            census.labels.append(len(census.sizes))
+            census.sizes.append(1)
+            census.colors.append(color)
+            census.members.append([vertex.index])
+        return vertex.index
+
+    def remove_vertex(self, index):
+        """
+        Removes a vertex and its edges in O(degree).
+
+        To keep indices dense, the last vertex is moved into the freed index
+        and its neighbors' edges are renumbered.
+
+        post: returns the former index of the vertex that now has the given
+              index, or None if the removed vertex was the last one.
+        """
+        self._check_topology()
+        self._census = None
+        self.revision += 1
+        vertex = self.vertices[index]
+        if self.dirty is not None:
+            self.dirty[(vertex.x, vertex.y)] = None
+        for neighbor in list(vertex.edges):
+            self.remove_edge(index, neighbor)
+
+        last = self.vertices.pop()
+        self._topology_size -= 1
+        rows = None if self._adjacency is None else self._adjacency._rows
+        if rows is not None:
+            last_row = rows.pop()
+            self._adjacency.size -= 1
+        self._csr = None
+        self._csr_arrays = None
+        if last is vertex:
+            return None
+
+        old_index = last.index
+        last.index = index
+        self.vertices[index] = last
+        for neighbor in last.edges:
+            self.vertices[neighbor]._relink(old_index, index)
+        if rows is not None:
+            rows[index] = last_row
+            for neighbor in last_row:
+                rows[neighbor].discard(old_index)
+                rows[neighbor].add(index)
+        return old_index
+
+    def to_csr(self):
+        """
+        Returns the adjacency of the graph in compressed sparse row form.
+
+        The arrays are cached until the topology changes and are shared
+        between callers, so they must not be modified.
+
+        post: a tuple (offsets, targets) of lists where the neighbors of vertex i
+              are targets[offsets[i]:offsets[i + 1]], in the order they appear
+              in its edges list.
+        """
+        self._check_topology()
+        if self._csr is None:
+            offsets = [0] * (len(self.vertices) + 1)
+            targets = []
+            for vertex in self.vertices:
+                targets.extend(vertex.edges)
+                offsets[vertex.index + 1] = len(targets)
+            self._csr = (offsets, targets)
+        return self._csr
+
+    def adjacency_matrix(self):
+        """
+        Returns a read-only view of the adjacency matrix.
+
+        The sparse rows behind the view are cached until an edge is added or
+        vertices are appended, so asking again after fills costs nothing.
+
+        post: an AdjacencyMatrixView with the same entries as
+              create_adjacency_matrix().
+        """
+        self._check_topology()
+        if self._adjacency is None:
+            rows = [set() for _ in self.vertices]
+            for vertex in self.vertices:
+                for neighbor in vertex.edges:
+                    rows[vertex.index].add(neighbor)
+                    rows[neighbor].add(vertex.index)  # Since the graph is undirected
+            self._adjacency = AdjacencyMatrixView(rows)
+        return self._adjacency
+
     def reset_visited(self):
         """Reset the visited flag for all vertices."""
         for vertex in self.vertices:
@@ -302,17 +860,60 @@ class ImageGraph:
 
         post: return a 2D list of integers representing the adjacency matrix.
         """
+        return self.adjacency_matrix().to_list()
+
+    def iter_adjacency_rows(self, fmt="list"):
+        """
+        Generates the adjacency matrix one text row at a time.
+
+        Only a single row buffer is allocated, so memory stays constant no
+        matter how many vertices there are. Rows are built from each vertex's
+        own edges, which create_graph keeps symmetric.
+
+        pre: fmt is one of
+             "list"   - the same text as print(row) on create_adjacency_matrix()
+             "sparse" - "i: j k ..." listing the neighbors of vertex i
+             "bits"   - the row packed 8 columns per byte, most significant
+                        bit first, as hexadecimal
+
+        post: yields one string per vertex, without a trailing newline.
+        """
         size = len(self.vertices)
-        matrix = [[0 for _ in range(size)] for _ in range(size)]
+        if fmt == "list":
+            row = ["0"] * size
+            for vertex in self.vertices:
+                for neighbor in vertex.edges:
+                    row[neighbor] = "1"
+                yield "[" + ", ".join(row) + "]"
+                for neighbor in vertex.edges:
+                    row[neighbor] = "0"
+        elif fmt == "sparse":
+            for vertex in self.vertices:
+                yield f"{vertex.index}: " + " ".join(map(str, sorted(set(vertex.edges))))
+        elif fmt == "bits":
+            row = bytearray((size + 7) // 8)
+            for vertex in self.vertices:
+                for neighbor in vertex.edges:
+                    row[neighbor >> 3] |= 0x80 >> (neighbor & 7)
+                yield row.hex()
+                for neighbor in vertex.edges:
+                    row[neighbor >> 3] = 0
+        else:
+            raise ValueError(f"Unknown adjacency matrix format {fmt!r}.")
 
-        for vertex in self.vertices:
-            for neighbor in vertex.edges:
-                matrix[vertex.index][neighbor] = 1
-                matrix[neighbor][vertex.index] = 1  # Since the graph is undirected
+    def write_adjacency_matrix(self, out, fmt="list"):
+        """
+        Streams the adjacency matrix to a text file object, one row per line.
 
-        return matrix
+        pre: out is a writable text file object; fmt is a format accepted by
+             iter_adjacency_rows.
+        """
+        write = out.write
+        for row in self.iter_adjacency_rows(fmt):
+            write(row)
+            write("\n")
 
-    def bfs(self, start_index, color):
+    def bfs(self, start_index, color, progress=None, verbose=True):
         """
         You must implement this algorithm using a Queue.
 
@@ -331,31 +932,50 @@ class ImageGraph:
         pre: start_index is a valid integer representing the index of the starting
              vertex in the vertices instance variable.
              color: The color to change vertices to during the DFS traversal
+             progress: Optional; an object with tick(graph) and finish(graph)
+             methods (such as raster.FillProgress) that is told about every
+             visited vertex, e.g. to stream animation frames.
+             verbose: Optional; when False nothing is printed, for callers
+             such as the fill server that only want the recolored graph.
 
         post: every vertex that matches the start index's color will be recolored
-              to the given color
+              to the given color; returns the number of recolored vertices.
         """
 
         self.reset_visited()
-        print("Starting BFS; initial state:")
-        self.print_image()
+        if verbose:
+            print("Starting BFS; initial state:")
+            self.print_image()
 
         self.reset_visited()
         initial_color = self.vertices[start_index].color
         if initial_color == color:
-            return
+            return 0
 
+        recolored = 0
+        dirty = self.dirty
         queue = Queue()
         queue.enqueue(self.vertices[start_index])
 
         while not queue.is_empty():
             current_vertex = queue.dequeue()
             if not current_vertex.visited and current_vertex.color == initial_color:
-                current_vertex.visit_and_set_color(color)
+                current_vertex.visit_and_set_color(color, verbose)
+                recolored += 1
+                if dirty is not None:
+                    dirty[(current_vertex.x, current_vertex.y)] = color
+                if progress is not None:
+                    progress.tick(self)
                 for neighbor_index in current_vertex.edges:
                     queue.enqueue(self.vertices[neighbor_index])
 
-    def dfs(self, start_index, color):
+        if recolored:
+            self.colors_changed()
+        if progress is not None:
+            progress.finish(self)
+        return recolored
+
+    def dfs(self, start_index, color, progress=None, verbose=True):
         """
         You must implement this algorithm using a Stack WITHOUT using recursion.
 
@@ -374,63 +994,362 @@ class ImageGraph:
         pre: start_index is a valid integer representing the index of the starting
              vertex in the vertices instance variable.
              color: The color to change vertices to during the DFS traversal
+             progress: Optional; an object with tick(graph) and finish(graph)
+             methods (such as raster.FillProgress) that is told about every
+             visited vertex, e.g. to stream animation frames.
+             verbose: Optional; when False nothing is printed, for callers
+             such as the fill server that only want the recolored graph.
 
         post: every vertex that matches the start index's color will be recolored
-              to the given color
+              to the given color; returns the number of recolored vertices.
         """
 
         self.reset_visited()
-        print("Starting DFS; initial state:")
-        self.print_image()
+        if verbose:
+            print("Starting DFS; initial state:")
+            self.print_image()
 
         self.reset_visited()
         initial_color = self.vertices[start_index].color
         if initial_color == color:
-            return
+            return 0
 
+        recolored = 0
+        dirty = self.dirty
         stack = Stack()
         stack.push(self.vertices[start_index])
 
         while not stack.is_empty():
             current_vertex = stack.pop()
             if not current_vertex.visited and current_vertex.color == initial_color:
-                current_vertex.visit_and_set_color(color)
+                current_vertex.visit_and_set_color(color, verbose)
+                recolored += 1
+                if dirty is not None:
+                    dirty[(current_vertex.x, current_vertex.y)] = color
+                if progress is not None:
+                    progress.tick(self)
                 for neighbor_index in current_vertex.edges:
                     stack.push(self.vertices[neighbor_index])
 
-def create_graph(data):
+        if recolored:
+            self.colors_changed()
+        if progress is not None:
+            progress.finish(self)
+        return recolored
+
+    def multi_fill(self, seeds, color=None):
+        """
+        Bucket fills from many seed vertices in one breadth-first traversal.
+
+        All seeds are enqueued together and share one visited set, so the
+        vertices are reset once and every vertex is recolored at most once.
+        Each seed spreads over the vertices connected to it that share the
+        seed's original color. Where the regions of several seeds overlap, a
+        vertex takes the target color of the seed whose fill reaches it first
+        (the earlier seed on ties), so seeds with the same target color in
+        one region simply fill it together.
+
+        pre: seeds is either an iterable of valid vertex indices, all filled
+             with color, or a dictionary mapping vertex index to its target
+             color (color is then ignored).
+
+        post: returns the number of recolored vertices.
+        """
+        if isinstance(seeds, dict):
+            targets = list(seeds.items())
+        else:
+            if color is None:
+                raise ValueError("multi_fill needs a color for a list of seeds.")
+            targets = [(seed, color) for seed in seeds]
+
+        self.reset_visited()
+        queue = Queue()
+        for seed, target_color in targets:
+            initial_color = self.vertices[seed].color
+            if initial_color != target_color:
+                queue.enqueue((self.vertices[seed], initial_color, target_color))
+
+        recolored = 0
+        dirty = self.dirty
+        while not queue.is_empty():
+            current_vertex, initial_color, target_color = queue.dequeue()
+            if not current_vertex.visited and current_vertex.color == initial_color:
+                current_vertex.visit_and_set_color(target_color, False)
+                recolored += 1
+                if dirty is not None:
+                    dirty[(current_vertex.x, current_vertex.y)] = target_color
+                for neighbor_index in current_vertex.edges:
+                    neighbor = self.vertices[neighbor_index]
+                    if not neighbor.visited:
+                        queue.enqueue((neighbor, initial_color, target_color))
+        if recolored:
+            self.colors_changed()
+        return recolored
+
+def normalize_edges(num_vertices, from_indices, to_indices):
+    """
+    Builds sorted, deduplicated, undirected adjacency in CSR form in O(V + E).
+
+    Every input edge is expanded into both directions and self-loops are
+    discarded. The arcs are then counting sorted twice, first by target and
+    then (stably) by source, so every row comes out in ascending order and
+    duplicates end up next to each other where one linear pass removes them.
+
+    pre: from_indices and to_indices are equal-length sequences of vertex
+         indices in the range [0, num_vertices).
+
+    post: a tuple (offsets, targets, dropped) where the neighbors of vertex i
+          are targets[offsets[i]:offsets[i + 1]] and dropped is the number of
+          input edges that were self-loops or repeated an earlier edge in
+          either direction.
+    """
+    sources = []
+    dests = []
+    self_loops = 0
+    for from_index, to_index in zip(from_indices, to_indices):
+        if from_index == to_index:
+            self_loops += 1
+            continue
+        sources.append(from_index)
+        dests.append(to_index)
+        sources.append(to_index)
+        dests.append(from_index)
+
+    num_arcs = len(sources)
+
+    # Pass 1: counting sort the arcs by target.
+    counts = [0] * (num_vertices + 1)
+    for dest in dests:
+        counts[dest + 1] += 1
+    for i in range(num_vertices):
+        counts[i + 1] += counts[i]
+    by_dest = [0] * num_arcs
+    for arc in range(num_arcs):
+        dest = dests[arc]
+        by_dest[counts[dest]] = arc
+        counts[dest] += 1
+
+    # Pass 2: stable counting sort by source, giving rows sorted by target.
+    offsets = [0] * (num_vertices + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(num_vertices):
+        offsets[i + 1] += offsets[i]
+    cursor = offsets[:]
+    targets = [0] * num_arcs
+    for arc in by_dest:
+        source = sources[arc]
+        targets[cursor[source]] = dests[arc]
+        cursor[source] += 1
+
+    # Pass 3: drop repeated neighbors, compacting the rows in place.
+    write = 0
+    for vertex in range(num_vertices):
+        start, end = offsets[vertex], offsets[vertex + 1]
+        offsets[vertex] = write
+        previous = -1
+        for position in range(start, end):
+            target = targets[position]
+            if target != previous:
+                targets[write] = target
+                write += 1
+                previous = target
+    offsets[num_vertices] = write
+    del targets[write:]
+
+    dropped = self_loops + (num_arcs - write) // 2
+    return offsets, targets, dropped
+
+
+def validate_graph_data(
+    image_size, xs, ys, colors, from_indices, to_indices, start_index, color, height=None
+):
+    """
+    Checks parsed graph data in bulk before any vertex or edge is created.
+
+    Each check is a single pass over one of the parsed arrays, and the record
+    level loops only run for a check that has already found a problem, so
+    valid input costs a handful of linear scans.
+
+    pre: image_size is the image width and height is the image height, or
+         None for a square image_size x image_size image.
+         xs, ys and colors are equal-length lists describing the vertices,
+         from_indices and to_indices are equal-length lists describing the
+         edges, start_index is an int and color is the fill color.
+
+    post: raises GraphValidationError listing every bad record if any
+          coordinate is outside the image, two vertices share a coordinate,
+          a color is not in COLOR_DICT, an edge index is out of range or the
+          start index is out of range. Returns None otherwise.
+    """
+    errors = []
+    num_vertices = len(xs)
+    width = image_size
+    if height is None:
+        height = image_size
+
+    # Coordinates inside the image
+    if xs and (min(xs) < 0 or max(xs) >= width or min(ys) < 0 or max(ys) >= height):
+        for i in range(num_vertices):
+            if not (0 <= xs[i] < width and 0 <= ys[i] < height):
+                errors.append(
+                    f"vertex {i}: ({xs[i]}, {ys[i]}) is outside the "
+                    f"{width}x{height} image"
+                )
+
+    # Unique coordinates
+    if len(set(zip(xs, ys))) != num_vertices:
+        first_seen = {}
+        for i, key in enumerate(zip(xs, ys)):
+            if key in first_seen:
+                errors.append(
+                    f"vertex {i}: ({xs[i]}, {ys[i]}) duplicates vertex {first_seen[key]}"
+                )
+            else:
+                first_seen[key] = i
+
+    # Known colors
+    unknown = {name for name in set(colors) if name.lower() not in COLOR_DICT}
+    if unknown:
+        for i, name in enumerate(colors):
+            if name in unknown:
+                errors.append(f"vertex {i}: {name} is not a valid color")
+    if color.lower() not in COLOR_DICT:
+        errors.append(f"fill color: {color} is not a valid color")
+
+    # Edge indices in range
+    for indices in (from_indices, to_indices):
+        if indices and (min(indices) < 0 or max(indices) >= num_vertices):
+            for i, (from_index, to_index) in enumerate(zip(from_indices, to_indices)):
+                if not (0 <= from_index < num_vertices and 0 <= to_index < num_vertices):
+                    errors.append(
+                        f"edge {i}: ({from_index}, {to_index}) references a "
+                        f"vertex outside 0-{num_vertices - 1}"
+                    )
+            break
+
+    if not 0 <= start_index < num_vertices:
+        errors.append(f"start index: {start_index} is outside 0-{num_vertices - 1}")
+
+    if errors:
+        raise GraphValidationError(errors)
+
+
+def parse_image_size(line):
+    """
+    Parses the image size header line of an .in file.
+
+    pre: line is either a single number for a square image or a width and
+         height separated by a comma, whitespace or "x", e.g. "10000,200".
+
+    post: a tuple (width, height).
+    """
+    parts = line.replace(",", " ").replace("x", " ").split()
+    if len(parts) == 1:
+        size = int(parts[0])
+        return size, size
+    if len(parts) == 2:
+        return int(parts[0]), int(parts[1])
+    raise ValueError(f"Invalid image size line: {line!r}")
+
+
+def grid_graph(width, height, rows):
+    """
+    Builds an ImageGraph whose edges are the 4-neighbor grid of its pixels.
+
+    pre: rows yields height sequences of width color names each, top row
+         first; None marks a missing pixel. Rows are consumed one at a time,
+         so they may be streamed.
+
+    post: vertices are numbered in row-major order over non-missing pixels,
+          and each is connected to its non-missing neighbors above, below,
+          left and right.
+    """
+    graph = ImageGraph(width, height)
+    vertices = graph.vertices
+    above = [None] * width
+    for y, row in zip(range(height), rows):
+        current = [None] * width
+        left = None
+        for x in range(width):
+            color = row[x]
+            if color is None:
+                left = None
+                continue
+            index = len(vertices)
+            vertex = ColoredVertex(index, x, y, color)
+            for neighbor in (above[x], left):
+                if neighbor is not None:
+                    vertex.add_edge(neighbor)
+                    vertices[neighbor].add_edge(index)
+            current[x] = left = index
+            vertices.append(vertex)
+        above = current
+    return graph
+
+
+def create_graph(data, validate=False):
     """
     Creates a Graph object from the given input data and parses the starting
     position and search color.
 
-    pre: data is the entire inputted data as a single string.
+    pre: data is the entire inputted data as a single string. Its first line
+         is the image size: one number for a square image, or "width,height".
+         validate: Optional; when True the parsed data is checked with
+         validate_graph_data before the graph is built.
 
     post: a tuple containing the ImageGraph instance, the starting position,
           and the search color.
     """
 
     lines = data.strip().split("\n")
-    image_size = int(lines[0])
+    width, height = parse_image_size(lines[0])
     num_vertices = int(lines[1])
 
-    graph = ImageGraph(image_size)
-
-    # Create vertices
+    # Parse vertices
+    xs = [0] * num_vertices
+    ys = [0] * num_vertices
+    colors = [""] * num_vertices
     for i in range(num_vertices):
         x, y, color = lines[2 + i].split(",")
-        graph.vertices.append(ColoredVertex(i, int(x), int(y), color.strip()))
+        xs[i] = int(x)
+        ys[i] = int(y)
+        colors[i] = color.strip()
 
-    # Create edges
+    # Parse edges
     edge_start_line = 2 + num_vertices
     num_edges = int(lines[edge_start_line])
+    from_indices = [0] * num_edges
+    to_indices = [0] * num_edges
     for i in range(num_edges):
-        from_index, to_index = map(int, lines[edge_start_line + 1 + i].split(","))
-        graph.vertices[from_index].add_edge(to_index)
-        graph.vertices[to_index].add_edge(from_index)
+        from_index, to_index = lines[edge_start_line + 1 + i].split(",")
+        from_indices[i] = int(from_index)
+        to_indices[i] = int(to_index)
 
     # Parse starting index and color
     start_index, color = lines[-1].split(",")
-    return graph, int(start_index), color.strip()
+    start_index = int(start_index)
+    color = color.strip()
+
+    if validate:
+        validate_graph_data(
+            width, xs, ys, colors, from_indices, to_indices, start_index, color, height
+        )
+
+    graph = ImageGraph(width, height)
+
+    # Create vertices
+    for i in range(num_vertices):
+        graph.vertices.append(ColoredVertex(i, xs[i], ys[i], colors[i]))
+
+    # Create edges, dropping self-loops and duplicates
+    offsets, targets, graph.dropped_edges = normalize_edges(
+        num_vertices, from_indices, to_indices
+    )
+    for vertex in graph.vertices:
+        vertex.edges = targets[offsets[vertex.index] : offsets[vertex.index + 1]]
+
+    return graph, start_index, color
 
 
 def main():
@@ -445,12 +1364,12 @@ def main():
 
     # Create the graph, start index, and color
     graph, start_index, color = create_graph(data)
+    if graph.dropped_edges:
+        print(f"Dropped {graph.dropped_edges} duplicate or self-loop edges.")
 
     # Print adjacency matrix
-    adjacency_matrix = graph.create_adjacency_matrix()
     print("Adjacency Matrix:")
-    for row in adjacency_matrix:
-        print(row)
+    graph.write_adjacency_matrix(sys.stdout)
 
     # Perform BFS
     print("\nPerforming BFS:")
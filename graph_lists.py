@@ -1,629 +0,0 @@
-"""
-This module contains adjacency list representations of various graphs.
-This module is used for the test suite to check your code.
-
-Each graph is defined as a dictionary where:
-    - The key is the vertex ID (integer).
-    - The value is a tuple: (color, x-coordinate, y-coordinate, edges).
-    - `edges` is a list of integers representing connections to other vertices.
-
-"""
-
-# Chess Graph for chess.in
-chess_adj_list = {
-    0: ("blue", 0, 0, [1, 8]),
-    1: ("white", 1, 0, [0, 2, 9]),
-    2: ("blue", 2, 0, [1, 3, 10]),
-    3: ("white", 3, 0, [2, 4, 11]),
-    4: ("blue", 4, 0, [3, 5, 12]),
-    5: ("white", 5, 0, [4, 6, 13]),
-    6: ("blue", 6, 0, [5, 7, 14]),
-    7: ("white", 7, 0, [6, 15]),
-    8: ("white", 0, 1, [0, 9, 16]),
-    9: ("blue", 1, 1, [1, 8, 10, 17]),
-    10: ("white", 2, 1, [2, 9, 11, 18]),
-    11: ("blue", 3, 1, [3, 10, 12, 19]),
-    12: ("white", 4, 1, [4, 11, 13, 20]),
-    13: ("blue", 5, 1, [5, 12, 14, 21]),
-    14: ("white", 6, 1, [6, 13, 15, 22]),
-    15: ("blue", 7, 1, [7, 14, 23]),
-    16: ("blue", 0, 2, [8, 17, 24]),
-    17: ("white", 1, 2, [9, 16, 18, 25]),
-    18: ("blue", 2, 2, [10, 17, 19, 26]),
-    19: ("white", 3, 2, [11, 18, 20, 27]),
-    20: ("blue", 4, 2, [12, 19, 21, 28]),
-    21: ("white", 5, 2, [13, 20, 22, 29]),
-    22: ("blue", 6, 2, [14, 21, 23, 30]),
-    23: ("white", 7, 2, [15, 22, 31]),
-    24: ("white", 0, 3, [16, 25, 32]),
-    25: ("blue", 1, 3, [17, 24, 26, 33]),
-    26: ("white", 2, 3, [18, 25, 27, 34]),
-    27: ("blue", 3, 3, [19, 26, 28, 35]),
-    28: ("white", 4, 3, [20, 27, 29, 36]),
-    29: ("blue", 5, 3, [21, 28, 30, 37]),
-    30: ("white", 6, 3, [22, 29, 31, 38]),
-    31: ("blue", 7, 3, [23, 30, 39]),
-    32: ("blue", 0, 4, [24, 33, 40]),
-    33: ("white", 1, 4, [25, 32, 34, 41]),
-    34: ("blue", 2, 4, [26, 33, 35, 42]),
-    35: ("white", 3, 4, [27, 34, 36, 43]),
-    36: ("blue", 4, 4, [28, 35, 37, 44]),
-    37: ("white", 5, 4, [29, 36, 38, 45]),
-    38: ("blue", 6, 4, [30, 37, 39, 46]),
-    39: ("white", 7, 4, [31, 38, 47]),
-    40: ("white", 0, 5, [32, 41, 48]),
-    41: ("blue", 1, 5, [33, 40, 42, 49]),
-    42: ("white", 2, 5, [34, 41, 43, 50]),
-    43: ("blue", 3, 5, [35, 42, 44, 51]),
-    44: ("white", 4, 5, [36, 43, 45, 52]),
-    45: ("blue", 5, 5, [37, 44, 46, 53]),
-    46: ("white", 6, 5, [38, 45, 47, 54]),
-    47: ("blue", 7, 5, [39, 46, 55]),
-    48: ("blue", 0, 6, [40, 49, 56]),
-    49: ("white", 1, 6, [41, 48, 50, 57]),
-    50: ("blue", 2, 6, [42, 49, 51, 58]),
-    51: ("white", 3, 6, [43, 50, 52, 59]),
-    52: ("blue", 4, 6, [44, 51, 53, 60]),
-    53: ("white", 5, 6, [45, 52, 54, 61]),
-    54: ("blue", 6, 6, [46, 53, 55, 62]),
-    55: ("white", 7, 6, [47, 54, 63]),
-    56: ("white", 0, 7, [48, 57]),
-    57: ("blue", 1, 7, [49, 56, 58]),
-    58: ("white", 2, 7, [50, 57, 59]),
-    59: ("blue", 3, 7, [51, 58, 60]),
-    60: ("white", 4, 7, [52, 59, 61]),
-    61: ("blue", 5, 7, [53, 60, 62]),
-    62: ("white", 6, 7, [54, 61, 63]),
-    63: ("blue", 7, 7, [55, 62]),
-}
-
-# F1 Graph for f1.in
-f1_adj_list = {
-    0: ("cyan", 0, 0, [1, 16]),
-    1: ("cyan", 1, 0, [0, 2, 17]),
-    2: ("cyan", 2, 0, [1, 3, 18]),
-    3: ("cyan", 3, 0, [2, 4]),
-    4: ("cyan", 4, 0, [3, 5]),
-    5: ("cyan", 5, 0, [4, 6]),
-    6: ("cyan", 6, 0, [5, 7]),
-    7: ("cyan", 7, 0, [6, 8]),
-    8: ("cyan", 8, 0, [7, 9]),
-    9: ("cyan", 9, 0, [8, 10]),
-    10: ("cyan", 10, 0, [9, 11]),
-    11: ("cyan", 11, 0, [10, 12]),
-    12: ("cyan", 12, 0, [11, 13, 19]),
-    13: ("cyan", 13, 0, [12, 14, 20]),
-    14: ("cyan", 14, 0, [13, 15, 21]),
-    15: ("cyan", 15, 0, [14, 22]),
-    16: ("cyan", 0, 1, [0, 17, 23]),
-    17: ("cyan", 1, 1, [1, 16, 18, 24]),
-    18: ("cyan", 2, 1, [2, 17]),
-    19: ("cyan", 12, 1, [12, 20]),
-    20: ("cyan", 13, 1, [13, 19, 21]),
-    21: ("cyan", 14, 1, [14, 20, 22, 29]),
-    22: ("cyan", 15, 1, [15, 21, 30]),
-    23: ("cyan", 0, 2, [16, 24, 31]),
-    24: ("cyan", 1, 2, [17, 23, 32]),
-    25: ("yellow", 6, 2, [26, 36]),
-    26: ("yellow", 7, 2, [25, 27, 37]),
-    27: ("yellow", 8, 2, [26, 28, 38]),
-    28: ("yellow", 9, 2, [27, 39]),
-    29: ("cyan", 14, 2, [21, 30, 40]),
-    30: ("cyan", 15, 2, [22, 29, 41]),
-    31: ("cyan", 0, 3, [23, 32, 42]),
-    32: ("cyan", 1, 3, [24, 31, 43]),
-    33: ("yellow", 3, 3, [34, 45]),
-    34: ("yellow", 4, 3, [33, 35, 46]),
-    35: ("yellow", 5, 3, [34, 36, 47]),
-    36: ("yellow", 6, 3, [25, 35, 37, 48]),
-    37: ("yellow", 7, 3, [26, 36, 38, 49]),
-    38: ("yellow", 8, 3, [27, 37, 39, 50]),
-    39: ("yellow", 9, 3, [28, 38, 51]),
-    40: ("cyan", 14, 3, [29, 41, 54]),
-    41: ("cyan", 15, 3, [30, 40, 55]),
-    42: ("cyan", 0, 4, [31, 43, 56]),
-    43: ("cyan", 1, 4, [32, 42, 44, 57]),
-    44: ("yellow", 2, 4, [43, 45, 58]),
-    45: ("yellow", 3, 4, [33, 44, 46, 59]),
-    46: ("yellow", 4, 4, [34, 45, 47, 60]),
-    47: ("yellow", 5, 4, [35, 46, 48, 61]),
-    48: ("yellow", 6, 4, [36, 47, 49, 62]),
-    49: ("yellow", 7, 4, [37, 48, 50, 63]),
-    50: ("yellow", 8, 4, [38, 49, 51, 64]),
-    51: ("yellow", 9, 4, [39, 50, 52, 65]),
-    52: ("yellow", 10, 4, [51, 53, 66]),
-    53: ("yellow", 11, 4, [52, 67]),
-    54: ("cyan", 14, 4, [40, 55, 68]),
-    55: ("cyan", 15, 4, [41, 54, 69]),
-    56: ("cyan", 0, 5, [42, 57, 70]),
-    57: ("cyan", 1, 5, [43, 56, 58, 71]),
-    58: ("yellow", 2, 5, [44, 57, 59, 72]),
-    59: ("yellow", 3, 5, [45, 58, 60, 73]),
-    60: ("blue", 4, 5, [46, 59, 61]),
-    61: ("blue", 5, 5, [47, 60, 62]),
-    62: ("yellow", 6, 5, [48, 61, 63, 74]),
-    63: ("yellow", 7, 5, [49, 62, 64, 75]),
-    64: ("blue", 8, 5, [50, 63, 65]),
-    65: ("blue", 9, 5, [51, 64, 66]),
-    66: ("yellow", 10, 5, [52, 65, 67, 76]),
-    67: ("yellow", 11, 5, [53, 66, 77]),
-    68: ("cyan", 14, 5, [54, 69, 80]),
-    69: ("cyan", 15, 5, [55, 68, 81]),
-    70: ("cyan", 0, 6, [56, 71, 82]),
-    71: ("cyan", 1, 6, [57, 70, 72, 83]),
-    72: ("blue", 2, 6, [58, 71, 73, 84]),
-    73: ("blue", 3, 6, [59, 72]),
-    74: ("blue", 6, 6, [62, 75, 85]),
-    75: ("blue", 7, 6, [63, 74]),
-    76: ("blue", 10, 6, [66, 77, 86]),
-    77: ("blue", 11, 6, [67, 76, 78, 87]),
-    78: ("blue", 12, 6, [77, 79, 88]),
-    79: ("blue", 13, 6, [78, 80]),
-    80: ("yellow", 14, 6, [68, 79, 81, 89]),
-    81: ("cyan", 15, 6, [69, 80, 90]),
-    82: ("cyan", 0, 7, [70, 83, 91]),
-    83: ("cyan", 1, 7, [71, 82, 84, 92]),
-    84: ("blue", 2, 7, [72, 83, 93]),
-    85: ("blue", 6, 7, [74, 97]),
-    86: ("yellow", 10, 7, [76, 87, 101]),
-    87: ("yellow", 11, 7, [77, 86, 88, 102]),
-    88: ("yellow", 12, 7, [78, 87, 103]),
-    89: ("yellow", 14, 7, [80, 90, 104]),
-    90: ("cyan", 15, 7, [81, 89, 105]),
-    91: ("cyan", 0, 8, [82, 92, 106]),
-    92: ("cyan", 1, 8, [83, 91, 93, 107]),
-    93: ("yellow", 2, 8, [84, 92, 94, 108]),
-    94: ("blue", 3, 8, [93, 95, 109]),
-    95: ("blue", 4, 8, [94, 96, 110]),
-    96: ("blue", 5, 8, [95, 97, 111]),
-    97: ("yellow", 6, 8, [85, 96, 98]),
-    98: ("blue", 7, 8, [97, 99, 112]),
-    99: ("blue", 8, 8, [98, 100, 113]),
-    100: ("blue", 9, 8, [99, 101, 114]),
-    101: ("yellow", 10, 8, [86, 100, 102, 115]),
-    102: ("yellow", 11, 8, [87, 101, 103, 116]),
-    103: ("yellow", 12, 8, [88, 102, 117]),
-    104: ("yellow", 14, 8, [89, 105, 119]),
-    105: ("cyan", 15, 8, [90, 104, 120]),
-    106: ("cyan", 0, 9, [91, 107, 121]),
-    107: ("cyan", 1, 9, [92, 106, 108, 122]),
-    108: ("yellow", 2, 9, [93, 107, 109]),
-    109: ("yellow", 3, 9, [94, 108, 110, 123]),
-    110: ("yellow", 4, 9, [95, 109, 111, 124]),
-    111: ("yellow", 5, 9, [96, 110, 125]),
-    112: ("yellow", 7, 9, [98, 113]),
-    113: ("yellow", 8, 9, [99, 112, 114, 126]),
-    114: ("yellow", 9, 9, [100, 113, 115, 127]),
-    115: ("yellow", 10, 9, [101, 114, 116, 128]),
-    116: ("yellow", 11, 9, [102, 115, 117, 129]),
-    117: ("yellow", 12, 9, [103, 116, 118]),
-    118: ("yellow", 13, 9, [117, 119, 130]),
-    119: ("yellow", 14, 9, [104, 118, 120, 131]),
-    120: ("cyan", 15, 9, [105, 119, 132]),
-    121: ("cyan", 0, 10, [106, 122, 133]),
-    122: ("cyan", 1, 10, [107, 121, 134]),
-    123: ("yellow", 3, 10, [109, 124]),
-    124: ("yellow", 4, 10, [110, 123, 125, 135]),
-    125: ("yellow", 5, 10, [111, 124, 136]),
-    126: ("yellow", 8, 10, [113, 127, 139]),
-    127: ("yellow", 9, 10, [114, 126, 128, 140]),
-    128: ("yellow", 10, 10, [115, 127, 129, 141]),
-    129: ("yellow", 11, 10, [116, 128]),
-    130: ("yellow", 13, 10, [118, 131, 142]),
-    131: ("cyan", 14, 10, [119, 130, 132, 143]),
-    132: ("cyan", 15, 10, [120, 131, 144]),
-    133: ("cyan", 0, 11, [121, 134, 145]),
-    134: ("cyan", 1, 11, [122, 133, 146]),
-    135: ("yellow", 4, 11, [124, 136]),
-    136: ("yellow", 5, 11, [125, 135, 137, 148]),
-    137: ("yellow", 6, 11, [136, 138, 149]),
-    138: ("yellow", 7, 11, [137, 139, 150]),
-    139: ("yellow", 8, 11, [126, 138, 140, 151]),
-    140: ("yellow", 9, 11, [127, 139, 141, 152]),
-    141: ("yellow", 10, 11, [128, 140, 153]),
-    142: ("yellow", 13, 11, [130, 143, 154]),
-    143: ("cyan", 14, 11, [131, 142, 144, 155]),
-    144: ("cyan", 15, 11, [132, 143, 156]),
-    145: ("cyan", 0, 12, [133, 146, 157]),
-    146: ("cyan", 1, 12, [134, 145, 147, 158]),
-    147: ("cyan", 2, 12, [146, 159]),
-    148: ("yellow", 5, 12, [136, 149, 161]),
-    149: ("red", 6, 12, [137, 148, 150]),
-    150: ("red", 7, 12, [138, 149, 151]),
-    151: ("red", 8, 12, [139, 150, 152]),
-    152: ("yellow", 9, 12, [140, 151, 153, 162]),
-    153: ("yellow", 10, 12, [141, 152]),
-    154: ("yellow", 13, 12, [142, 155, 163]),
-    155: ("cyan", 14, 12, [143, 154, 156, 164]),
-    156: ("cyan", 15, 12, [144, 155, 165]),
-    157: ("white", 0, 13, [145, 158, 166]),
-    158: ("white", 1, 13, [146, 157, 159, 167]),
-    159: ("white", 2, 13, [147, 158, 160, 168]),
-    160: ("white", 3, 13, [159, 169]),
-    161: ("yellow", 5, 13, [148]),
-    162: ("yellow", 9, 13, [152]),
-    163: ("yellow", 13, 13, [154, 164, 173]),
-    164: ("white", 14, 13, [155, 163, 165, 174]),
-    165: ("white", 15, 13, [156, 164, 175]),
-    166: ("white", 0, 14, [157, 167, 176]),
-    167: ("white", 1, 14, [158, 166, 168, 177]),
-    168: ("white", 2, 14, [159, 167, 169, 178]),
-    169: ("white", 3, 14, [160, 168, 170, 179]),
-    170: ("white", 4, 14, [169, 180]),
-    171: ("yellow", 11, 14, [172, 183]),
-    172: ("yellow", 12, 14, [171, 173, 184]),
-    173: ("yellow", 13, 14, [163, 172, 174, 185]),
-    174: ("yellow", 14, 14, [164, 173, 175, 186]),
-    175: ("white", 15, 14, [165, 174, 187]),
-    176: ("white", 0, 15, [166, 177]),
-    177: ("white", 1, 15, [167, 176, 178]),
-    178: ("white", 2, 15, [168, 177, 179]),
-    179: ("white", 3, 15, [169, 178, 180]),
-    180: ("white", 4, 15, [170, 179, 181]),
-    181: ("white", 5, 15, [180]),
-    182: ("yellow", 10, 15, [183]),
-    183: ("yellow", 11, 15, [171, 182, 184]),
-    184: ("yellow", 12, 15, [172, 183, 185]),
-    185: ("yellow", 13, 15, [173, 184, 186]),
-    186: ("yellow", 14, 15, [174, 185, 187]),
-    187: ("yellow", 15, 15, [175, 186]),
-}
-
-# Flags Graph for flags.in
-flags_adj_list = {
-    0: ("blue", 0, 0, [1, 6]),
-    1: ("blue", 1, 0, [0, 2, 7]),
-    2: ("red", 2, 0, [1, 3, 8]),
-    3: ("red", 3, 0, [2, 4, 9]),
-    4: ("green", 4, 0, [3, 5, 10]),
-    5: ("green", 5, 0, [4, 11]),
-    6: ("blue", 0, 1, [0, 7, 12]),
-    7: ("blue", 1, 1, [1, 6, 8, 13]),
-    8: ("red", 2, 1, [2, 7, 9, 14]),
-    9: ("red", 3, 1, [3, 8, 10, 15]),
-    10: ("green", 4, 1, [4, 9, 11, 16]),
-    11: ("green", 5, 1, [5, 10, 17]),
-    12: ("blue", 0, 2, [6, 13]),
-    13: ("blue", 1, 2, [7, 12, 14]),
-    14: ("red", 2, 2, [8, 13, 15]),
-    15: ("red", 3, 2, [9, 14, 16]),
-    16: ("green", 4, 2, [10, 15, 17]),
-    17: ("green", 5, 2, [11, 16, 18]),
-    18: ("green", 5, 3, [17, 24]),
-    19: ("green", 0, 4, [20, 25]),
-    20: ("green", 1, 4, [19, 21, 26]),
-    21: ("green", 2, 4, [20, 22, 27]),
-    22: ("green", 3, 4, [21, 23, 28]),
-    23: ("green", 4, 4, [22, 24, 29]),
-    24: ("green", 5, 4, [18, 23]),
-    25: ("yellow", 0, 5, [19, 26]),
-    26: ("yellow", 1, 5, [20, 25, 27]),
-    27: ("yellow", 2, 5, [21, 26, 28]),
-    28: ("yellow", 3, 5, [22, 27, 29]),
-    29: ("yellow", 4, 5, [23, 28]),
-}
-
-# Heart Graph for heart.in
-heart_adj_list = {
-    0: ("blue", 0, 0, [1, 9]),
-    1: ("blue", 1, 0, [0, 2, 10]),
-    2: ("blue", 2, 0, [1, 3, 11]),
-    3: ("blue", 3, 0, [2, 4, 12]),
-    4: ("blue", 4, 0, [3, 5, 13]),
-    5: ("blue", 5, 0, [4, 6, 14]),
-    6: ("blue", 6, 0, [5, 7, 15]),
-    7: ("blue", 7, 0, [6, 8, 16]),
-    8: ("blue", 8, 0, [7, 17]),
-    9: ("blue", 0, 1, [0, 10, 18]),
-    10: ("red", 1, 1, [1, 9, 11, 19]),
-    11: ("red", 2, 1, [2, 10, 12, 20]),
-    12: ("blue", 3, 1, [3, 11, 13, 21]),
-    13: ("blue", 4, 1, [4, 12, 14, 22]),
-    14: ("blue", 5, 1, [5, 13, 15, 23]),
-    15: ("red", 6, 1, [6, 14, 16, 24]),
-    16: ("red", 7, 1, [7, 15, 17, 25]),
-    17: ("blue", 8, 1, [8, 16, 26]),
-    18: ("red", 0, 2, [9, 19, 27]),
-    19: ("red", 1, 2, [10, 18, 20, 28]),
-    20: ("red", 2, 2, [11, 19, 21, 29]),
-    21: ("red", 3, 2, [12, 20, 22, 30]),
-    22: ("blue", 4, 2, [13, 21, 23, 31]),
-    23: ("red", 5, 2, [14, 22, 24, 32]),
-    24: ("red", 6, 2, [15, 23, 25, 33]),
-    25: ("red", 7, 2, [16, 24, 26, 34]),
-    26: ("red", 8, 2, [17, 25, 35]),
-    27: ("red", 0, 3, [18, 28, 36]),
-    28: ("red", 1, 3, [19, 27, 29, 37]),
-    29: ("red", 2, 3, [20, 28, 30, 38]),
-    30: ("red", 3, 3, [21, 29, 31, 39]),
-    31: ("red", 4, 3, [22, 30, 32, 40]),
-    32: ("red", 5, 3, [23, 31, 33, 41]),
-    33: ("red", 6, 3, [24, 32, 34, 42]),
-    34: ("red", 7, 3, [25, 33, 35, 43]),
-    35: ("red", 8, 3, [26, 34, 44]),
-    36: ("yellow", 0, 4, [27, 37, 45]),
-    37: ("red", 1, 4, [28, 36, 38, 46]),
-    38: ("red", 2, 4, [29, 37, 39, 47]),
-    39: ("red", 3, 4, [30, 38, 40, 48]),
-    40: ("red", 4, 4, [31, 39, 41, 49]),
-    41: ("red", 5, 4, [32, 40, 42, 50]),
-    42: ("red", 6, 4, [33, 41, 43, 51]),
-    43: ("red", 7, 4, [34, 42, 44, 52]),
-    44: ("yellow", 8, 4, [35, 43, 53]),
-    45: ("yellow", 0, 5, [36, 46, 54]),
-    46: ("yellow", 1, 5, [37, 45, 47, 55]),
-    47: ("red", 2, 5, [38, 46, 48, 56]),
-    48: ("red", 3, 5, [39, 47, 49, 57]),
-    49: ("red", 4, 5, [40, 48, 50, 58]),
-    50: ("red", 5, 5, [41, 49, 51, 59]),
-    51: ("red", 6, 5, [42, 50, 52, 60]),
-    52: ("yellow", 7, 5, [43, 51, 53, 61]),
-    53: ("yellow", 8, 5, [44, 52, 62]),
-    54: ("yellow", 0, 6, [45, 55, 63]),
-    55: ("yellow", 1, 6, [46, 54, 56, 64]),
-    56: ("yellow", 2, 6, [47, 55, 57, 65]),
-    57: ("red", 3, 6, [48, 56, 58, 66]),
-    58: ("red", 4, 6, [49, 57, 59, 67]),
-    59: ("red", 5, 6, [50, 58, 60, 68]),
-    60: ("yellow", 6, 6, [51, 59, 61, 69]),
-    61: ("yellow", 7, 6, [52, 60, 62, 70]),
-    62: ("yellow", 8, 6, [53, 61, 71]),
-    63: ("yellow", 0, 7, [54, 64, 72]),
-    64: ("yellow", 1, 7, [55, 63, 65, 73]),
-    65: ("yellow", 2, 7, [56, 64, 66, 74]),
-    66: ("yellow", 3, 7, [57, 65, 67, 75]),
-    67: ("red", 4, 7, [58, 66, 68, 76]),
-    68: ("yellow", 5, 7, [59, 67, 69, 77]),
-    69: ("yellow", 6, 7, [60, 68, 70, 78]),
-    70: ("yellow", 7, 7, [61, 69, 71, 79]),
-    71: ("yellow", 8, 7, [62, 70, 80]),
-    72: ("yellow", 0, 8, [63, 73]),
-    73: ("yellow", 1, 8, [64, 72, 74]),
-    74: ("yellow", 2, 8, [65, 73, 75]),
-    75: ("yellow", 3, 8, [66, 74, 76]),
-    76: ("yellow", 4, 8, [67, 75, 77]),
-    77: ("yellow", 5, 8, [68, 76, 78]),
-    78: ("yellow", 6, 8, [69, 77, 79]),
-    79: ("yellow", 7, 8, [70, 78, 80]),
-    80: ("yellow", 8, 8, [71, 79]),
-}
-
-# Horns Graph for horns.in
-horns_adj_list = {
-    0: ("red", 0, 0, [1, 16]),
-    1: ("yellow", 1, 0, [0, 2, 17]),
-    2: ("red", 2, 0, [1, 3, 18]),
-    3: ("yellow", 3, 0, [2, 4, 19]),
-    4: ("red", 4, 0, [3, 5, 20]),
-    5: ("yellow", 5, 0, [4, 6, 21]),
-    6: ("red", 6, 0, [5, 7, 22]),
-    7: ("yellow", 7, 0, [6, 8, 23]),
-    8: ("red", 8, 0, [7, 9, 24]),
-    9: ("yellow", 9, 0, [8, 10, 25]),
-    10: ("red", 10, 0, [9, 11, 26]),
-    11: ("yellow", 11, 0, [10, 12, 27]),
-    12: ("red", 12, 0, [11, 13, 28]),
-    13: ("yellow", 13, 0, [12, 14, 29]),
-    14: ("red", 14, 0, [13, 15, 30]),
-    15: ("yellow", 15, 0, [14, 31]),
-    16: ("yellow", 0, 1, [0, 17, 32]),
-    17: ("red", 1, 1, [1, 16, 18, 33]),
-    18: ("yellow", 2, 1, [2, 17, 19, 34]),
-    19: ("red", 3, 1, [3, 18, 20, 35]),
-    20: ("yellow", 4, 1, [4, 19, 21, 36]),
-    21: ("red", 5, 1, [5, 20, 22, 37]),
-    22: ("yellow", 6, 1, [6, 21, 23, 38]),
-    23: ("red", 7, 1, [7, 22, 24, 39]),
-    24: ("yellow", 8, 1, [8, 23, 25, 40]),
-    25: ("red", 9, 1, [9, 24, 26, 41]),
-    26: ("yellow", 10, 1, [10, 25, 27, 42]),
-    27: ("red", 11, 1, [11, 26, 28, 43]),
-    28: ("yellow", 12, 1, [12, 27, 29, 44]),
-    29: ("red", 13, 1, [13, 28, 30, 45]),
-    30: ("yellow", 14, 1, [14, 29, 31, 46]),
-    31: ("red", 15, 1, [15, 30, 47]),
-    32: ("red", 0, 2, [16, 33]),
-    33: ("yellow", 1, 2, [17, 32, 34]),
-    34: ("red", 2, 2, [18, 33, 35]),
-    35: ("yellow", 3, 2, [19, 34, 36]),
-    36: ("red", 4, 2, [20, 35, 37, 48]),
-    37: ("yellow", 5, 2, [21, 36, 38, 49]),
-    38: ("red", 6, 2, [22, 37, 39, 50]),
-    39: ("yellow", 7, 2, [23, 38, 40, 51]),
-    40: ("red", 8, 2, [24, 39, 41, 52]),
-    41: ("yellow", 9, 2, [25, 40, 42, 53]),
-    42: ("red", 10, 2, [26, 41, 43, 54]),
-    43: ("yellow", 11, 2, [27, 42, 44, 55]),
-    44: ("red", 12, 2, [28, 43, 45]),
-    45: ("yellow", 13, 2, [29, 44, 46]),
-    46: ("red", 14, 2, [30, 45, 47]),
-    47: ("yellow", 15, 2, [31, 46]),
-    48: ("yellow", 4, 3, [36, 49]),
-    49: ("red", 5, 3, [37, 48, 50, 60]),
-    50: ("yellow", 6, 3, [38, 49, 51, 61]),
-    51: ("red", 7, 3, [39, 50, 52]),
-    52: ("yellow", 8, 3, [40, 51, 53]),
-    53: ("red", 9, 3, [41, 52, 54, 62]),
-    54: ("yellow", 10, 3, [42, 53, 55, 63]),
-    55: ("red", 11, 3, [43, 54]),
-    56: ("white", 0, 4, [57]),
-    57: ("white", 1, 4, [56, 58]),
-    58: ("white", 2, 4, [57, 59]),
-    59: ("white", 3, 4, [58, 68]),
-    60: ("yellow", 5, 4, [49, 61]),
-    61: ("red", 6, 4, [50, 60]),
-    62: ("yellow", 9, 4, [53, 63]),
-    63: ("red", 10, 4, [54, 62]),
-    64: ("white", 12, 4, [65, 73]),
-    65: ("white", 13, 4, [64, 66]),
-    66: ("white", 14, 4, [65, 67]),
-    67: ("white", 15, 4, [66]),
-    68: ("white", 3, 5, [59, 69]),
-    69: ("white", 4, 5, [68, 76]),
-    70: ("white", 7, 5, [71, 79]),
-    71: ("white", 8, 5, [70, 80]),
-    72: ("white", 11, 5, [73, 83]),
-    73: ("white", 12, 5, [64, 72]),
-    74: ("yellow", 0, 6, [75, 86]),
-    75: ("red", 1, 6, [74, 87]),
-    76: ("white", 4, 6, [69, 77, 89]),
-    77: ("white", 5, 6, [76, 78, 90]),
-    78: ("white", 6, 6, [77, 79, 91]),
-    79: ("white", 7, 6, [70, 78, 80, 92]),
-    80: ("white", 8, 6, [71, 79, 81, 93]),
-    81: ("white", 9, 6, [80, 82, 94]),
-    82: ("white", 10, 6, [81, 83, 95]),
-    83: ("white", 11, 6, [72, 82, 96]),
-    84: ("yellow", 14, 6, [85, 98]),
-    85: ("red", 15, 6, [84, 99]),
-    86: ("red", 0, 7, [74, 87, 100]),
-    87: ("yellow", 1, 7, [75, 86, 88, 101]),
-    88: ("red", 2, 7, [87, 102]),
-    89: ("white", 4, 7, [76, 90]),
-    90: ("white", 5, 7, [77, 89, 91]),
-    91: ("white", 6, 7, [78, 90, 92, 104]),
-    92: ("white", 7, 7, [79, 91, 93, 105]),
-    93: ("white", 8, 7, [80, 92, 94, 106]),
-    94: ("white", 9, 7, [81, 93, 95, 107]),
-    95: ("white", 10, 7, [82, 94, 96]),
-    96: ("white", 11, 7, [83, 95]),
-    97: ("yellow", 13, 7, [98, 109]),
-    98: ("red", 14, 7, [84, 97, 99, 110]),
-    99: ("yellow", 15, 7, [85, 98, 111]),
-    100: ("yellow", 0, 8, [86, 101, 112]),
-    101: ("red", 1, 8, [87, 100, 102, 113]),
-    102: ("yellow", 2, 8, [88, 101, 103, 114]),
-    103: ("red", 3, 8, [102, 115]),
-    104: ("white", 6, 8, [91, 105, 117]),
-    105: ("white", 7, 8, [92, 104, 106, 118]),
-    106: ("white", 8, 8, [93, 105, 107, 119]),
-    107: ("white", 9, 8, [94, 106, 120]),
-    108: ("yellow", 12, 8, [109, 122]),
-    109: ("red", 13, 8, [97, 108, 110, 123]),
-    110: ("yellow", 14, 8, [98, 109, 111, 124]),
-    111: ("red", 15, 8, [99, 110, 125]),
-    112: ("red", 0, 9, [100, 113, 126]),
-    113: ("yellow", 1, 9, [101, 112, 114, 127]),
-    114: ("red", 2, 9, [102, 113, 115, 128]),
-    115: ("yellow", 3, 9, [103, 114, 116, 129]),
-    116: ("red", 4, 9, [115, 130]),
-    117: ("white", 6, 9, [104, 118]),
-    118: ("white", 7, 9, [105, 117, 119, 132]),
-    119: ("white", 8, 9, [106, 118, 120, 133]),
-    120: ("white", 9, 9, [107, 119]),
-    121: ("yellow", 11, 9, [122, 135]),
-    122: ("red", 12, 9, [108, 121, 123, 136]),
-    123: ("yellow", 13, 9, [109, 122, 124, 137]),
-    124: ("red", 14, 9, [110, 123, 125, 138]),
-    125: ("yellow", 15, 9, [111, 124, 139]),
-    126: ("yellow", 0, 10, [112, 127, 140]),
-    127: ("red", 1, 10, [113, 126, 128, 141]),
-    128: ("yellow", 2, 10, [114, 127, 129, 142]),
-    129: ("red", 3, 10, [115, 128, 130, 143]),
-    130: ("yellow", 4, 10, [116, 129, 131, 144]),
-    131: ("red", 5, 10, [130, 145]),
-    132: ("white", 7, 10, [118, 133, 146]),
-    133: ("white", 8, 10, [119, 132, 147]),
-    134: ("yellow", 10, 10, [135, 148]),
-    135: ("red", 11, 10, [121, 134, 136, 149]),
-    136: ("yellow", 12, 10, [122, 135, 137, 150]),
-    137: ("red", 13, 10, [123, 136, 138, 151]),
-    138: ("yellow", 14, 10, [124, 137, 139, 152]),
-    139: ("red", 15, 10, [125, 138, 153]),
-    140: ("red", 0, 11, [126, 141, 154]),
-    141: ("yellow", 1, 11, [127, 140, 142, 155]),
-    142: ("red", 2, 11, [128, 141, 143, 156]),
-    143: ("yellow", 3, 11, [129, 142, 144, 157]),
-    144: ("red", 4, 11, [130, 143, 145, 158]),
-    145: ("yellow", 5, 11, [131, 144, 159]),
-    146: ("white", 7, 11, [132, 147]),
-    147: ("white", 8, 11, [133, 146]),
-    148: ("red", 10, 11, [134, 149, 162]),
-    149: ("yellow", 11, 11, [135, 148, 150, 163]),
-    150: ("red", 12, 11, [136, 149, 151, 164]),
-    151: ("yellow", 13, 11, [137, 150, 152, 165]),
-    152: ("red", 14, 11, [138, 151, 153, 166]),
-    153: ("yellow", 15, 11, [139, 152, 167]),
-    154: ("yellow", 0, 12, [140, 155, 168]),
-    155: ("red", 1, 12, [141, 154, 156, 169]),
-    156: ("yellow", 2, 12, [142, 155, 157, 170]),
-    157: ("red", 3, 12, [143, 156, 158, 171]),
-    158: ("yellow", 4, 12, [144, 157, 159, 172]),
-    159: ("red", 5, 12, [145, 158, 160, 173]),
-    160: ("yellow", 6, 12, [159, 174]),
-    161: ("red", 9, 12, [162, 177]),
-    162: ("yellow", 10, 12, [148, 161, 163, 178]),
-    163: ("red", 11, 12, [149, 162, 164, 179]),
-    164: ("yellow", 12, 12, [150, 163, 165, 180]),
-    165: ("red", 13, 12, [151, 164, 166, 181]),
-    166: ("yellow", 14, 12, [152, 165, 167, 182]),
-    167: ("red", 15, 12, [153, 166, 183]),
-    168: ("red", 0, 13, [154, 169, 184]),
-    169: ("yellow", 1, 13, [155, 168, 170, 185]),
-    170: ("red", 2, 13, [156, 169, 171, 186]),
-    171: ("yellow", 3, 13, [157, 170, 172, 187]),
-    172: ("red", 4, 13, [158, 171, 173, 188]),
-    173: ("yellow", 5, 13, [159, 172, 174, 189]),
-    174: ("red", 6, 13, [160, 173, 175, 190]),
-    175: ("yellow", 7, 13, [174, 176, 191]),
-    176: ("red", 8, 13, [175, 177, 192]),
-    177: ("yellow", 9, 13, [161, 176, 178, 193]),
-    178: ("red", 10, 13, [162, 177, 179, 194]),
-    179: ("yellow", 11, 13, [163, 178, 180, 195]),
-    180: ("red", 12, 13, [164, 179, 181, 196]),
-    181: ("yellow", 13, 13, [165, 180, 182, 197]),
-    182: ("red", 14, 13, [166, 181, 183, 198]),
-    183: ("yellow", 15, 13, [167, 182, 199]),
-    184: ("yellow", 0, 14, [168, 185, 200]),
-    185: ("red", 1, 14, [169, 184, 186, 201]),
-    186: ("yellow", 2, 14, [170, 185, 187, 202]),
-    187: ("red", 3, 14, [171, 186, 188, 203]),
-    188: ("yellow", 4, 14, [172, 187, 189, 204]),
-    189: ("red", 5, 14, [173, 188, 190, 205]),
-    190: ("yellow", 6, 14, [174, 189, 191, 206]),
-    191: ("red", 7, 14, [175, 190, 192, 207]),
-    192: ("yellow", 8, 14, [176, 191, 193, 208]),
-    193: ("red", 9, 14, [177, 192, 194, 209]),
-    194: ("yellow", 10, 14, [178, 193, 195, 210]),
-    195: ("red", 11, 14, [179, 194, 196, 211]),
-    196: ("yellow", 12, 14, [180, 195, 197, 212]),
-    197: ("red", 13, 14, [181, 196, 198, 213]),
-    198: ("yellow", 14, 14, [182, 197, 199, 214]),
-    199: ("red", 15, 14, [183, 198, 215]),
-    200: ("red", 0, 15, [184, 201]),
-    201: ("yellow", 1, 15, [185, 200, 202]),
-    202: ("red", 2, 15, [186, 201, 203]),
-    203: ("yellow", 3, 15, [187, 202, 204]),
-    204: ("red", 4, 15, [188, 203, 205]),
-    205: ("yellow", 5, 15, [189, 204, 206]),
-    206: ("red", 6, 15, [190, 205, 207]),
-    207: ("yellow", 7, 15, [191, 206, 208]),
-    208: ("red", 8, 15, [192, 207, 209]),
-    209: ("yellow", 9, 15, [193, 208, 210]),
-    210: ("red", 10, 15, [194, 209, 211]),
-    211: ("yellow", 11, 15, [195, 210, 212]),
-    212: ("red", 12, 15, [196, 211, 213]),
-    213: ("yellow", 13, 15, [197, 212, 214]),
-    214: ("red", 14, 15, [198, 213, 215]),
-    215: ("yellow", 15, 15, [199, 214]),
-}
-
-# Small Graph for small.in
-small_adj_list = {
-    0: ("red", 1, 1, [1]),
-    1: ("red", 2, 1, [0, 2, 3]),
-    2: ("red", 3, 1, [1, 4]),
-    3: ("red", 2, 2, [1, 4]),
-    4: ("red", 3, 2, [2, 3]),
-}
-
-
-# Dictionary of all graphs adjacency list for easy access and comparison
-all_lists_dict = {
-    "chess": chess_adj_list,
-    "f1": f1_adj_list,
-    "flags": flags_adj_list,
-    "heart": heart_adj_list,
-    "horns": horns_adj_list,
-    "small": small_adj_list,
-}
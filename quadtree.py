@@ -0,0 +1,259 @@
+"""
+Quadtree-compressed color storage.
+
+A QuadTreeColorStore covers the image with a square of power-of-two side and
+splits it into quadrants only where the colors differ, so uniform areas and
+missing pixels (None) are single leaves however large they are. Neighboring
+pixels are the 4-neighbor grid, as in tiled.TiledColorStore. A bucket fill
+walks from leaf to leaf along their shared borders, so its cost grows with
+the number of leaves around the region rather than with its area.
+
+A node is either a leaf, the color name of its whole square (None for
+missing pixels), or a list of four child nodes in the order top-left,
+top-right, bottom-left, bottom-right.
+"""
+
+from graph import COLOR_DICT, grid_graph
+
+
+def _validate_color(color):
+    name = color.strip().lower()
+    if name not in COLOR_DICT:
+        raise ValueError(color + " is not a valid color!")
+    return name
+
+
+def _build(pixels, x, y, size, width, height):
+    """Build the node for a square of a padded pixel array, collapsing leaves."""
+    if size == 1:
+        if x < width and y < height:
+            return pixels[y][x]
+        return None
+    half = size // 2
+    children = [
+        _build(pixels, x, y, half, width, height),
+        _build(pixels, x + half, y, half, width, height),
+        _build(pixels, x, y + half, half, width, height),
+        _build(pixels, x + half, y + half, half, width, height),
+    ]
+    return _collapse(children)
+
+
+def _uniform(x, y, size, width, height, color):
+    """Build the node for a square of an image that is color everywhere."""
+    if x + size <= width and y + size <= height:
+        return color
+    if x >= width or y >= height:
+        return None
+    half = size // 2
+    return [
+        _uniform(x, y, half, width, height, color),
+        _uniform(x + half, y, half, width, height, color),
+        _uniform(x, y + half, half, width, height, color),
+        _uniform(x + half, y + half, half, width, height, color),
+    ]
+
+
+def _collapse(children):
+    """Return a single leaf if all four children are the same leaf."""
+    first = children[0]
+    if not isinstance(first, list) and all(
+        not isinstance(child, list) and child == first for child in children
+    ):
+        return first
+    return children
+
+
+class QuadTreeColorStore:
+    """
+    Quadtree color storage over the 4-neighbor grid.
+
+    Instance Variables:
+        width: The image width in pixels.
+        height: The image height in pixels.
+        size: The side of the root square, the smallest power of two that
+            covers the image.
+        node_visits: The number of tree nodes visited by fills so far.
+    """
+
+    def __init__(self, width, height, color=None):
+        """
+        Creates a store with every pixel set to color (None for missing).
+        """
+        self.width = width
+        self.height = height
+        self.size = 1
+        while self.size < max(width, height):
+            self.size *= 2
+        self.node_visits = 0
+        if color is not None:
+            color = _validate_color(color)
+        self._holder = [_uniform(0, 0, self.size, width, height, color)]
+
+    @classmethod
+    def from_image_graph(cls, graph):
+        """
+        Builds a store holding the colors of an ImageGraph.
+        """
+        store = cls(graph.width, graph.height)
+        pixels = [[None] * graph.width for _ in range(graph.height)]
+        for vertex in graph.vertices:
+            pixels[vertex.y][vertex.x] = vertex.color
+        store._holder = [_build(pixels, 0, 0, store.size, graph.width, graph.height)]
+        return store
+
+    def leaves(self):
+        """
+        Yields every leaf as (x, y, size, color), top-left corner first.
+        """
+        stack = [(self._holder[0], 0, 0, self.size)]
+        while stack:
+            node, x, y, size = stack.pop()
+            if isinstance(node, list):
+                half = size // 2
+                stack.append((node[3], x + half, y + half, half))
+                stack.append((node[2], x, y + half, half))
+                stack.append((node[1], x + half, y, half))
+                stack.append((node[0], x, y, half))
+            else:
+                yield x, y, size, node
+
+    def leaf_count(self):
+        """Return the number of leaves."""
+        return sum(1 for _ in self.leaves())
+
+    def _check(self, x, y):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Pixel ({x}, {y}) is outside the image.")
+
+    def get(self, x, y):
+        """
+        Returns the color at (x, y), or None if the pixel is missing.
+        """
+        self._check(x, y)
+        node = self._holder[0]
+        size = self.size
+        while isinstance(node, list):
+            size //= 2
+            node = node[(2 if y >= size else 0) + (1 if x >= size else 0)]
+            x %= size
+            y %= size
+        return node
+
+    def set(self, x, y, color):
+        """
+        Sets the color at (x, y); None makes the pixel missing.
+        """
+        self._check(x, y)
+        if color is not None:
+            color = _validate_color(color)
+        path = []
+        parent, position = self._holder, 0
+        size = self.size
+        while size > 1:
+            node = parent[position]
+            if not isinstance(node, list):
+                if node == color:
+                    return
+                node = [node] * 4
+                parent[position] = node
+            path.append((parent, position))
+            size //= 2
+            parent, position = node, (2 if y >= size else 0) + (1 if x >= size else 0)
+            x %= size
+            y %= size
+        parent[position] = color
+        for ancestor, index in reversed(path):
+            ancestor[index] = _collapse(ancestor[index])
+
+    def _touching(self, x0, y0, x1, y1):
+        """
+        Return the leaves overlapping the rectangle [x0, x1) x [y0, y1).
+
+        post: a list of (parent, position, x, y, size, color, path) tuples;
+              path holds the (parent, position) of every internal node above
+              the leaf, root first.
+        """
+        found = []
+        stack = [(self._holder, 0, 0, 0, self.size, ())]
+        while stack:
+            parent, position, x, y, size, path = stack.pop()
+            self.node_visits += 1
+            node = parent[position]
+            if not isinstance(node, list):
+                found.append((parent, position, x, y, size, node, path))
+                continue
+            half = size // 2
+            path += ((parent, position),)
+            for child, (child_x, child_y) in enumerate(
+                ((x, y), (x + half, y), (x, y + half), (x + half, y + half))
+            ):
+                if child_x < x1 and child_x + half > x0 and child_y < y1 and child_y + half > y0:
+                    stack.append((node, child, child_x, child_y, half, path))
+        return found
+
+    def fill(self, x, y, color):
+        """
+        Bucket fills the 4-connected same-colored region containing (x, y).
+
+        The region is collected leaf by leaf: a leaf's neighbors are the
+        leaves overlapping the one-pixel strips just outside its four sides.
+        The region's leaves are then recolored and only their ancestors are
+        re-collapsed, deepest first; neither step depends on the region area.
+
+        pre: (x, y) is inside the image and not missing.
+
+        post: recolors the same pixels as bfs/dfs would on the equivalent grid
+              ImageGraph; returns the number of recolored pixels.
+        """
+        initial = self.get(x, y)
+        if initial is None:
+            raise ValueError(f"Pixel ({x}, {y}) is missing.")
+        color = _validate_color(color)
+        if color == initial:
+            return 0
+
+        seed = self._touching(x, y, x + 1, y + 1)[0]
+        region = {(seed[2], seed[3], seed[4]): seed}
+        stack = [seed]
+        while stack:
+            _, _, leaf_x, leaf_y, size, _, _ = stack.pop()
+            strips = (
+                (leaf_x, leaf_y - 1, leaf_x + size, leaf_y),
+                (leaf_x, leaf_y + size, leaf_x + size, leaf_y + size + 1),
+                (leaf_x - 1, leaf_y, leaf_x, leaf_y + size),
+                (leaf_x + size, leaf_y, leaf_x + size + 1, leaf_y + size),
+            )
+            for strip in strips:
+                for leaf in self._touching(*strip):
+                    key = leaf[2:5]
+                    if leaf[5] == initial and key not in region:
+                        region[key] = leaf
+                        stack.append(leaf)
+
+        recolored = 0
+        ancestors = {}
+        for parent, position, _, _, size, _, path in region.values():
+            parent[position] = color
+            recolored += size * size
+            for depth, (ancestor, index) in enumerate(path):
+                ancestors[(id(ancestor), index)] = (depth, ancestor, index)
+        for _, ancestor, index in sorted(
+            ancestors.values(), key=lambda entry: entry[0], reverse=True
+        ):
+            ancestor[index] = _collapse(ancestor[index])
+        return recolored
+
+    def to_image_graph(self):
+        """
+        Builds an in-memory ImageGraph with 4-neighbor edges from the store.
+
+        post: vertices are numbered in row-major order over non-missing pixels.
+        """
+        pixels = [[None] * self.width for _ in range(self.height)]
+        for leaf_x, leaf_y, size, color in self.leaves():
+            if color is None:
+                continue
+            for y in range(leaf_y, leaf_y + size):
+                pixels[y][leaf_x : leaf_x + size] = [color] * size
+        return grid_graph(self.width, self.height, pixels)
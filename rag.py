@@ -0,0 +1,157 @@
+"""
+Region adjacency graph over an ImageGraph.
+
+Every node is a same-color connected region of the pixel graph, labeled as in
+ImageGraph.region_census(), and two nodes are linked when some pixel edge
+joins their regions. A bucket fill recolors one node and merges it with the
+neighboring nodes that already had the new color, so region-level operations
+such as "merge this region into its largest neighbor" cost O(region + border)
+instead of a pixel traversal per region.
+
+The pixel colors are updated on every fill, so the ImageGraph and the region
+graph always agree. Changes made to the ImageGraph by other means are picked
+up through ImageGraph.revision: the region graph is rebuilt on next use.
+"""
+
+
+class RegionAdjacencyGraph:
+    """
+    Regions of an ImageGraph as nodes, with edges between touching regions.
+
+    Instance Variables:
+        graph: The ImageGraph the regions belong to.
+        census: The graph's RegionCensus; node labels are census labels.
+        neighbors: The set of touching region labels, indexed by label.
+            Merged-away labels have an empty set.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.census = None
+        self.neighbors = []
+        self._revision = None
+        self.rebuild()
+
+    def rebuild(self):
+        """Relabels the regions and relinks them in O(V+E)."""
+        graph = self.graph
+        census = graph.region_census()
+        labels = census.labels
+        neighbors = [set() for _ in census.sizes]
+        for vertex in graph.vertices:
+            label = labels[vertex.index]
+            for neighbor in vertex.edges:
+                if labels[neighbor] != label:
+                    neighbors[label].add(labels[neighbor])
+        self.census = census
+        self.neighbors = neighbors
+        self._revision = graph.revision
+
+    def _sync(self):
+        """Rebuild if the ImageGraph changed behind the region graph's back."""
+        if self._revision != self.graph.revision or self.graph._census is not self.census:
+            self.rebuild()
+
+    def regions(self):
+        """Return the labels of all non-empty regions."""
+        self._sync()
+        return [label for label, size in enumerate(self.census.sizes) if size]
+
+    def region_of(self, vertex_index):
+        """Return the label of the region containing a vertex."""
+        self._sync()
+        return self.census.labels[vertex_index]
+
+    def size(self, label):
+        """Return the number of vertices in a region."""
+        self._sync()
+        return self.census.sizes[label]
+
+    def color(self, label):
+        """Return the color of a region."""
+        self._sync()
+        return self.census.colors[label]
+
+    def neighbors_of(self, label):
+        """Return the sorted labels of the regions touching a region."""
+        self._sync()
+        return sorted(self.neighbors[label])
+
+    def fill(self, start_index, color):
+        """
+        Bucket fills the region containing start_index.
+
+        post: the same vertices as ImageGraph.bfs(start_index, color) are
+              recolored; returns their number.
+        """
+        self._sync()
+        return self._fill_label(self.census.labels[start_index], color)
+
+    def fill_label(self, label, color):
+        """
+        Bucket fills a whole region by label.
+
+        post: returns the number of recolored vertices.
+        """
+        self._sync()
+        if not self.census.sizes[label]:
+            raise ValueError(f"Region {label} has been merged away.")
+        return self._fill_label(label, color)
+
+    def merge_into_largest_neighbor(self, label):
+        """
+        Recolors a region with the color of its largest touching region.
+
+        Ties go to the lowest label. A region without neighbors is unchanged.
+
+        post: returns the label of the region that now contains it.
+        """
+        self._sync()
+        census = self.census
+        if not self.neighbors[label]:
+            return label
+        largest = min(self.neighbors[label], key=lambda n: (-census.sizes[n], n))
+        start_index = census.members[label][0]
+        self._fill_label(label, census.colors[largest])
+        return census.labels[start_index]
+
+    def fill_touching(self, label, color):
+        """
+        Bucket fills every region touching a region, in label order.
+
+        post: the same vertices are recolored as by one ImageGraph.bfs per
+              touching region; returns their total number.
+        """
+        self._sync()
+        census = self.census
+        recolored = 0
+        for neighbor in sorted(self.neighbors[label]):
+            if census.sizes[neighbor]:
+                recolored += self._fill_label(neighbor, color)
+        return recolored
+
+    def _fill_label(self, label, color):
+        """Recolor one region through the graph and merge the adjacency sets."""
+        census = self.census
+        if census.colors[label] == color:
+            return 0
+        group = {label}
+        group.update(n for n in self.neighbors[label] if census.colors[n] == color)
+        start_index = census.members[label][0]
+
+        graph = self.graph
+        recolored = graph.fill_region(start_index, color)
+        self._revision = graph.revision
+
+        merged = census.labels[start_index]
+        neighbors = self.neighbors
+        for gone in group:
+            if gone == merged:
+                continue
+            for neighbor in neighbors[gone]:
+                neighbors[neighbor].discard(gone)
+                neighbors[neighbor].add(merged)
+                neighbors[merged].add(neighbor)
+            neighbors[gone] = set()
+        neighbors[merged] -= group
+        return recolored
@@ -0,0 +1,274 @@
+"""
+Raster input/output for ImageGraph.
+
+Binary PGM (P5) and PPM (P6) files are read straight into an ImageGraph whose
+edges come from the implicit 4-neighbor pixel grid, so no .in text (and no
+explicit edge list) is ever produced. Graph colors can be written back out as
+PPM, either once or as a throttled stream of frames while a fill runs.
+"""
+
+import os
+import time
+
+from graph import COLOR_DICT, grid_graph
+
+# RGB value of every color in COLOR_DICT, used to quantize raster pixels.
+PALETTE_RGB = {
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "yellow": (255, 255, 0),
+    "blue": (0, 0, 255),
+    "magenta": (255, 0, 255),
+    "cyan": (0, 255, 255),
+    "white": (255, 255, 255),
+}
+
+_WHITESPACE = b" \t\n\r\v\f"
+
+
+class RasterError(Exception):
+    """
+    Custom exception class for malformed or unsupported raster files.
+    """
+
+
+def _is_path(target):
+    """Tell a filesystem path apart from a file object."""
+    return isinstance(target, (str, bytes)) or hasattr(target, "__fspath__")
+
+
+def nearest_color(red, green, blue):
+    """
+    Returns the name of the COLOR_DICT color closest to the given RGB value.
+
+    pre: red, green and blue are integers in the range 0-255.
+
+    post: the palette color with the smallest squared RGB distance.
+    """
+    best_color = None
+    best_distance = None
+    for name in COLOR_DICT:
+        pal_r, pal_g, pal_b = PALETTE_RGB[name]
+        distance = (
+            (red - pal_r) * (red - pal_r)
+            + (green - pal_g) * (green - pal_g)
+            + (blue - pal_b) * (blue - pal_b)
+        )
+        if best_distance is None or distance < best_distance:
+            best_color = name
+            best_distance = distance
+    return best_color
+
+
+def _read_token(stream):
+    """Read one whitespace-separated header token, skipping # comments."""
+    token = b""
+    while True:
+        char = stream.read(1)
+        if not char:
+            break
+        if char == b"#" and not token:
+            while char not in (b"\n", b"\r", b""):
+                char = stream.read(1)
+            continue
+        if char in _WHITESPACE:
+            if token:
+                break
+            continue
+        token += char
+    if not token:
+        raise RasterError("Unexpected end of file in PNM header.")
+    return token
+
+
+def read_pnm_header(stream):
+    """
+    Reads the header of a binary PGM/PPM file.
+
+    pre: stream is a binary file object positioned at the start of the file.
+
+    post: a tuple (magic, width, height, maxval); the stream is left positioned
+          at the first byte of the raster.
+    """
+    magic = _read_token(stream)
+    if magic not in (b"P5", b"P6"):
+        raise RasterError(f"Unsupported PNM format {magic!r}; expected P5 or P6.")
+    try:
+        width = int(_read_token(stream))
+        height = int(_read_token(stream))
+        maxval = int(_read_token(stream))
+    except ValueError as error:
+        raise RasterError("Malformed PNM header.") from error
+    if width <= 0 or height <= 0 or not 0 < maxval < 65536:
+        raise RasterError("Malformed PNM header.")
+    return magic.decode("ascii"), width, height, maxval
+
+
+def load_pnm(source):
+    """
+    Loads a binary PGM (P5) or PPM (P6) image into an ImageGraph.
+
+    Every pixel becomes a vertex with index y * width + x, colored with the
+    nearest COLOR_DICT color, and is connected to its 4 grid neighbors. The
+    raster is streamed one row at a time, so only the current row of raw
+    bytes is held in memory besides the graph itself.
+
+    pre: source is a path or a binary file object.
+
+    post: returns the ImageGraph for the image.
+    """
+    if _is_path(source):
+        with open(source, "rb") as stream:
+            return load_pnm(stream)
+
+    magic, width, height, maxval = read_pnm_header(source)
+    channels = 3 if magic == "P6" else 1
+    sample_bytes = 1 if maxval < 256 else 2
+    row_length = width * channels * sample_bytes
+
+    quantized = {}
+
+    def rows():
+        for y in range(height):
+            row = source.read(row_length)
+            if len(row) != row_length:
+                raise RasterError(f"Unexpected end of raster data in row {y}.")
+            if sample_bytes == 2:
+                # 16-bit samples are big-endian.
+                row = [(row[i] << 8) | row[i + 1] for i in range(0, row_length, 2)]
+            if maxval != 255:
+                row = bytes(sample * 255 // maxval for sample in row)
+
+            colors = [None] * width
+            for x in range(width):
+                offset = x * channels
+                key = row[offset : offset + channels]
+                color = quantized.get(key)
+                if color is None:
+                    if channels == 3:
+                        color = nearest_color(key[0], key[1], key[2])
+                    else:
+                        color = nearest_color(key[0], key[0], key[0])
+                    quantized[key] = color
+                colors[x] = color
+            yield colors
+
+    return grid_graph(width, height, rows())
+
+
+def pnm_bytes(graph):
+    """
+    Encodes the current colors of the graph as a binary PPM (P6) image.
+
+    Pixels without a vertex are black, matching print_image.
+
+    pre: graph is an ImageGraph whose vertex colors are all in COLOR_DICT.
+
+    post: returns the complete PPM file as a bytes object.
+    """
+    width = graph.width
+    height = graph.height
+    pixels = bytearray(width * height * 3)
+    palette = {name: bytes(rgb) for name, rgb in PALETTE_RGB.items()}
+
+    for vertex in graph.vertices:
+        rgb = palette.get(vertex.color)
+        if rgb is None:
+            rgb = palette.get(vertex.color.strip().lower())
+            if rgb is None:
+                raise ValueError(vertex.color + " is not a valid color!")
+        offset = (vertex.y * width + vertex.x) * 3
+        pixels[offset : offset + 3] = rgb
+
+    header = f"P6\n{width} {height}\n255\n".encode("ascii")
+    return header + pixels
+
+
+def write_ppm(graph, destination):
+    """
+    Writes the current colors of the graph to a binary PPM file in one write.
+
+    pre: destination is a path or a binary file object.
+    """
+    data = pnm_bytes(graph)
+    if _is_path(destination):
+        with open(destination, "wb") as stream:
+            stream.write(data)
+    else:
+        destination.write(data)
+
+
+class FrameSink:
+    """
+    Destination for animation frames.
+
+    A directory target receives one numbered PPM file per frame; a binary file
+    object (for example a pipe into an encoder) receives the frames back to
+    back as a PPM stream.
+
+    Instance Variables:
+        target: The directory path or binary file object frames go to.
+        count: The number of frames written so far.
+    """
+
+    def __init__(self, target, prefix="frame"):
+        self.target = target
+        self.prefix = prefix
+        self.count = 0
+
+    def write(self, graph):
+        """Write the current state of the graph as the next frame."""
+        if _is_path(self.target):
+            path = os.path.join(self.target, f"{self.prefix}_{self.count:06d}.ppm")
+            write_ppm(graph, path)
+        else:
+            write_ppm(graph, self.target)
+            self.target.flush()
+        self.count += 1
+
+
+class FillProgress:
+    """
+    Throttled progress reporter for ImageGraph.bfs and ImageGraph.dfs.
+
+    A frame is sent to the sink every `every` visited vertices and/or every
+    `interval_ms` milliseconds, whichever comes first, plus one final frame
+    when the fill finishes.
+
+    Instance Variables:
+        sink: The FrameSink (or any object with write(graph)) to send frames to.
+        every: Visits between frames, or None to disable the count trigger.
+        interval_ms: Milliseconds between frames, or None to disable the timer.
+        visits: The number of vertices visited so far.
+    """
+
+    def __init__(self, sink, every=None, interval_ms=None):
+        if every is None and interval_ms is None:
+            raise ValueError("FillProgress needs every and/or interval_ms.")
+        self.sink = sink
+        self.every = every
+        self.interval_ms = interval_ms
+        self.visits = 0
+        self._since_frame = 0
+        self._last_frame = time.monotonic()
+
+    def tick(self, graph):
+        """Record one visited vertex and emit a frame if one is due."""
+        self.visits += 1
+        self._since_frame += 1
+        if self.every is not None and self._since_frame >= self.every:
+            self._emit(graph)
+        elif self.interval_ms is not None:
+            now = time.monotonic()
+            if (now - self._last_frame) * 1000 >= self.interval_ms:
+                self._emit(graph)
+
+    def finish(self, graph):
+        """Emit the final frame of the fill."""
+        self._emit(graph)
+
+    def _emit(self, graph):
+        self.sink.write(graph)
+        self._since_frame = 0
+        self._last_frame = time.monotonic()
@@ -0,0 +1,179 @@
+"""
+Run-length encoded image rows.
+
+An RLEImage stores each row as a sorted list of (start, length, color) runs;
+pixels not covered by a run have no vertex. Neighboring pixels are the
+4-neighbor grid, as in tiled.TiledColorStore, so memory and fill time grow
+with the number of runs rather than the number of pixels: a bucket fill
+walks from run to run through the x-overlaps between adjacent rows.
+"""
+
+from bisect import bisect_right
+from operator import itemgetter
+
+from graph import COLOR_DICT, grid_graph
+
+_START = itemgetter(0)
+
+
+def encode_row(pixels):
+    """
+    Run-length encodes one row.
+
+    pre: pixels is a sequence of color names, None for a missing pixel.
+
+    post: a sorted list of (start, length, color) runs.
+    """
+    runs = []
+    for x, color in enumerate(pixels):
+        if color is None:
+            continue
+        if runs and runs[-1][2] == color and runs[-1][0] + runs[-1][1] == x:
+            start, length, _ = runs[-1]
+            runs[-1] = (start, length + 1, color)
+        else:
+            runs.append((x, 1, color))
+    return runs
+
+
+def _merge_runs(runs):
+    """Return the runs with touching same-color neighbors joined."""
+    merged = []
+    for run in runs:
+        if merged and merged[-1][2] == run[2] and merged[-1][0] + merged[-1][1] == run[0]:
+            start, length, color = merged[-1]
+            merged[-1] = (start, length + run[1], color)
+        else:
+            merged.append(run)
+    return merged
+
+
+class RLEImage:
+    """
+    An image stored as run-length encoded rows.
+
+    Instance Variables:
+        width: The image width in pixels.
+        height: The image height in pixels.
+        rows: One sorted list of (start, length, color) runs per row.
+    """
+
+    def __init__(self, width, height, rows=None):
+        """
+        Creates an image from one list of (start, length, color) runs per row.
+
+        post: each row is sorted and touching runs of the same color are
+              joined, since fill treats every run as one whole span.
+        """
+        self.width = width
+        self.height = height
+        if rows is None:
+            self.rows = [[] for _ in range(height)]
+        else:
+            self.rows = [_merge_runs(sorted(runs, key=_START)) for runs in rows]
+
+    @classmethod
+    def from_image_graph(cls, graph):
+        """
+        Encodes the colors of an ImageGraph.
+        """
+        pixels = [[None] * graph.width for _ in range(graph.height)]
+        for vertex in graph.vertices:
+            pixels[vertex.y][vertex.x] = vertex.color
+        return cls(graph.width, graph.height, [encode_row(row) for row in pixels])
+
+    def to_image_graph(self):
+        """
+        Builds an in-memory ImageGraph with 4-neighbor edges.
+
+        post: vertices are numbered in row-major order over covered pixels.
+        """
+        return grid_graph(
+            self.width, self.height, (self._decode_row(runs) for runs in self.rows)
+        )
+
+    def _decode_row(self, runs):
+        """Return one row's color per pixel, None where no run covers it."""
+        pixels = [None] * self.width
+        for start, length, color in runs:
+            pixels[start : start + length] = [color] * length
+        return pixels
+
+    def run_count(self):
+        """Return the total number of runs."""
+        return sum(len(runs) for runs in self.rows)
+
+    def _find(self, x, y):
+        """Return the position of the run covering (x, y) in its row, or None."""
+        runs = self.rows[y]
+        position = bisect_right(runs, x, key=_START) - 1
+        if position >= 0 and x < runs[position][0] + runs[position][1]:
+            return position
+        return None
+
+    def get(self, x, y):
+        """
+        Returns the color at (x, y), or None if the pixel is missing.
+        """
+        position = self._find(x, y)
+        return None if position is None else self.rows[y][position][2]
+
+    def fill(self, x, y, color):
+        """
+        Bucket fills the 4-connected same-colored region containing (x, y).
+
+        The region is collected run by run: each run's neighbors are the runs
+        of the same color in the rows above and below whose x ranges overlap
+        it. The region's runs are then recolored and merged with touching
+        runs of the new color.
+
+        pre: (x, y) is inside the image and not missing.
+
+        post: recolors the same pixels as bfs/dfs would on the equivalent grid
+              ImageGraph; returns the number of recolored pixels.
+        """
+        if color.strip().lower() not in COLOR_DICT:
+            raise ValueError(color + " is not a valid color!")
+        color = color.strip().lower()
+        position = self._find(x, y)
+        if position is None:
+            raise ValueError(f"Pixel ({x}, {y}) is missing.")
+        rows = self.rows
+        initial = rows[y][position][2]
+        if initial == color:
+            return 0
+
+        region = {(y, position)}
+        stack = [(y, position)]
+        while stack:
+            row, position = stack.pop()
+            start, length, _ = rows[row][position]
+            end = start + length
+            for next_row in (row - 1, row + 1):
+                if not 0 <= next_row < self.height:
+                    continue
+                runs = rows[next_row]
+                next_position = max(bisect_right(runs, start, key=_START) - 1, 0)
+                while next_position < len(runs) and runs[next_position][0] < end:
+                    next_start, next_length, next_color = runs[next_position]
+                    if (
+                        next_color == initial
+                        and next_start + next_length > start
+                        and (next_row, next_position) not in region
+                    ):
+                        region.add((next_row, next_position))
+                        stack.append((next_row, next_position))
+                    next_position += 1
+
+        recolored = 0
+        by_row = {}
+        for row, position in region:
+            by_row.setdefault(row, []).append(position)
+        for row, positions in by_row.items():
+            runs = rows[row]
+            for position in positions:
+                start, length, _ = runs[position]
+                runs[position] = (start, length, color)
+                recolored += length
+            rows[row] = _merge_runs(runs)
+        return recolored
@@ -0,0 +1,343 @@
+"""
+Resident fill server.
+
+Keeps ImageGraphs in memory between requests, keyed by image id, and serves
+them over a Unix domain socket so clients do not pay for a new interpreter,
+re-parsing and re-rendering on every fill.
+
+The protocol is one JSON object per line in each direction. Every request
+has an "op" field; every response has "ok" and either the result fields or
+an "error" message.
+
+    {"op": "load", "id": "a", "path": "heart.in"}       -> vertices, start, color
+    {"op": "load", "id": "a", "data": "<.in text>"}
+    {"op": "load", "id": "b", "pnm": "scan.ppm"}
+    {"op": "fill", "id": "a", "start": 45, "color": "red", "method": "bfs"}
+                                                         -> recolored
+    {"op": "query", "id": "a", "index": 45}              -> color
+    {"op": "query", "id": "a"}                           -> vertices, width, height
+    {"op": "snapshot", "id": "a"}                        -> colors
+    {"op": "snapshot", "id": "a", "path": "out.ppm"}     -> path
+    {"op": "unload", "id": "a"}
+    {"op": "stats"}                                      -> images, bytes, budget
+
+Request lines longer than --max-line-mb are answered with an error.
+
+Usage: python3 server.py SOCKET_PATH [--budget-mb MB] [--max-line-mb MB]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from graph import COLOR_DICT, create_graph
+from raster import load_pnm, write_ppm
+
+# Longest request line accepted; inline .in data for large images is big.
+MAX_LINE_BYTES = 256 * 1024 * 1024
+
+# Rough per-object costs used to estimate how much memory an image holds.
+VERTEX_BYTES = 400
+EDGE_BYTES = 8
+
+
+def estimate_graph_bytes(graph):
+    """
+    Estimates the memory held by an ImageGraph.
+
+    post: an approximate size in bytes, counting the ColoredVertex objects and
+          their edge lists.
+    """
+    num_edges = sum(len(vertex.edges) for vertex in graph.vertices)
+    return len(graph.vertices) * VERTEX_BYTES + num_edges * EDGE_BYTES
+
+
+def read_text(path):
+    """Return the contents of a UTF-8 text file."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class ImageStore:
+    """
+    LRU cache of resident images bounded by an estimated memory budget.
+
+    Instance Variables:
+        budget: The memory budget in bytes.
+        total_bytes: The estimated size of all resident images.
+        evictions: The number of images evicted so far.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.total_bytes = 0
+        self.evictions = 0
+        self._images = OrderedDict()
+
+    def __len__(self):
+        return len(self._images)
+
+    def __contains__(self, image_id):
+        return image_id in self._images
+
+    def put(self, image_id, graph):
+        """
+        Stores the graph under image_id as the most recently used image and
+        evicts the least recently used images until the budget is met. The
+        image just stored is never evicted, even if it alone exceeds the
+        budget.
+
+        post: returns the ids of the evicted images.
+        """
+        self.remove(image_id)
+        cost = estimate_graph_bytes(graph)
+        self._images[image_id] = (graph, cost)
+        self.total_bytes += cost
+        evicted = []
+        while self.total_bytes > self.budget and len(self._images) > 1:
+            evicted_id = next(iter(self._images))
+            self.remove(evicted_id)
+            self.evictions += 1
+            evicted.append(evicted_id)
+        return evicted
+
+    def get(self, image_id):
+        """
+        Returns the graph stored under image_id and marks it most recently used.
+
+        Raises:
+            KeyError: If no such image is resident.
+        """
+        graph, _ = self._images[image_id]
+        self._images.move_to_end(image_id)
+        return graph
+
+    def remove(self, image_id):
+        """Drops image_id if it is resident."""
+        entry = self._images.pop(image_id, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+
+class FillServer:
+    """
+    Asyncio server that answers load/fill/query/snapshot requests.
+
+    Parsing, fills and snapshots run in the default executor so one large
+    image does not stall other clients. Requests for the same image are
+    serialized with a per-image lock, which is dropped once the image is no
+    longer resident and no request is using it.
+
+    Instance Variables:
+        store: The ImageStore holding resident images.
+        max_line_bytes: The longest request line accepted.
+    """
+
+    def __init__(self, budget, max_line_bytes=MAX_LINE_BYTES):
+        self.store = ImageStore(budget)
+        self.max_line_bytes = max_line_bytes
+        self._locks = {}
+
+    @asynccontextmanager
+    async def _locked(self, image_id):
+        """Hold the lock of image_id; each entry is [lock, number of users]."""
+        entry = self._locks.get(image_id)
+        if entry is None:
+            entry = self._locks[image_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            self._drop_lock(image_id)
+
+    def _drop_lock(self, image_id):
+        """Forget the lock of an image that is not resident and not in use."""
+        entry = self._locks.get(image_id)
+        if entry is not None and entry[1] == 0 and image_id not in self.store:
+            del self._locks[image_id]
+
+    async def serve(self, socket_path):
+        """Listen on socket_path until cancelled."""
+        server = await asyncio.start_unix_server(
+            self.handle_client, path=socket_path, limit=self.max_line_bytes
+        )
+        async with server:
+            await server.serve_forever()
+
+    @staticmethod
+    async def _read_line(reader):
+        """
+        Reads one request line.
+
+        post: returns the line, b"" at end of input, or None if the line was
+              longer than the reader's limit; the whole line is consumed.
+        """
+        too_long = False
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:
+                line = error.partial
+            except asyncio.LimitOverrunError as error:
+                await reader.readexactly(error.consumed)
+                too_long = True
+                continue
+            return None if too_long else line
+
+    async def handle_client(self, reader, writer):
+        """Answer JSON requests from one client until it disconnects."""
+        try:
+            while True:
+                line = await self._read_line(reader)
+                if line is None:
+                    response = {
+                        "ok": False,
+                        "error": f"Request line longer than {self.max_line_bytes} bytes.",
+                    }
+                elif not line:
+                    break
+                elif not line.strip():
+                    continue
+                else:
+                    response = await self.handle_line(line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def handle_line(self, line):
+        """
+        Decodes and runs one request.
+
+        post: returns the response dictionary; errors are reported in the
+              response rather than raised.
+        """
+        try:
+            request = json.loads(line)
+            handler = getattr(self, "op_" + str(request.get("op")), None)
+            if handler is None:
+                raise ValueError(f"Unknown op {request.get('op')!r}.")
+            result = await handler(request)
+        except KeyError as error:
+            return {"ok": False, "error": f"Unknown image or missing field {error}."}
+        except Exception as error:  # pylint: disable=broad-except
+            return {"ok": False, "error": str(error)}
+        result["ok"] = True
+        return result
+
+    async def _run(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, function, *args)
+
+    async def op_load(self, request):
+        """Parse an .in file, .in text or PNM file into a resident image."""
+        image_id = request["id"]
+        if "pnm" in request:
+            graph = await self._run(load_pnm, request["pnm"])
+            start_index, color = None, None
+        else:
+            data = request.get("data")
+            if data is None:
+                data = await self._run(read_text, request["path"])
+            graph, start_index, color = await self._run(create_graph, data, True)
+        async with self._locked(image_id):
+            evicted = self.store.put(image_id, graph)
+        for evicted_id in evicted:
+            self._drop_lock(evicted_id)
+        return {"vertices": len(graph.vertices), "start": start_index, "color": color}
+
+    async def op_fill(self, request):
+        """Bucket fill a resident image with bfs or dfs."""
+        image_id = request["id"]
+        method = request.get("method", "bfs")
+        if method not in ("bfs", "dfs"):
+            raise ValueError(f"Unknown fill method {method!r}.")
+        async with self._locked(image_id):
+            graph = self.store.get(image_id)
+            start_index = int(request["start"])
+            if not 0 <= start_index < len(graph.vertices):
+                raise ValueError(f"Start index {start_index} is out of range.")
+            color = str(request["color"]).strip().lower()
+            if color not in COLOR_DICT:
+                raise ValueError(f"{request['color']} is not a valid color!")
+            fill = getattr(graph, method)
+            recolored = await self._run(lambda: fill(start_index, color, verbose=False))
+        return {"recolored": recolored}
+
+    async def op_query(self, request):
+        """Report one vertex color, or the image size without an index."""
+        async with self._locked(request["id"]):
+            graph = self.store.get(request["id"])
+            if "index" in request:
+                index = int(request["index"])
+                if not 0 <= index < len(graph.vertices):
+                    raise ValueError(f"Index {index} is out of range.")
+                return {"color": graph.vertices[index].color}
+            return {
+                "vertices": len(graph.vertices),
+                "width": graph.width,
+                "height": graph.height,
+            }
+
+    async def op_snapshot(self, request):
+        """Return all vertex colors, or write them to a PPM file."""
+        image_id = request["id"]
+        async with self._locked(image_id):
+            graph = self.store.get(image_id)
+            if "path" in request:
+                await self._run(write_ppm, graph, request["path"])
+                return {"path": request["path"]}
+            return {"colors": [vertex.color for vertex in graph.vertices]}
+
+    async def op_unload(self, request):
+        """Drop a resident image once the requests using it are done."""
+        async with self._locked(request["id"]):
+            self.store.remove(request["id"])
+        return {}
+
+    async def op_stats(self, _request):
+        """Report store usage."""
+        return {
+            "images": len(self.store),
+            "bytes": self.store.total_bytes,
+            "budget": self.store.budget,
+            "evictions": self.store.evictions,
+        }
+
+
+def main():
+    """Run the fill server on the socket path given on the command line."""
+    parser = argparse.ArgumentParser(description="Resident bucket fill server.")
+    parser.add_argument("socket", help="path of the Unix domain socket")
+    parser.add_argument(
+        "--budget-mb", type=float, default=512, help="memory budget for resident images"
+    )
+    parser.add_argument(
+        "--max-line-mb",
+        type=float,
+        default=MAX_LINE_BYTES / (1024 * 1024),
+        help="longest request line accepted",
+    )
+    args = parser.parse_args()
+
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    server = FillServer(
+        int(args.budget_mb * 1024 * 1024), int(args.max_line_mb * 1024 * 1024)
+    )
+    try:
+        asyncio.run(server.serve(args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
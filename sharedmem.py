@@ -0,0 +1,220 @@
+"""
+Shared-memory publishing of an ImageGraph for worker processes.
+
+SharedGraph.publish copies a graph's colors, coordinates and CSR edges into
+one multiprocessing.shared_memory block. Workers attach to the block by name
+and read (or recolor) it in place through memoryviews, without parsing the
+.in file again or unpickling ColoredVertex objects. A SharedGraph pickles as
+just its block name, so it can be passed straight to a ProcessPoolExecutor.
+
+Block layout (little-endian, every section 8-byte aligned):
+
+    header   magic b"SHGR", width, height (uint32), vertices, edges (uint64)
+    colors   one palette code per vertex (uint8, see tiled.COLOR_NAMES)
+    xs, ys   vertex coordinates (int32)
+    offsets  CSR row offsets, vertices + 1 entries (int64)
+    targets  CSR neighbor indices (int32)
+
+Ownership: the process that calls publish owns the block and unlinks it when
+it closes its SharedGraph; attached SharedGraphs only unmap it. Close every
+SharedGraph (or use it as a context manager) before the owner exits.
+"""
+
+import multiprocessing
+import struct
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from tiled import COLOR_CODES, COLOR_NAMES
+
+HEADER = struct.Struct("<4sIIQQ")
+MAGIC = b"SHGR"
+
+# Names of the blocks published (and so owned) by this process.
+_PUBLISHED = set()
+
+
+def _aligned(size):
+    return (size + 7) & ~7
+
+
+def _layout(num_vertices, num_edges):
+    """Return the (offset, length, format) of every section and the total size."""
+    sections = {}
+    position = _aligned(HEADER.size)
+    for name, count, fmt, item in (
+        ("colors", num_vertices, "B", 1),
+        ("xs", num_vertices, "i", 4),
+        ("ys", num_vertices, "i", 4),
+        ("offsets", num_vertices + 1, "q", 8),
+        ("targets", num_edges, "i", 4),
+    ):
+        sections[name] = (position, count * item, fmt)
+        position = _aligned(position + count * item)
+    return sections, max(position, 1)
+
+
+class SharedGraph:
+    """
+    An ImageGraph's colors and CSR topology in a shared memory block.
+
+    Instance Variables:
+        name: The shared memory block name workers attach to.
+        owner: True for the publishing SharedGraph, which unlinks the block.
+        width: The image width in pixels.
+        height: The image height in pixels.
+        num_vertices: The number of vertices.
+        colors: memoryview of palette codes, one per vertex; writable.
+        xs, ys: memoryviews of vertex coordinates.
+        offsets, targets: memoryviews of the CSR arrays; the neighbors of
+            vertex i are targets[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.name = shm.name
+        self.owner = owner
+        magic, self.width, self.height, self.num_vertices, num_edges = HEADER.unpack_from(
+            shm.buf
+        )
+        if magic != MAGIC:
+            shm.close()
+            raise ValueError(f"Shared memory block {shm.name} does not hold a graph.")
+        sections, _ = _layout(self.num_vertices, num_edges)
+        self._views = []
+        for section, (start, length, fmt) in sections.items():
+            raw = shm.buf[start : start + length]
+            view = raw.cast(fmt)
+            self._views += [view, raw]
+            setattr(self, section, view)
+
+    @classmethod
+    def publish(cls, graph, name=None):
+        """
+        Copies an ImageGraph into a new shared memory block.
+
+        post: the owning SharedGraph; the block lives until it is closed.
+              If copying fails (e.g. an unknown color) the block is
+              unlinked before the error is raised.
+        """
+        offsets, targets = graph.to_csr()
+        num_vertices = len(graph.vertices)
+        sections, size = _layout(num_vertices, len(targets))
+        shm = SharedMemory(name=name, create=True, size=size)
+        _PUBLISHED.add(shm.name)
+        HEADER.pack_into(shm.buf, 0, MAGIC, graph.width, graph.height, num_vertices, len(targets))
+        shared = cls(shm, owner=True)
+        try:
+            for index, vertex in enumerate(graph.vertices):
+                shared.colors[index] = COLOR_CODES[vertex.color.strip().lower()]
+                shared.xs[index] = vertex.x
+                shared.ys[index] = vertex.y
+            for index, offset in enumerate(offsets):
+                shared.offsets[index] = offset
+            for index, target in enumerate(targets):
+                shared.targets[index] = target
+        except BaseException:
+            shared.close()
+            raise
+        return shared
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Maps an existing block published by another SharedGraph, zero-copy.
+
+        post: a non-owning SharedGraph; raises FileNotFoundError if the
+              block has been unlinked.
+        """
+        try:
+            shm = SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            shm = SharedMemory(name=name)
+            if multiprocessing.parent_process() is None and shm.name not in _PUBLISHED:
+                # Outside the owner's process tree this process has its own
+                # resource tracker, which would unlink the block at exit.
+                resource_tracker.unregister(shm._name, "shared_memory")  # pylint: disable=protected-access
+        return cls(shm, owner=False)
+
+    def __reduce__(self):
+        return (SharedGraph.attach, (self.name,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def color(self, index):
+        """Return the color name of a vertex."""
+        return COLOR_NAMES[self.colors[index]]
+
+    def neighbors(self, index):
+        """Return the neighbor indices of a vertex as a memoryview slice."""
+        return self.targets[self.offsets[index] : self.offsets[index + 1]]
+
+    def fill(self, start_index, color):
+        """
+        Bucket fills the shared colors in place.
+
+        post: the same vertices as ImageGraph.bfs(start_index, color) are
+              recolored; returns their number.
+        """
+        new = COLOR_CODES.get(color.strip().lower())
+        if new is None:
+            raise ValueError(color + " is not a valid color!")
+        colors = self.colors
+        offsets = self.offsets
+        targets = self.targets
+        initial = colors[start_index]
+        if initial == new:
+            return 0
+        colors[start_index] = new
+        frontier = [start_index]
+        position = 0
+        while position < len(frontier):
+            index = frontier[position]
+            for neighbor in targets[offsets[index] : offsets[index + 1]]:
+                if colors[neighbor] == initial:
+                    colors[neighbor] = new
+                    frontier.append(neighbor)
+            position += 1
+        return len(frontier)
+
+    def push_colors(self, graph):
+        """Copies the current colors of the published ImageGraph into the block."""
+        colors = self.colors
+        for index, vertex in enumerate(graph.vertices):
+            colors[index] = COLOR_CODES[vertex.color.strip().lower()]
+
+    def pull_colors(self, graph):
+        """
+        Copies the block's colors back into the ImageGraph.
+
+        post: returns the number of vertices whose color changed.
+        """
+        changed = []
+        colors = self.colors
+        for index, vertex in enumerate(graph.vertices):
+            color = COLOR_NAMES[colors[index]]
+            if vertex.color != color:
+                vertex.prev_color = vertex.color
+                vertex.color = color
+                changed.append(index)
+        if changed:
+            graph.colors_changed()
+            graph.mark_dirty(changed)
+        return len(changed)
+
+    def close(self):
+        """Unmaps the block; the owner also unlinks it."""
+        if self._shm is None:
+            return
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+            _PUBLISHED.discard(self.name)
+        self._shm = None
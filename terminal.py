@@ -0,0 +1,131 @@
+"""
+Incremental terminal rendering of an ImageGraph.
+
+ImageGraph.print_image redraws every cell. A TerminalRenderer draws the image
+once, turns on the graph's dirty tracking, and from then on refresh() repaints
+only the cells that fills recolored: the dirty cells are grouped into
+rectangles and each rectangle row is written after one ANSI cursor move.
+
+Cells are two characters wide, like print_block, and missing vertices are
+painted black, like print_image.
+"""
+
+import sys
+
+from graph import BLOCK_CHAR, RESET_CHAR, colored
+
+
+def cursor_to(row, column):
+    """Return the ANSI sequence moving the cursor to a 1-based row and column."""
+    return f"\u001b[{row};{column}H"
+
+
+def dirty_rectangles(cells):
+    """
+    Groups dirty cells into rectangles.
+
+    Each row's cells are split into runs of consecutive x; a run with the same
+    x range as a run in the previous row extends that run's rectangle.
+
+    post: a list of (x, y, width, height) tuples covering exactly the cells.
+    """
+    rows = {}
+    for x, y in cells:
+        rows.setdefault(y, []).append(x)
+
+    finished = []
+    open_rects = {}
+    last_y = None
+    for y in sorted(rows):
+        if last_y is not None and y != last_y + 1:
+            finished.extend(open_rects.values())
+            open_rects = {}
+        spans = []
+        xs = sorted(rows[y])
+        start = previous = xs[0]
+        for x in xs[1:]:
+            if x != previous + 1:
+                spans.append((start, previous + 1))
+                start = x
+            previous = x
+        spans.append((start, previous + 1))
+
+        next_rects = {}
+        for span in spans:
+            rect = open_rects.pop(span, None)
+            if rect is None:
+                rect = [span[0], y, span[1] - span[0], 0]
+            rect[3] += 1
+            next_rects[span] = rect
+        finished.extend(open_rects.values())
+        open_rects = next_rects
+        last_y = y
+    finished.extend(open_rects.values())
+    return [tuple(rect) for rect in finished]
+
+
+class TerminalRenderer:
+    """
+    Draws an ImageGraph on an ANSI terminal and repaints only changed cells.
+
+    Instance Variables:
+        graph: The ImageGraph being shown.
+        stream: The text stream written to, sys.stdout by default.
+        top: The 1-based terminal row of the image's first row.
+        left: The 1-based terminal column of the image's first cell.
+        cells_painted: The number of cells written so far.
+    """
+
+    def __init__(self, graph, stream=None, top=1, left=1):
+        self.graph = graph
+        self.stream = sys.stdout if stream is None else stream
+        self.top = top
+        self.left = left
+        self.cells_painted = 0
+
+    def _cell(self, color):
+        return colored(BLOCK_CHAR * 2, color or "black")
+
+    def _park(self):
+        """Put the cursor on the line below the image and reset the color."""
+        self.stream.write(RESET_CHAR + cursor_to(self.top + self.graph.height, 1))
+        self.stream.flush()
+
+    def draw(self):
+        """Draws the whole image and starts tracking changes from here."""
+        graph = self.graph
+        img = [[None] * graph.width for _ in range(graph.height)]
+        for vertex in graph.vertices:
+            img[vertex.y][vertex.x] = vertex.color
+        write = self.stream.write
+        for y, line in enumerate(img):
+            write(cursor_to(self.top + y, self.left))
+            write("".join(self._cell(color) for color in line))
+        self.cells_painted += graph.width * graph.height
+        graph.track_dirty(consumer=self)
+        graph.take_dirty(self)
+        self._park()
+
+    def refresh(self):
+        """
+        Repaints the cells recolored since the last draw or refresh.
+
+        post: returns the number of cells repainted.
+        """
+        dirty = self.graph.take_dirty(self)
+        if not dirty:
+            return 0
+        write = self.stream.write
+        for x, y, width, height in dirty_rectangles(dirty):
+            for row in range(y, y + height):
+                write(cursor_to(self.top + row, self.left + 2 * x))
+                write(
+                    "".join(self._cell(dirty[(column, row)]) for column in range(x, x + width))
+                )
+        self.cells_painted += len(dirty)
+        self._park()
+        return len(dirty)
+
+    def close(self):
+        """Stops dirty tracking on the graph."""
+        self.graph.track_dirty(False, self)
@@ -0,0 +1,62 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from batch import expand_inputs, output_names, run_batch
+
+
+class TestBatch(unittest.TestCase):
+    """batch Test Suite"""
+
+    def test_expand_inputs(self):
+        """Test glob expansion keeps order and drops repeats."""
+        paths = expand_inputs(["small.in", "*.in", "missing.in"])
+        self.assertEqual(paths[0], "small.in")
+        self.assertEqual(paths.count("small.in"), 1)
+        self.assertIn("heart.in", paths)
+        self.assertEqual(paths[-1], "missing.in")
+
+    def test_run_batch(self):
+        """Test results are written per file and failures are collected."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            results, failures, _ = run_batch(
+                ["heart.in", "small.in", "check.in", "missing.in"],
+                output_dir,
+                jobs=2,
+                with_matrix=True,
+                max_in_flight=1,
+            )
+            self.assertEqual(sorted(stats["input"] for stats in results), ["heart.in", "small.in"])
+            self.assertEqual(sorted(path for path, _ in failures), ["check.in", "missing.in"])
+            with open(os.path.join(output_dir, "heart.json"), encoding="utf-8") as f:
+                result = json.load(f)
+            self.assertEqual(result["stats"]["recolored"], 29)
+            self.assertEqual(result["colors"].count("magenta"), 29)
+            self.assertEqual(len(result["matrix"]), 81)
+
+    def test_same_file_names(self):
+        """Test inputs sharing a file name in different directories keep both results."""
+        with tempfile.TemporaryDirectory() as work_dir:
+            paths = []
+            for directory, source in (("a", "heart.in"), ("b", "small.in")):
+                os.makedirs(os.path.join(work_dir, directory))
+                paths.append(os.path.join(work_dir, directory, "scan.in"))
+                shutil.copy(source, paths[-1])
+            names = output_names(paths + ["small.in"])
+            self.assertEqual(names["small.in"], "small")
+            self.assertEqual(len(set(names.values())), 3)
+            self.assertTrue(all(names[path].startswith("scan-") for path in paths))
+
+            output_dir = os.path.join(work_dir, "out")
+            results, failures, _ = run_batch(paths, output_dir, jobs=2)
+            self.assertEqual(failures, [])
+            self.assertEqual(len(set(stats["output"] for stats in results)), 2)
+            for stats in results:
+                with open(stats["output"], encoding="utf-8") as f:
+                    self.assertEqual(json.load(f)["stats"]["input"], stats["input"])
+
+
+if __name__ == "__main__":
+    unittest.main()
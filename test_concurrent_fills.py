@@ -0,0 +1,82 @@
+import random
+import threading
+import unittest
+
+from benchmark import make_grid_image
+from concurrent_fills import ConcurrentFiller
+from graph import COLOR_DICT, create_graph
+
+
+def colors(graph):
+    return [vertex.color for vertex in graph.vertices]
+
+
+class TestConcurrentFiller(unittest.TestCase):
+    """ConcurrentFiller Test Suite"""
+
+    def test_history_replays_serially(self):
+        """Test parallel fills equal bfs replayed in commit order."""
+        graph, _ = make_grid_image(64, 64, block=4, seed=6)
+        reference, _ = make_grid_image(64, 64, block=4, seed=6)
+        filler = ConcurrentFiller(graph, tile_size=8)
+        rng = random.Random(11)
+        fills = [
+            (rng.randrange(len(graph.vertices)), rng.choice(list(COLOR_DICT)))
+            for _ in range(120)
+        ]
+        counts = filler.run(fills, workers=8)
+
+        self.assertEqual(sorted(ticket for ticket, _, _, _ in filler.history), list(range(120)))
+        for ticket, start, color, recolored in filler.history:
+            self.assertEqual(reference.bfs(start, color, verbose=False), recolored)
+            self.assertEqual(counts[ticket], recolored)
+        self.assertEqual(colors(graph), colors(reference))
+
+    def test_conflicts_commit_in_ticket_order(self):
+        """Test fills of one region commit in the order they were given."""
+        graph, start = make_grid_image(64, 64, block=8, seed=2)
+        filler = ConcurrentFiller(graph, tile_size=8)
+        fills = [(start, color) for color in ("red", "blue", "green", "cyan")] * 10
+        filler.run(fills, workers=8)
+        self.assertEqual([ticket for ticket, _, _, _ in filler.history], list(range(40)))
+        self.assertEqual(graph.vertices[start].color, "cyan")
+
+    def test_fill_from_threads(self):
+        """Test the blocking fill() and that unchanged colors recolor nothing."""
+        with open("flags.in", encoding="utf-8") as f:
+            graph, start, color = create_graph(f.read())
+        filler = ConcurrentFiller(graph, tile_size=2)
+        census = graph.region_census()
+        expected = census.sizes[census.labels[start]]
+        self.assertEqual(filler.fill(start, color), expected)
+        self.assertEqual(filler.fill(start, color), 0)
+        self.assertIsNot(graph.region_census(), census)
+
+    def test_failed_fills_release_claims(self):
+        """Test a rejected run or a failing fill leaves no claim behind."""
+        graph, start = make_grid_image(32, 32, block=8, seed=5)
+        filler = ConcurrentFiller(graph, tile_size=8)
+        with self.assertRaises(IndexError):
+            filler.run([(start, "red"), (10**6, "blue")])
+        self.assertEqual(filler._claims, {})
+
+        ticket = filler.submit(start)
+
+        def broken(*_args):
+            raise RuntimeError("discover failed")
+
+        filler._discover = broken
+        with self.assertRaises(RuntimeError):
+            filler.execute(ticket, start, "red")
+        del filler._discover
+        self.assertEqual(filler._claims, {})
+
+        worker = threading.Thread(target=filler.fill, args=(start, "cyan"))
+        worker.start()
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(graph.vertices[start].color, "cyan")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,338 @@
+"""
+Differential conformance tests for the fill engines.
+
+Seeded generators build grid and non-grid graphs; every engine is run against
+the reference ImageGraph.bfs/dfs (linked-list Queue/Stack) and must produce
+the same final colors, plus the same visit order wherever that is promised:
+
+    FillTask bfs/dfs   - exactly the reference bfs/dfs visit order
+    engines.bfs_levels - exactly the reference BFS distance of every vertex
+    everything else    - final colors only
+
+Besides the ENGINES, the stores and fillers built on ImageGraph are checked
+through small adapters: SharedGraph.fill, ConcurrentFiller and multi_fill on
+every case, and the grid stores (TiledColorStore, RLEImage and
+QuadTreeColorStore), which always use the 4-neighbor grid, on grid cases only.
+
+A failing case is shrunk to a minimal graph and written as an .in file to
+$CONFORMANCE_FAILURE_DIR (default: the system temp directory); the path is
+part of the failure message. Set CONFORMANCE_SCALE to grow the graphs.
+"""
+
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from concurrent_fills import ConcurrentFiller
+from engines import ENGINES, bfs_levels
+from fill_tasks import FillTask
+from graph import COLOR_DICT, create_graph
+from quadtree import QuadTreeColorStore
+from rle import RLEImage
+from sharedmem import SharedGraph
+from tiled import TiledColorStore
+
+SCALE = int(os.environ.get("CONFORMANCE_SCALE", "1"))
+SEEDS = range(4)
+
+
+class Case:
+    """A generated fill problem that can be written as .in text."""
+
+    def __init__(self, width, height, vertices, edges, start, color):
+        self.width = width
+        self.height = height
+        self.vertices = vertices  # list of (x, y, color)
+        self.edges = edges  # list of (from, to)
+        self.start = start
+        self.color = color
+
+    def to_text(self):
+        """Return the case in .in format."""
+        header = str(self.width) if self.width == self.height else f"{self.width},{self.height}"
+        lines = [header, str(len(self.vertices))]
+        lines += [f"{x},{y},{color}" for x, y, color in self.vertices]
+        lines.append(str(len(self.edges)))
+        lines += [f"{a},{b}" for a, b in self.edges]
+        lines.append(f"{self.start},{self.color}")
+        return "\n".join(lines) + "\n"
+
+    def without_edges(self, drop):
+        return Case(
+            self.width,
+            self.height,
+            self.vertices,
+            [edge for i, edge in enumerate(self.edges) if i not in drop],
+            self.start,
+            self.color,
+        )
+
+    def without_vertex(self, removed):
+        remap = {}
+        vertices = []
+        for old, vertex in enumerate(self.vertices):
+            if old != removed:
+                remap[old] = len(vertices)
+                vertices.append(vertex)
+        edges = [
+            (remap[a], remap[b]) for a, b in self.edges if a != removed and b != removed
+        ]
+        return Case(self.width, self.height, vertices, edges, remap[self.start], self.color)
+
+
+def grid_case(rng, width, height, num_colors):
+    """A full 4-neighbor grid with few colors, so regions are large."""
+    palette = rng.sample(list(COLOR_DICT), num_colors)
+    vertices = [
+        (x, y, rng.choice(palette)) for y in range(height) for x in range(width)
+    ]
+    edges = []
+    for y in range(height):
+        for x in range(width):
+            index = y * width + x
+            if x + 1 < width:
+                edges.append((index, index + 1))
+            if y + 1 < height:
+                edges.append((index, index + width))
+    rng.shuffle(edges)
+    color = rng.choice(list(COLOR_DICT))
+    return Case(width, height, vertices, edges, rng.randrange(len(vertices)), color)
+
+
+def random_case(rng, num_vertices, num_edges, num_colors):
+    """A non-grid graph with random edges, duplicates and self-loops."""
+    width = height = int(num_vertices**0.5) + 2
+    cells = rng.sample(range(width * height), num_vertices)
+    palette = rng.sample(list(COLOR_DICT), num_colors)
+    vertices = [(cell % width, cell // width, rng.choice(palette)) for cell in cells]
+    edges = [
+        (rng.randrange(num_vertices), rng.randrange(num_vertices))
+        for _ in range(num_edges)
+    ]
+    edges += rng.sample(edges, min(len(edges), num_edges // 10))
+    color = rng.choice(list(COLOR_DICT))
+    return Case(width, height, vertices, edges, rng.randrange(num_vertices), color)
+
+
+def reference(case, method):
+    """Run the reference fill; return (final colors, visit order)."""
+    graph, start, color = create_graph(case.to_text())
+    output = io.StringIO()
+    with redirect_stdout(output):
+        getattr(graph, method)(start, color)
+    order = [
+        int(line[len("Visited vertex ") :])
+        for line in output.getvalue().split("\n")
+        if line.startswith("Visited vertex ")
+    ]
+    return [vertex.color for vertex in graph.vertices], order
+
+
+def reference_distances(case, order):
+    """BFS distance of every vertex visited in the reference BFS order."""
+    graph, _, _ = create_graph(case.to_text())
+    distances = {}
+    for index in order:
+        earlier = [distances[n] for n in graph.vertices[index].edges if n in distances]
+        distances[index] = min(earlier) + 1 if earlier else 0
+    return distances
+
+
+def is_grid(case):
+    """Return True if the case's edges are exactly the 4-neighbor grid of its pixels."""
+    index_of = {(x, y): index for index, (x, y, _) in enumerate(case.vertices)}
+    grid = set()
+    for (x, y), index in index_of.items():
+        for neighbor in (index_of.get((x + 1, y)), index_of.get((x, y + 1))):
+            if neighbor is not None:
+                grid.add((index, neighbor))
+    return {(min(a, b), max(a, b)) for a, b in case.edges} == grid
+
+
+def fill_tiled(graph, start, color):
+    vertex = graph.vertices[start]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "case.tiles")
+        with TiledColorStore.from_image_graph(graph, path, tile_size=8) as store:
+            store.fill(vertex.x, vertex.y, color)
+            return [store.get(v.x, v.y) for v in graph.vertices]
+
+
+def fill_store(store_class):
+    def fill(graph, start, color):
+        vertex = graph.vertices[start]
+        store = store_class.from_image_graph(graph)
+        store.fill(vertex.x, vertex.y, color)
+        return [store.get(v.x, v.y) for v in graph.vertices]
+
+    return fill
+
+
+def fill_shared(graph, start, color):
+    with SharedGraph.publish(graph) as shared:
+        shared.fill(start, color)
+        shared.pull_colors(graph)
+
+
+# Adapters for the fills outside ENGINES; grid adapters return the final colors.
+GRAPH_ADAPTERS = {
+    "shared": fill_shared,
+    "concurrent": lambda graph, start, color: ConcurrentFiller(graph, 8).fill(start, color),
+    "multi": lambda graph, start, color: graph.multi_fill([start], color),
+}
+GRID_ADAPTERS = {
+    "tiled": fill_tiled,
+    "rle": fill_store(RLEImage),
+    "quadtree": fill_store(QuadTreeColorStore),
+}
+
+
+def check_engine(name, case):
+    """
+    Compare one engine with the reference on a case.
+
+    post: returns None if they agree, otherwise a description of the mismatch.
+    """
+    method = "dfs" if name.endswith("dfs") else "bfs"
+    expected_colors, expected_order = reference(case, method)
+    graph, start, color = create_graph(case.to_text())
+
+    if name.startswith("task-"):
+        task = FillTask(graph, start, color, method)
+        task.run()
+        order = [vertex.index for vertex, _, _ in task._changes]
+        if order != expected_order:
+            return f"visit order {order} != reference {expected_order}"
+    elif name == "levels":
+        unchanged = graph.vertices[start].color == color
+        level_offsets, order = bfs_levels(graph, start, color)
+        if unchanged:
+            level_offsets, order = [0], []
+        distances = reference_distances(case, expected_order)
+        for level in range(len(level_offsets) - 1):
+            for index in order[level_offsets[level] : level_offsets[level + 1]]:
+                if distances.get(index) != level:
+                    return f"vertex {index} at level {level}, reference {distances.get(index)}"
+    elif name in GRAPH_ADAPTERS:
+        GRAPH_ADAPTERS[name](graph, start, color)
+    elif name in GRID_ADAPTERS:
+        if not is_grid(case):
+            return None
+        colors = GRID_ADAPTERS[name](graph, start, color)
+    else:
+        ENGINES[name](graph, start, color)
+
+    if name not in GRID_ADAPTERS:
+        colors = [vertex.color for vertex in graph.vertices]
+    if colors != expected_colors:
+        wrong = [i for i, (a, b) in enumerate(zip(colors, expected_colors)) if a != b]
+        return f"colors differ at vertices {wrong[:10]}"
+    return None
+
+
+def shrink(case, fails):
+    """
+    Greedily shrink a failing case while fails(case) stays true.
+
+    Halving chunks of edges are dropped first, then single vertices.
+    """
+    chunk = max(1, len(case.edges) // 2)
+    while chunk >= 1:
+        position = 0
+        while position < len(case.edges):
+            smaller = case.without_edges(set(range(position, position + chunk)))
+            if fails(smaller):
+                case = smaller
+            else:
+                position += chunk
+        chunk //= 2
+
+    removed_any = True
+    while removed_any:
+        removed_any = False
+        for index in range(len(case.vertices) - 1, -1, -1):
+            if index == case.start or index >= len(case.vertices):
+                continue
+            smaller = case.without_vertex(index)
+            if fails(smaller):
+                case = smaller
+                removed_any = True
+    return case
+
+
+def save_failure(case, label):
+    """Write a case as an .in file and return its path."""
+    directory = os.environ.get("CONFORMANCE_FAILURE_DIR", tempfile.gettempdir())
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"conformance_{label}.in")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(case.to_text())
+    return path
+
+
+ENGINE_NAMES = (
+    ["task-bfs", "task-dfs"]
+    + [name for name in ENGINES if name not in ("bfs", "dfs")]
+    + list(GRAPH_ADAPTERS)
+)
+
+
+class TestConformance(unittest.TestCase):
+    """Differential engine Test Suite"""
+
+    def check_cases(self, make_case, label, names=ENGINE_NAMES):
+        for seed in SEEDS:
+            case = make_case(random.Random(seed))
+            for name in names:
+                problem = check_engine(name, case)
+                if problem is not None:
+                    minimal = shrink(case, lambda c, n=name: check_engine(n, c) is not None)
+                    path = save_failure(minimal, f"{label}_{name}_{seed}")
+                    self.fail(f"{name} on {label} seed {seed}: {problem}; minimal case: {path}")
+
+    def test_grid_graphs(self):
+        """Test every engine on seeded grid images."""
+        self.check_cases(
+            lambda rng: grid_case(rng, 40 * SCALE, 25 * SCALE, rng.randint(2, 3)),
+            "grid",
+            ENGINE_NAMES + list(GRID_ADAPTERS),
+        )
+
+    def test_random_graphs(self):
+        """Test every engine on seeded non-grid graphs."""
+        self.check_cases(
+            lambda rng: random_case(rng, 800 * SCALE, 1600 * SCALE, rng.randint(1, 3)),
+            "random",
+        )
+
+    def test_shrink_finds_minimal_case(self):
+        """Test the shrinker on an engine that never recolors the last vertex."""
+
+        def fails(case):
+            graph, start, color = create_graph(case.to_text())
+            ENGINES["bfs"](graph, start, color)
+            expected = [vertex.color for vertex in graph.vertices]
+            return len(case.vertices) > 1 and expected[-1] == color != case.vertices[-1][2]
+
+        case = grid_case(random.Random(1), 8, 8, 1)
+        case.start = 0
+        case.color = "red" if case.vertices[0][2] != "red" else "blue"
+        self.assertTrue(fails(case))
+        minimal = shrink(case, fails)
+        self.assertEqual(len(minimal.vertices), 2)
+        self.assertEqual(len(minimal.edges), 1)
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ["CONFORMANCE_FAILURE_DIR"] = directory
+            try:
+                path = save_failure(minimal, "selftest")
+            finally:
+                del os.environ["CONFORMANCE_FAILURE_DIR"]
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(create_graph(f.read())[1], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+import bfs_output
+from engines import ENGINES, bfs_levels, distance_map, fill, np
+from fixtures import load_graph
+
+
+class TestBfsLevels(unittest.TestCase):
+    """bfs_levels Test Suite"""
+
+    def test_levels_match_bfs_output(self):
+        """Test every level matches the expected BFS levels."""
+        for name in ("chess", "f1", "flags", "heart", "horns", "small"):
+            graph, start, color = load_graph(name + ".in")
+            level_offsets, order = bfs_levels(graph, start, color)
+            levels = [
+                sorted(order[level_offsets[d] : level_offsets[d + 1]])
+                for d in range(len(level_offsets) - 1)
+            ]
+            expected = [sorted(level) for level in getattr(bfs_output, name + "_levels")]
+            self.assertEqual(levels, expected, name)
+            for vertex_index in order:
+                self.assertEqual(graph.vertices[vertex_index].color, color)
+
+    def test_distance_map(self):
+        """Test the per-vertex distance expansion."""
+        graph, start, _ = load_graph("f1.in")
+        level_offsets, order = bfs_levels(graph, start)
+        distances = distance_map(level_offsets, order, len(graph.vertices))
+        self.assertEqual(distances[78], 0)
+        self.assertEqual((distances[77], distances[79], distances[76]), (1, 1, 2))
+        self.assertEqual(distances[0], -1)
+
+
+class TestEngines(unittest.TestCase):
+    """fill engine Test Suite"""
+
+    def check_engine(self, engine):
+        for name in ("f1", "flags", "heart", "horns", "small", "spiral", "tower"):
+            expected, start, color = load_graph(name + ".in")
+            expected_count = expected.bfs(start, color, verbose=False)
+            graph, _, _ = load_graph(name + ".in")
+            self.assertEqual(fill(graph, start, color, engine), expected_count, name)
+            self.assertEqual(
+                [vertex.color for vertex in graph.vertices],
+                [vertex.color for vertex in expected.vertices],
+                name,
+            )
+
+    def test_levels_engine(self):
+        """Test the pure-Python engine matches bfs."""
+        self.check_engine("levels")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_engine(self):
+        """Test the NumPy engine matches bfs."""
+        self.check_engine("numpy")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_caches(self):
+        """Test the NumPy arrays are reused across fills and dropped on changes."""
+        graph, start, color = load_graph("flags.in")
+        fill(graph, start, color, "numpy")
+        arrays = graph._csr_arrays
+        codes = graph._color_codes[1]
+        fill(graph, start, "cyan" if color != "cyan" else "red", "numpy")
+        self.assertIs(graph._csr_arrays, arrays)
+        self.assertIs(graph._color_codes[1], codes)
+
+        graph.bfs(start, color, verbose=False)
+        self.assertIsNone(graph._color_codes)
+        expected, _, _ = load_graph("flags.in")
+        expected.bfs(start, color, verbose=False)
+        self.assertEqual(fill(graph, 0, "yellow", "numpy"), expected.bfs(0, "yellow", verbose=False))
+        graph.add_edge(0, len(graph.vertices) - 1)
+        self.assertIsNone(graph._csr_arrays)
+
+    def test_switching_engines(self):
+        """Test fills with every engine in turn on one graph match bfs."""
+        graph, _, _ = load_graph("small.in")
+        expected, _, _ = load_graph("small.in")
+        names = [name for name in ENGINES if name != "bfs"]
+        for step, color in enumerate(["blue", "green", "red", "cyan", "blue", "white"] * 2):
+            name = names[step % len(names)]
+            self.assertEqual(
+                fill(graph, 0, color, name), expected.bfs(0, color, verbose=False), name
+            )
+        if np is not None:
+            fill(graph, 0, "blue", "regions")
+            fill(graph, 0, "green", "numpy")
+            expected.bfs(0, "blue", verbose=False)
+            expected.bfs(0, "green", verbose=False)
+            for target in (graph, expected):
+                target.remove_vertex(len(target.vertices) - 1)
+                target.add_vertex(0, 0, "green")
+            self.assertEqual(
+                fill(graph, 0, "red", "numpy"), expected.bfs(0, "red", verbose=False)
+            )
+        self.assertEqual(
+            [vertex.color for vertex in graph.vertices],
+            [vertex.color for vertex in expected.vertices],
+        )
+
+    def test_auto_engine(self):
+        """Test auto picks an available engine and unknown names are rejected."""
+        self.check_engine("auto")
+        self.assertEqual("numpy" in ENGINES, np is not None)
+        with self.assertRaises(ValueError):
+            fill(None, 0, "red", "gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
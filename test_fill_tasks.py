@@ -0,0 +1,67 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from fill_tasks import FillScheduler, FillTask
+from fixtures import load_graph
+
+
+class TestFillTask(unittest.TestCase):
+    """FillTask Test Suite"""
+
+    def test_steps_match_bfs(self):
+        """Test a stepped fill ends with the same colors as bfs."""
+        graph, start, color = load_graph("horns.in")
+        expected, _, _ = load_graph("horns.in")
+        with redirect_stdout(io.StringIO()):
+            expected.bfs(start, color)
+        task = FillTask(graph, start, color)
+        counts = list(task.steps(5))
+        self.assertTrue(task.done)
+        self.assertEqual(counts[-1], task.recolored)
+        self.assertTrue(all(count <= 5 * (i + 1) for i, count in enumerate(counts)))
+        self.assertEqual(
+            [vertex.color for vertex in graph.vertices],
+            [vertex.color for vertex in expected.vertices],
+        )
+
+    def test_cancel_rolls_back(self):
+        """Test cancelling a partial dfs restores the original colors."""
+        graph, start, color = load_graph("heart.in")
+        before = [vertex.color for vertex in graph.vertices]
+        task = FillTask(graph, start, color, "dfs")
+        self.assertFalse(task.run(max_vertices=10))
+        self.assertEqual(task.recolored, 10)
+        task.cancel()
+        self.assertTrue(task.run())
+        self.assertEqual([vertex.color for vertex in graph.vertices], before)
+
+    def test_scheduler_interleaves(self):
+        """Test the scheduler finishes fills on separate regions of one graph."""
+        graph, _, _ = load_graph("flags.in")
+        scheduler = FillScheduler()
+        first = scheduler.add(FillTask(graph, 0, "white"))
+        second = scheduler.add(FillTask(graph, 29, "black", "dfs"))
+        self.assertEqual(scheduler.run_round(max_vertices=1), 2)
+        scheduler.run(max_vertices=1)
+        self.assertTrue(first.done and second.done)
+        self.assertEqual(graph.vertices[0].color, "white")
+        self.assertEqual(graph.vertices[29].color, "black")
+
+    def test_empty_budgets_refused(self):
+        """Test budgets that could never make progress raise instead of looping."""
+        graph, start, color = load_graph("heart.in")
+        task = FillTask(graph, start, color)
+        with self.assertRaises(ValueError):
+            next(task.steps(0))
+        with self.assertRaises(ValueError):
+            task.run(max_vertices=0)
+        scheduler = FillScheduler()
+        scheduler.add(task)
+        with self.assertRaises(ValueError):
+            scheduler.run(max_vertices=0)
+        self.assertEqual(task.recolored, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
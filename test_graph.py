@@ -1,12 +1,18 @@
 import unittest
 import sys
 import io
+import random
 from contextlib import redirect_stdout
 
 import bfs_output
-from graph import create_graph
-from graph_lists import all_lists_dict
-from graph_matrix import all_matrix_dict
+from graph import (
+    COLOR_DICT,
+    GraphValidationError,
+    create_graph,
+    grid_graph,
+    normalize_edges,
+)
+from fixtures import all_lists_dict, all_matrix_dict
 
 
 def create_adjacency_list(img_graph):
@@ -208,6 +214,249 @@ class TestAdjacencyMatrix(unittest.TestCase):
             self.assertEqual(student_adjancey_matrix, all_matrix_dict["small"])
 
 
+class TestAdjacencyMatrixWriter(unittest.TestCase):
+    """write_adjacency_matrix Test Suite"""
+
+    def test_adjacency_matrix_writer_1(self):
+        """Test the list format matches print(row) on every matrix."""
+        for name in all_matrix_dict:
+            with open(name + ".in", encoding="utf-8") as f:
+                actual_graph, _, _ = create_graph(f.read())
+            output = io.StringIO()
+            actual_graph.write_adjacency_matrix(output)
+            expected = "".join(str(row) + "\n" for row in all_matrix_dict[name])
+            self.assertEqual(output.getvalue(), expected)
+
+    def test_adjacency_matrix_writer_2(self):
+        """Test the sparse and bit-packed formats on the small graph."""
+        with open("small.in", encoding="utf-8") as f:
+            actual_graph, _, _ = create_graph(f.read())
+        self.assertEqual(
+            list(actual_graph.iter_adjacency_rows("sparse")),
+            ["0: 1", "1: 0 2 3", "2: 1 4", "3: 1 4", "4: 2 3"],
+        )
+        self.assertEqual(
+            list(actual_graph.iter_adjacency_rows("bits")),
+            ["40", "b0", "48", "48", "30"],
+        )
+
+
+class TestAdjacencyMatrixCache(unittest.TestCase):
+    """adjacency_matrix cache Test Suite"""
+
+    def test_adjacency_matrix_cache_1(self):
+        """Test the view matches the matrix and survives fills."""
+        with open("heart.in", encoding="utf-8") as f:
+            actual_graph, search_start, search_color = create_graph(f.read())
+        view = actual_graph.adjacency_matrix()
+        self.assertEqual([list(row) for row in view], all_matrix_dict["heart"])
+        self.assertEqual(view[0, 1], 1)
+        self.assertEqual(view.neighbors(45), [36, 46, 54])
+        actual_graph.bfs(search_start, search_color, verbose=False)
+        self.assertIs(actual_graph.adjacency_matrix(), view)
+        with self.assertRaises(TypeError):
+            view[0] = (0,) * len(view)
+
+    def test_adjacency_matrix_cache_2(self):
+        """Test add_edge invalidates the cached view and CSR arrays."""
+        with open("small.in", encoding="utf-8") as f:
+            actual_graph, _, _ = create_graph(f.read())
+        view = actual_graph.adjacency_matrix()
+        csr = actual_graph.to_csr()
+        actual_graph.vertices[0].add_edge(4)
+        self.assertIsNot(actual_graph.to_csr(), csr)
+        updated = actual_graph.adjacency_matrix()
+        self.assertIsNot(updated, view)
+        self.assertEqual((updated[0, 4], updated[4, 0], view[0, 4]), (1, 1, 0))
+        self.assertEqual(actual_graph.create_adjacency_matrix()[4][0], 1)
+
+
+class TestEdgeMutation(unittest.TestCase):
+    """ImageGraph edge/vertex mutation Test Suite"""
+
+    def test_edge_mutation_1(self):
+        """Test add_edge/remove_edge refuse duplicates and patch the cached view."""
+        with open("small.in", encoding="utf-8") as f:
+            actual_graph, _, _ = create_graph(f.read())
+        view = actual_graph.adjacency_matrix()
+        self.assertFalse(actual_graph.add_edge(1, 0))
+        self.assertFalse(actual_graph.add_edge(2, 2))
+        self.assertTrue(actual_graph.add_edge(0, 4))
+        self.assertTrue(actual_graph.remove_edge(2, 1))
+        self.assertFalse(actual_graph.remove_edge(1, 2))
+        self.assertIs(actual_graph.adjacency_matrix(), view)
+        self.assertEqual(view.neighbors(0), [1, 4])
+        self.assertEqual(view.neighbors(1), [0, 3])
+        self.assertEqual(sorted(actual_graph.vertices[4].edges), [0, 2, 3])
+
+    def test_edge_mutation_2(self):
+        """Test random mutations keep edges, matrix view and CSR consistent."""
+        rng = random.Random(7)
+        with open("heart.in", encoding="utf-8") as f:
+            actual_graph, _, _ = create_graph(f.read())
+        actual_graph.adjacency_matrix()
+        model = [set(vertex.edges) for vertex in actual_graph.vertices]
+        for _ in range(400):
+            size = len(model)
+            choice = rng.random()
+            if choice < 0.4:
+                a, b = rng.randrange(size), rng.randrange(size)
+                added = actual_graph.add_edge(a, b)
+                self.assertEqual(added, a != b and b not in model[a])
+                if added:
+                    model[a].add(b)
+                    model[b].add(a)
+            elif choice < 0.8:
+                a, b = rng.randrange(size), rng.randrange(size)
+                self.assertEqual(actual_graph.remove_edge(a, b), b in model[a])
+                model[a].discard(b)
+                model[b].discard(a)
+            elif choice < 0.9:
+                index = actual_graph.add_vertex(0, 0, "red")
+                self.assertEqual(index, size)
+                model.append(set())
+            else:
+                index = rng.randrange(size)
+                moved = actual_graph.remove_vertex(index)
+                for neighbor in model[index]:
+                    model[neighbor].discard(index)
+                last = model.pop()
+                if moved is not None:
+                    self.assertEqual(moved, size - 1)
+                    model[index] = last
+                    for neighbor in last:
+                        model[neighbor].discard(moved)
+                        model[neighbor].add(index)
+
+            view = actual_graph.adjacency_matrix()
+            offsets, targets = actual_graph.to_csr()
+            for index, vertex in enumerate(actual_graph.vertices):
+                self.assertEqual(vertex.index, index)
+                self.assertEqual(sorted(vertex.edges), sorted(model[index]))
+                self.assertEqual(view.neighbors(index), sorted(model[index]))
+                self.assertEqual(
+                    sorted(targets[offsets[index] : offsets[index + 1]]),
+                    sorted(model[index]),
+                )
+
+
+class TestMultiFill(unittest.TestCase):
+    """multi_fill Test Suite"""
+
+    def test_multi_fill_1(self):
+        """Test seeds in separate regions match one bfs per seed."""
+        with open("flags.in", encoding="utf-8") as f:
+            data = f.read()
+        seeds = {0: "white", 2: "cyan", 29: "black", 4: "green"}
+        actual_graph, _, _ = create_graph(data)
+        expected_graph, _, _ = create_graph(data)
+        expected = sum(
+            expected_graph.bfs(seed, color, verbose=False) for seed, color in seeds.items()
+        )
+        self.assertEqual(actual_graph.multi_fill(seeds), expected)
+        self.assertEqual(
+            [vertex.color for vertex in actual_graph.vertices],
+            [vertex.color for vertex in expected_graph.vertices],
+        )
+
+    def test_multi_fill_2(self):
+        """Test overlapping seeds fill a region once and split it by distance."""
+        with open("small.in", encoding="utf-8") as f:
+            data = f.read()
+        actual_graph, _, _ = create_graph(data)
+        self.assertEqual(actual_graph.multi_fill([0, 4, 1], "blue"), 5)
+
+        actual_graph, _, _ = create_graph(data)
+        self.assertEqual(actual_graph.multi_fill({0: "blue", 4: "green"}), 5)
+        self.assertEqual(
+            [vertex.color for vertex in actual_graph.vertices],
+            ["blue", "blue", "green", "green", "green"],
+        )
+        with self.assertRaises(ValueError):
+            actual_graph.multi_fill([0])
+
+
+class TestRegionCensus(unittest.TestCase):
+    """region_census Test Suite"""
+
+    @staticmethod
+    def partition(census):
+        return sorted(sorted(members) for members in census.members if members)
+
+    @staticmethod
+    def fresh_partition(graph):
+        graph.colors_changed()
+        return TestRegionCensus.partition(graph.region_census())
+
+    def test_census_1(self):
+        """Test every region matches the vertices a bfs from it recolors."""
+        with open("flags.in", encoding="utf-8") as f:
+            data = f.read()
+        graph, _, _ = create_graph(data)
+        census = graph.region_census()
+        self.assertIs(graph.region_census(), census)
+        for index, vertex in enumerate(graph.vertices):
+            fill_graph, _, _ = create_graph(data)
+            fill_graph.bfs(index, "cyan" if vertex.color != "cyan" else "red", verbose=False)
+            changed = sorted(
+                i
+                for i, (before, after) in enumerate(zip(graph.vertices, fill_graph.vertices))
+                if before.color != after.color
+            )
+            self.assertEqual(sorted(census.members[census.labels[index]]), changed)
+        self.assertEqual(sum(census.sizes), len(graph.vertices))
+        self.assertEqual(sum(census.counts_by_color().values()), census.region_count())
+        self.assertEqual(
+            sum(size * count for size, count in census.size_histogram().items()),
+            len(graph.vertices),
+        )
+
+    def test_census_2(self):
+        """Test fill_region matches bfs and keeps the census exact."""
+        with open("flags.in", encoding="utf-8") as f:
+            data = f.read()
+        actual_graph, _, _ = create_graph(data)
+        expected_graph, _, _ = create_graph(data)
+        census = actual_graph.region_census()
+        rng = random.Random(3)
+        for _ in range(20):
+            start = rng.randrange(len(actual_graph.vertices))
+            color = rng.choice(list(COLOR_DICT))
+            self.assertEqual(
+                actual_graph.fill_region(start, color),
+                expected_graph.bfs(start, color, verbose=False),
+            )
+            self.assertEqual(
+                [vertex.color for vertex in actual_graph.vertices],
+                [vertex.color for vertex in expected_graph.vertices],
+            )
+        self.assertIs(actual_graph.region_census(), census)
+        self.assertEqual(self.partition(census), self.fresh_partition(expected_graph))
+
+    def test_census_3(self):
+        """Test edge mutations patch the census and bfs drops it."""
+        with open("small.in", encoding="utf-8") as f:
+            graph, start, color = create_graph(f.read())
+        census = graph.region_census()
+        self.assertEqual(census.region_count(), 1)
+
+        graph.remove_edge(2, 4)
+        graph.remove_edge(3, 4)
+        self.assertEqual(self.partition(census), [[0, 1, 2, 3], [4]])
+        graph.remove_edge(1, 2)
+        self.assertEqual(self.partition(census), [[0, 1, 3], [2], [4]])
+        graph.add_edge(2, 4)
+        self.assertEqual(self.partition(census), [[0, 1, 3], [2, 4]])
+        graph.add_vertex(4, 4, "red")
+        self.assertEqual(census.region_count(), 3)
+        self.assertIs(graph.region_census(), census)
+        self.assertEqual(self.partition(census), self.fresh_partition(graph))
+
+        census = graph.region_census()
+        graph.bfs(start, color, verbose=False)
+        self.assertIsNot(graph.region_census(), census)
+
+
 class TestBFS(unittest.TestCase):
     """BFS Test Suite"""
 
@@ -448,13 +697,152 @@ class TestDFS(unittest.TestCase):
         self.check_dfs("small.in", visited)
 
 
+class TestNormalizeEdges(unittest.TestCase):
+    """normalize_edges Test Suite"""
+
+    def test_normalize_edges_1(self):
+        """Test duplicate, reversed and self-loop edges are dropped and counted."""
+        offsets, targets, dropped = normalize_edges(
+            4, [0, 1, 2, 1, 3, 2], [1, 0, 3, 2, 3, 1]
+        )
+        self.assertEqual(dropped, 3)
+        self.assertEqual(offsets, [0, 1, 3, 5, 6])
+        self.assertEqual(targets, [1, 0, 2, 1, 3, 2])
+
+    def test_normalize_edges_2(self):
+        """Test create_graph on repeated edge lines keeps sorted unique edges."""
+        with open("small.in", encoding="utf-8") as f:
+            data = f.read()
+        lines = data.strip().split("\n")
+        lines[7] = "8"
+        lines[13:13] = ["1,0", "4,3", "2,2"]
+        actual_graph, _, _ = create_graph("\n".join(lines))
+        self.assertEqual(actual_graph.dropped_edges, 3)
+        result, message = check_graph(
+            create_adjacency_list(actual_graph), all_lists_dict["small"]
+        )
+        self.assertTrue(result, message)
+        self.assertEqual(actual_graph.vertices[1].edges, [0, 2, 3])
+
+
+class TestGridGraph(unittest.TestCase):
+    """grid_graph Test Suite"""
+
+    def test_grid_graph_1(self):
+        """Test row-major numbering, missing pixels and 4-neighbor edges."""
+        graph = grid_graph(3, 2, iter([["red", None, "blue"], ["red", "red", "blue"]]))
+        self.assertEqual((graph.width, graph.height), (3, 2))
+        self.assertEqual(
+            [(vertex.x, vertex.y, vertex.color) for vertex in graph.vertices],
+            [(0, 0, "red"), (2, 0, "blue"), (0, 1, "red"), (1, 1, "red"), (2, 1, "blue")],
+        )
+        self.assertEqual(
+            [sorted(vertex.edges) for vertex in graph.vertices],
+            [[2], [4], [0, 3], [2, 4], [1, 3]],
+        )
+
+
+class TestValidateGraph(unittest.TestCase):
+    """create_graph(validate=True) Test Suite"""
+
+    def test_validate_graph_1(self):
+        """Test that every valid color input passes validation."""
+        for filename in ("chess.in", "f1.in", "flags.in", "heart.in", "small.in"):
+            with open(filename, encoding="utf-8") as f:
+                actual_graph, _, _ = create_graph(f.read(), validate=True)
+            self.assertTrue(actual_graph.vertices)
+
+    def test_validate_graph_2(self):
+        """Test that all bad records are reported together."""
+        data = "\n".join(
+            [
+                "3",
+                "4",
+                "0,0,red",
+                "3,1,blue",
+                "0,0,green",
+                "1,1,purple",
+                "2",
+                "0,1",
+                "2,7",
+                "9,orange",
+            ]
+        )
+        with self.assertRaises(GraphValidationError) as context:
+            create_graph(data, validate=True)
+        self.assertEqual(len(context.exception.errors), 6)
+        message = str(context.exception)
+        self.assertIn("vertex 1: (3, 1) is outside the 3x3 image", message)
+        self.assertIn("vertex 2: (0, 0) duplicates vertex 0", message)
+        self.assertIn("vertex 3: purple is not a valid color", message)
+        self.assertIn("fill color: orange is not a valid color", message)
+        self.assertIn("edge 1: (2, 7) references a vertex outside 0-3", message)
+        self.assertIn("start index: 9 is outside 0-3", message)
+
+    def test_validate_graph_3(self):
+        """Test out-of-bounds coordinates are not reported as duplicates."""
+        for first, second in (("3,0", "0,1"), ("-1,1", "2,0")):
+            data = "\n".join(
+                ["3", "2", first + ",red", second + ",red", "0", "0,blue"]
+            )
+            with self.assertRaises(GraphValidationError) as context:
+                create_graph(data, validate=True)
+            self.assertEqual(len(context.exception.errors), 1)
+            self.assertIn("outside the 3x3 image", context.exception.errors[0])
+
+
+class TestRectangularImage(unittest.TestCase):
+    """width x height image Test Suite"""
+
+    BANNER = "\n".join(
+        ["5,2", "3", "4,0,red", "4,1,red", "0,1,blue", "1", "0,1", "0,green"]
+    )
+
+    def test_rectangular_image_1(self):
+        """Test a width,height header sizes the graph and print_image."""
+        actual_graph, search_start, search_color = create_graph(
+            self.BANNER, validate=True
+        )
+        self.assertEqual((actual_graph.width, actual_graph.height), (5, 2))
+        self.assertEqual(actual_graph.image_size, 5)
+        self.assertEqual((search_start, search_color), (0, "green"))
+
+        print_output = io.StringIO()
+        with redirect_stdout(print_output):
+            actual_graph.print_image()
+        rows = print_output.getvalue().split("\n")[:2]
+        self.assertEqual([row.count("\u2588") for row in rows], [10, 10])
+
+    def test_rectangular_image_2(self):
+        """Test the single-number header still gives a square image."""
+        with open("small.in", encoding="utf-8") as f:
+            actual_graph, _, _ = create_graph(f.read())
+        self.assertEqual((actual_graph.width, actual_graph.height), (5, 5))
+
+    def test_rectangular_image_3(self):
+        """Test validation uses the true width and height."""
+        with self.assertRaises(GraphValidationError) as context:
+            create_graph(self.BANNER.replace("0,1,blue", "0,2,blue"), validate=True)
+        self.assertEqual(
+            context.exception.errors, ["vertex 2: (0, 2) is outside the 5x2 image"]
+        )
+
+
 def main():
     """Main function to run tests based on command-line arguments."""
     test_cases = {
         "graph": TestCreateGraph,
         "matrix": TestAdjacencyMatrix,
+        "writer": TestAdjacencyMatrixWriter,
+        "cache": TestAdjacencyMatrixCache,
+        "mutation": TestEdgeMutation,
+        "multi": TestMultiFill,
+        "census": TestRegionCensus,
         "bfs": TestBFS,
         "dfs": TestDFS,
+        "normalize": TestNormalizeEdges,
+        "validate": TestValidateGraph,
+        "rectangle": TestRectangularImage,
     }
 
     usage_string = (
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from benchmark import make_grid_image
+from graph import COLOR_DICT, create_graph
+from quadtree import QuadTreeColorStore
+
+
+def colors_by_position(graph):
+    return {(vertex.x, vertex.y): vertex.color for vertex in graph.vertices}
+
+
+class TestQuadTreeColorStore(unittest.TestCase):
+    """QuadTreeColorStore Test Suite"""
+
+    def test_round_trip(self):
+        """Test conversion to and from ImageGraph keeps colors and grid edges."""
+        with open("small.in", encoding="utf-8") as f:
+            graph, _, _ = create_graph(f.read())
+        store = QuadTreeColorStore.from_image_graph(graph)
+        self.assertEqual(store.size, 8)
+        self.assertEqual(store.get(3, 2), "red")
+        self.assertIsNone(store.get(0, 0))
+        with self.assertRaises(IndexError):
+            store.get(5, 0)
+
+        rebuilt = store.to_image_graph()
+        self.assertEqual(colors_by_position(rebuilt), colors_by_position(graph))
+        self.assertEqual(
+            sorted(sorted(vertex.edges) for vertex in rebuilt.vertices),
+            sorted(sorted(vertex.edges) for vertex in graph.vertices),
+        )
+
+    def test_set_collapses(self):
+        """Test setting pixels splits leaves and restoring them collapses again."""
+        store = QuadTreeColorStore(6, 5, "white")
+        leaves = store.leaf_count()
+        store.set(2, 3, "red")
+        self.assertEqual(store.get(2, 3), "red")
+        self.assertEqual(store.get(3, 3), "white")
+        self.assertGreater(store.leaf_count(), leaves)
+        store.set(2, 3, "white")
+        self.assertEqual(store.leaf_count(), leaves)
+        self.assertEqual(
+            sum(size * size for _, _, size, color in store.leaves() if color), 6 * 5
+        )
+
+    def test_fill_matches_bfs(self):
+        """Test random fills on a block image match bfs on the grid graph."""
+        graph, _ = make_grid_image(40, 36, block=8, seed=4)
+        store = QuadTreeColorStore.from_image_graph(graph)
+        rng = random.Random(9)
+        for _ in range(30):
+            vertex = graph.vertices[rng.randrange(len(graph.vertices))]
+            color = rng.choice(list(COLOR_DICT))
+            self.assertEqual(
+                store.fill(vertex.x, vertex.y, color),
+                graph.bfs(vertex.index, color, verbose=False),
+            )
+            self.assertEqual(
+                store.leaf_count(),
+                QuadTreeColorStore.from_image_graph(graph).leaf_count(),
+            )
+        self.assertEqual(
+            colors_by_position(store.to_image_graph()), colors_by_position(graph)
+        )
+
+    def test_fill_touches_boundary_only(self):
+        """Test a fill on a mostly uniform canvas visits few nodes."""
+        store = QuadTreeColorStore(1024, 1024, "white")
+        for x in range(500, 520):
+            store.set(x, 700, "red")
+        self.assertEqual(store.fill(0, 0, "blue"), 1024 * 1024 - 20)
+        self.assertLess(store.node_visits, 5000)
+        self.assertEqual(store.get(510, 700), "red")
+        self.assertEqual(store.get(1023, 1023), "blue")
+        self.assertEqual(store.fill(0, 0, "blue"), 0)
+        with self.assertRaises(ValueError):
+            store.fill(0, 0, "purple")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from fixtures import load_graph
+from graph import COLOR_DICT
+from rag import RegionAdjacencyGraph
+
+
+def colors(graph):
+    return [vertex.color for vertex in graph.vertices]
+
+
+class TestRegionAdjacencyGraph(unittest.TestCase):
+    """RegionAdjacencyGraph Test Suite"""
+
+    def check_links(self, rag):
+        """Every node's neighbors match a rebuild from the pixel graph."""
+        fresh = RegionAdjacencyGraph(rag.graph)
+        census = rag.census
+        relabel = {}
+        for label in rag.regions():
+            relabel[label] = fresh.region_of(census.members[label][0])
+        self.assertEqual(len(relabel), len(fresh.regions()))
+        for label, fresh_label in relabel.items():
+            self.assertEqual(
+                sorted(relabel[n] for n in rag.neighbors[label]),
+                fresh.neighbors_of(fresh_label),
+            )
+
+    def test_build(self):
+        """Test nodes are the census regions and edges join touching regions."""
+        graph, _, _ = load_graph("flags.in")
+        rag = RegionAdjacencyGraph(graph)
+        for vertex in graph.vertices:
+            label = rag.region_of(vertex.index)
+            self.assertEqual(rag.color(label), vertex.color)
+            for neighbor in vertex.edges:
+                other = rag.region_of(neighbor)
+                if other != label:
+                    self.assertIn(other, rag.neighbors_of(label))
+                    self.assertNotEqual(rag.color(other), vertex.color)
+        self.assertEqual(sum(rag.size(label) for label in rag.regions()), len(graph.vertices))
+
+    def test_fill_matches_bfs(self):
+        """Test random fills match bfs and keep the adjacency exact."""
+        actual_graph, _, _ = load_graph("flags.in")
+        expected_graph, _, _ = load_graph("flags.in")
+        rag = RegionAdjacencyGraph(actual_graph)
+        rng = random.Random(5)
+        for _ in range(25):
+            start = rng.randrange(len(actual_graph.vertices))
+            color = rng.choice(list(COLOR_DICT))
+            self.assertEqual(
+                rag.fill(start, color), expected_graph.bfs(start, color, verbose=False)
+            )
+            self.assertEqual(colors(actual_graph), colors(expected_graph))
+            self.check_links(rag)
+
+    def test_region_operations(self):
+        """Test merging into the largest neighbor and filling touching regions."""
+        graph, _, _ = load_graph("flags.in")
+        expected_graph, _, _ = load_graph("flags.in")
+        rag = RegionAdjacencyGraph(graph)
+        label = min(rag.regions(), key=rag.size)
+        neighbors = rag.neighbors_of(label)
+        largest = max(neighbors, key=lambda n: (rag.size(n), -n))
+        expected_size = rag.size(label) + rag.size(largest)
+        merged = rag.merge_into_largest_neighbor(label)
+        self.assertGreaterEqual(rag.size(merged), expected_size)
+        self.check_links(rag)
+
+        graph, _, _ = load_graph("flags.in")
+        rag = RegionAdjacencyGraph(graph)
+        label = rag.region_of(0)
+        starts = [rag.census.members[n][0] for n in rag.neighbors_of(label)]
+        expected = sum(expected_graph.bfs(s, "cyan", verbose=False) for s in starts)
+        self.assertEqual(rag.fill_touching(label, "cyan"), expected)
+        self.assertEqual(colors(graph), colors(expected_graph))
+        self.check_links(rag)
+
+    def test_rebuild_after_outside_changes(self):
+        """Test changes made through the ImageGraph are picked up."""
+        graph, start, color = load_graph("small.in")
+        rag = RegionAdjacencyGraph(graph)
+        self.assertEqual(len(rag.regions()), 1)
+        graph.remove_edge(2, 4)
+        graph.remove_edge(3, 4)
+        self.assertEqual(len(rag.regions()), 2)
+        graph.bfs(start, color, verbose=False)
+        self.assertEqual(rag.neighbors_of(rag.region_of(4)), [])
+        self.assertEqual(rag.fill(4, color), 1)
+
+        single = rag.region_of(4)
+        graph.add_edge(2, 4)
+        self.assertNotEqual(rag.region_of(4), single)
+        with self.assertRaises(ValueError):
+            rag.fill_label(single, "red")
+
+
+if __name__ == "__main__":
+    unittest.main()
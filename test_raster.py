@@ -0,0 +1,104 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from graph import create_graph
+from raster import (
+    FillProgress,
+    FrameSink,
+    RasterError,
+    load_pnm,
+    nearest_color,
+    pnm_bytes,
+    read_pnm_header,
+)
+
+
+def make_pnm(magic, width, height, maxval, samples):
+    """Build an in-memory binary PNM file from a flat list of samples."""
+    header = f"{magic}\n# test image\n{width} {height}\n{maxval}\n".encode("ascii")
+    if maxval < 256:
+        body = bytes(samples)
+    else:
+        body = b"".join(sample.to_bytes(2, "big") for sample in samples)
+    return io.BytesIO(header + body)
+
+
+class TestLoadPnm(unittest.TestCase):
+    """load_pnm Test Suite"""
+
+    def test_load_ppm_grid(self):
+        """Test a 3x2 PPM: vertices, quantized colors and 4-neighbor edges."""
+        samples = [
+            250, 10, 10,   0, 0, 240,   255, 255, 255,
+            250, 10, 10,   5, 250, 5,   30, 30, 30,
+        ]
+        graph = load_pnm(make_pnm("P6", 3, 2, 255, samples))
+        self.assertEqual(len(graph.vertices), 6)
+        self.assertEqual(
+            [vertex.color for vertex in graph.vertices],
+            ["red", "blue", "white", "red", "green", "black"],
+        )
+        self.assertEqual((graph.vertices[4].x, graph.vertices[4].y), (1, 1))
+        self.assertEqual(graph.vertices[0].edges, [1, 3])
+        self.assertEqual(graph.vertices[4].edges, [1, 3, 5])
+        self.assertEqual((graph.width, graph.height), (3, 2))
+
+    def test_load_pgm_maxval(self):
+        """Test a 16-bit PGM: samples are scaled by maxval before quantizing."""
+        graph = load_pnm(make_pnm("P5", 2, 1, 1000, [1000, 20]))
+        self.assertEqual([vertex.color for vertex in graph.vertices], ["white", "black"])
+
+    def test_load_truncated(self):
+        """Test that a truncated raster is reported."""
+        with self.assertRaises(RasterError):
+            load_pnm(make_pnm("P6", 2, 2, 255, [0] * 9))
+
+    def test_nearest_color(self):
+        """Test palette quantization."""
+        self.assertEqual(nearest_color(200, 200, 40), "yellow")
+        self.assertEqual(nearest_color(20, 220, 230), "cyan")
+
+
+class TestWritePpm(unittest.TestCase):
+    """pnm_bytes/FillProgress Test Suite"""
+
+    def test_round_trip(self):
+        """Test that an exported graph loads back with the same colors."""
+        with open("flags.in", encoding="utf-8") as f:
+            graph, _, _ = create_graph(f.read())
+        loaded = load_pnm(io.BytesIO(pnm_bytes(graph)))
+        for vertex in graph.vertices:
+            index = vertex.y * graph.width + vertex.x
+            self.assertEqual(loaded.vertices[index].color, vertex.color)
+
+    def test_bfs_frames_to_directory(self):
+        """Test that a fill emits every-N frames plus a final frame."""
+        with open("heart.in", encoding="utf-8") as f:
+            graph, start, color = create_graph(f.read())
+        with tempfile.TemporaryDirectory() as frame_dir:
+            progress = FillProgress(FrameSink(frame_dir), every=10)
+            with redirect_stdout(io.StringIO()):
+                graph.bfs(start, color, progress)
+            frames = sorted(os.listdir(frame_dir))
+            self.assertEqual(progress.visits, 29)
+            self.assertEqual(len(frames), 29 // 10 + 1)
+            with open(os.path.join(frame_dir, frames[-1]), "rb") as frame:
+                self.assertEqual(read_pnm_header(frame), ("P6", 9, 9, 255))
+
+    def test_dfs_frames_to_pipe(self):
+        """Test that frames written to a stream are back-to-back PPM images."""
+        with open("small.in", encoding="utf-8") as f:
+            graph, start, color = create_graph(f.read())
+        stream = io.BytesIO()
+        with redirect_stdout(io.StringIO()):
+            graph.dfs(start, color, FillProgress(FrameSink(stream), every=2))
+        frame = pnm_bytes(graph)
+        self.assertEqual(stream.getvalue().count(b"P6\n"), 3)
+        self.assertTrue(stream.getvalue().endswith(frame))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from benchmark import make_grid_image
+from graph import COLOR_DICT, create_graph
+from rle import RLEImage, encode_row
+
+
+def colors_by_position(graph):
+    return {(vertex.x, vertex.y): vertex.color for vertex in graph.vertices}
+
+
+class TestRLEImage(unittest.TestCase):
+    """RLEImage Test Suite"""
+
+    def test_encode_row(self):
+        """Test runs join equal neighbors and skip missing pixels."""
+        self.assertEqual(
+            encode_row(["red", "red", None, "red", "blue", "blue"]),
+            [(0, 2, "red"), (3, 1, "red"), (4, 2, "blue")],
+        )
+        self.assertEqual(encode_row([None, None]), [])
+
+    def test_round_trip(self):
+        """Test conversion to and from ImageGraph keeps colors and grid edges."""
+        with open("small.in", encoding="utf-8") as f:
+            graph, _, _ = create_graph(f.read())
+        image = RLEImage.from_image_graph(graph)
+        self.assertEqual(image.rows[1], [(1, 3, "red")])
+        self.assertEqual(image.run_count(), 2)
+        self.assertEqual(image.get(2, 2), "red")
+        self.assertIsNone(image.get(0, 0))
+
+        rebuilt = image.to_image_graph()
+        self.assertEqual(colors_by_position(rebuilt), colors_by_position(graph))
+        self.assertEqual(
+            sorted(sorted(vertex.edges) for vertex in rebuilt.vertices),
+            sorted(sorted(vertex.edges) for vertex in graph.vertices),
+        )
+
+    def test_fill_matches_bfs(self):
+        """Test random fills on a block image match bfs on the grid graph."""
+        graph, _ = make_grid_image(48, 40, block=6, seed=2)
+        image = RLEImage.from_image_graph(graph)
+        runs_before = image.run_count()
+        self.assertLess(runs_before, len(graph.vertices) // 3)
+        rng = random.Random(7)
+        for _ in range(30):
+            vertex = graph.vertices[rng.randrange(len(graph.vertices))]
+            color = rng.choice(list(COLOR_DICT))
+            self.assertEqual(
+                image.fill(vertex.x, vertex.y, color),
+                graph.bfs(vertex.index, color, verbose=False),
+            )
+        self.assertEqual(
+            colors_by_position(image.to_image_graph()), colors_by_position(graph)
+        )
+        self.assertLessEqual(image.run_count(), runs_before)
+
+    def test_fill_errors(self):
+        """Test fills on missing pixels or with unknown colors are refused."""
+        image = RLEImage(3, 1, [[(0, 1, "red"), (2, 1, "red")]])
+        self.assertEqual(image.fill(0, 0, "red"), 0)
+        self.assertEqual(image.fill(0, 0, "blue"), 1)
+        self.assertEqual(image.rows[0], [(0, 1, "blue"), (2, 1, "red")])
+        with self.assertRaises(ValueError):
+            image.fill(1, 0, "blue")
+        with self.assertRaises(ValueError):
+            image.fill(0, 0, "purple")
+
+    def test_caller_runs_are_merged(self):
+        """Test touching same-color runs given by the caller fill as one region."""
+        image = RLEImage(2, 1, [[(1, 1, "red"), (0, 1, "red")]])
+        self.assertEqual(image.rows[0], [(0, 2, "red")])
+        self.assertEqual(image.fill(0, 0, "blue"), 2)
+        self.assertEqual(image.get(1, 0), "blue")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from graph import create_graph
+from server import FillServer, ImageStore, estimate_graph_bytes
+
+
+class TestImageStore(unittest.TestCase):
+    """ImageStore Test Suite"""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used image is evicted over budget."""
+        with open("small.in", encoding="utf-8") as f:
+            graph, _, _ = create_graph(f.read())
+        cost = estimate_graph_bytes(graph)
+        store = ImageStore(cost * 2)
+        store.put("a", graph)
+        store.put("b", graph)
+        store.get("a")
+        store.put("c", graph)
+        self.assertIn("a", store)
+        self.assertNotIn("b", store)
+        self.assertIn("c", store)
+        self.assertEqual(store.total_bytes, cost * 2)
+        self.assertEqual(store.evictions, 1)
+        self.assertEqual(store.put("d", graph), ["a"])
+
+
+class TestFillServer(unittest.IsolatedAsyncioTestCase):
+    """FillServer Test Suite"""
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp.name, "fill.sock")
+        self.server = FillServer(1 << 30)
+        self.task = asyncio.create_task(self.server.serve(self.socket_path))
+        while not os.path.exists(self.socket_path):
+            await asyncio.sleep(0.01)
+        self.reader, self.writer = await asyncio.open_unix_connection(self.socket_path)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.tmp.cleanup()
+
+    async def request(self, line):
+        self.writer.write(line.encode("utf-8") + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def test_load_fill_query(self):
+        """Test a load, fill, query and snapshot round trip."""
+        response = await self.request('{"op": "load", "id": "h", "path": "heart.in"}')
+        self.assertEqual(response, {"ok": True, "vertices": 81, "start": 45, "color": "magenta"})
+        response = await self.request(
+            '{"op": "fill", "id": "h", "start": 45, "color": "magenta", "method": "dfs"}'
+        )
+        self.assertEqual(response, {"ok": True, "recolored": 29})
+        response = await self.request('{"op": "query", "id": "h", "index": 45}')
+        self.assertEqual(response["color"], "magenta")
+        response = await self.request('{"op": "snapshot", "id": "h"}')
+        self.assertEqual(response["colors"].count("magenta"), 29)
+
+    async def test_errors(self):
+        """Test that bad requests are answered with errors."""
+        response = await self.request('{"op": "fill", "id": "missing", "start": 0, "color": "red"}')
+        self.assertFalse(response["ok"])
+        response = await self.request('{"op": "explode"}')
+        self.assertEqual(response, {"ok": False, "error": "Unknown op 'explode'."})
+        response = await self.request("not json")
+        self.assertFalse(response["ok"])
+        await self.request('{"op": "load", "id": "h", "path": "heart.in"}')
+        response = await self.request('{"op": "query", "id": "h", "index": -1}')
+        self.assertEqual(response, {"ok": False, "error": "Index -1 is out of range."})
+        response = await self.request('{"op": "fill", "id": "h", "start": 45, "color": "purple"}')
+        self.assertEqual(response, {"ok": False, "error": "purple is not a valid color!"})
+        response = await self.request('{"op": "fill", "id": "h", "start": 45, "color": " Red "}')
+        self.assertEqual(response, {"ok": True, "recolored": 29})
+
+    async def test_long_lines(self):
+        """Test large inline images load and overlong lines get an error reply."""
+        size = 100
+        lines = [str(size), str(size * size)]
+        lines += [f"{x},{y},red" for y in range(size) for x in range(size)]
+        lines += ["0", "0,blue"]
+        request = json.dumps({"op": "load", "id": "big", "data": "\n".join(lines)})
+        self.assertGreater(len(request), 1 << 16)
+        response = await self.request(request)
+        self.assertEqual(response["vertices"], size * size)
+
+        self.server.max_line_bytes = 1024
+        socket_path = os.path.join(self.tmp.name, "small.sock")
+        task = asyncio.create_task(self.server.serve(socket_path))
+        while not os.path.exists(socket_path):
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        try:
+            writer.write(request.encode("utf-8") + b"\n")
+            writer.write(b'{"op": "stats"}\n')
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            self.assertEqual(
+                response, {"ok": False, "error": "Request line longer than 1024 bytes."}
+            )
+            response = json.loads(await reader.readline())
+            self.assertTrue(response["ok"])
+            self.assertEqual(response["images"], 1)
+        finally:
+            writer.close()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def test_unload_waits_and_locks_are_dropped(self):
+        """Test unload waits for the image's lock and no lock outlives its image."""
+        await self.server.handle_line('{"op": "load", "id": "h", "path": "heart.in"}')
+        async with self.server._locked("h"):
+            unload = asyncio.create_task(self.server.handle_line('{"op": "unload", "id": "h"}'))
+            await asyncio.sleep(0.01)
+            self.assertIn("h", self.server.store)
+        self.assertEqual(await unload, {"ok": True})
+        self.assertNotIn("h", self.server.store)
+        self.assertEqual(self.server._locks, {})
+
+        with open("small.in", encoding="utf-8") as f:
+            graph, _, _ = create_graph(f.read())
+        server = FillServer(estimate_graph_bytes(graph))
+        for image_id in ("a", "b"):
+            await server.handle_line(json.dumps({"op": "load", "id": image_id, "path": "small.in"}))
+        self.assertEqual(server.store.evictions, 1)
+        self.assertEqual(list(server._locks), ["b"])
+        response = await server.handle_line('{"op": "query", "id": "a"}')
+        self.assertFalse(response["ok"])
+        self.assertEqual(list(server._locks), ["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from fixtures import load_graph
+from sharedmem import SharedGraph
+
+
+def worker_fill(shared, start_index, color):
+    """Runs in a worker process; shared arrives as an attached SharedGraph."""
+    with shared:
+        return shared.owner, shared.fill(start_index, color)
+
+
+class TestSharedGraph(unittest.TestCase):
+    """SharedGraph Test Suite"""
+
+    def test_publish_and_attach(self):
+        """Test attached arrays match the graph and its CSR."""
+        graph, _, _ = load_graph("flags.in")
+        with SharedGraph.publish(graph) as owner:
+            with SharedGraph.attach(owner.name) as shared:
+                self.assertFalse(shared.owner)
+                self.assertEqual((shared.width, shared.height), (graph.width, graph.height))
+                offsets, targets = graph.to_csr()
+                self.assertEqual(list(shared.offsets), offsets)
+                self.assertEqual(list(shared.targets), targets)
+                for vertex in graph.vertices:
+                    self.assertEqual(shared.color(vertex.index), vertex.color)
+                    self.assertEqual((shared.xs[vertex.index], shared.ys[vertex.index]), (vertex.x, vertex.y))
+                    self.assertEqual(list(shared.neighbors(vertex.index)), vertex.edges)
+
+                shared.fill(0, "cyan" if graph.vertices[0].color != "cyan" else "red")
+                self.assertEqual(owner.colors.tobytes(), shared.colors.tobytes())
+            self.assertLess(len(pickle.dumps(owner)), 200)
+        with self.assertRaises(FileNotFoundError):
+            SharedGraph.attach(owner.name)
+
+    def test_worker_processes(self):
+        """Test fills done by worker processes come back into the ImageGraph."""
+        graph, start, color = load_graph("heart.in")
+        expected, _, _ = load_graph("heart.in")
+        recolored = expected.bfs(start, color, verbose=False)
+        with SharedGraph.publish(graph) as owner:
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                is_owner, count = pool.submit(worker_fill, owner, start, color).result()
+            self.assertFalse(is_owner)
+            self.assertEqual(count, recolored)
+            self.assertEqual(owner.pull_colors(graph), recolored)
+        self.assertEqual(
+            [vertex.color for vertex in graph.vertices],
+            [vertex.color for vertex in expected.vertices],
+        )
+
+    def test_push_colors(self):
+        """Test the owner can refresh the block after local fills."""
+        graph, start, color = load_graph("small.in")
+        with SharedGraph.publish(graph) as owner:
+            graph.bfs(start, color, verbose=False)
+            self.assertEqual(owner.color(start), "red")
+            owner.push_colors(graph)
+            self.assertEqual(owner.color(start), color)
+            self.assertEqual(owner.pull_colors(graph), 0)
+            with self.assertRaises(ValueError):
+                owner.fill(start, "purple")
+
+    def test_publish_normalizes_and_cleans_up(self):
+        """Test colors are normalized and a failed publish unlinks its block."""
+        graph, start, _ = load_graph("small.in")
+        graph.vertices[start].color = " Red "
+        with SharedGraph.publish(graph) as owner:
+            self.assertEqual(owner.color(start), "red")
+            owner.push_colors(graph)
+            self.assertEqual(owner.color(start), "red")
+            self.assertGreater(owner.fill(start, " Blue "), 0)
+            self.assertEqual(owner.color(start), "blue")
+
+        graph.vertices[start].color = "purple"
+        name = f"shgr_test_{os.getpid()}"
+        with self.assertRaises(KeyError):
+            SharedGraph.publish(graph, name=name)
+        with self.assertRaises(FileNotFoundError):
+            SharedGraph.attach(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
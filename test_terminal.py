@@ -0,0 +1,116 @@
+import io
+import re
+import unittest
+
+from engines import fill
+from fill_tasks import FillTask
+from fixtures import load_graph
+from graph import BLOCK_CHAR, COLOR_DICT
+from terminal import TerminalRenderer, dirty_rectangles
+
+CODE_COLORS = {code: name for name, code in COLOR_DICT.items()}
+TOKEN = re.compile(r"\u001b\[(\d+);(\d+)H|(\u001b\[\d+m)|(" + BLOCK_CHAR + ")")
+
+
+def emulate(text, screen=None):
+    """Apply renderer output to a {(row, column): color} screen."""
+    screen = {} if screen is None else screen
+    row = column = 1
+    color = None
+    for match in TOKEN.finditer(text):
+        if match.group(1):
+            row, column = int(match.group(1)), int(match.group(2))
+        elif match.group(3):
+            color = CODE_COLORS.get(match.group(3))
+        else:
+            screen[(row, column)] = color
+            column += 1
+    return screen
+
+
+class TestDirtyRectangles(unittest.TestCase):
+    """dirty_rectangles Test Suite"""
+
+    def test_rectangles(self):
+        """Test runs merge across rows only when their x ranges match."""
+        cells = {(1, 0), (2, 0), (1, 1), (2, 1), (5, 1), (1, 3)}
+        self.assertEqual(
+            sorted(dirty_rectangles(cells)),
+            [(1, 0, 2, 2), (1, 3, 1, 1), (5, 1, 1, 1)],
+        )
+        self.assertEqual(dirty_rectangles({}), [])
+
+
+class TestTerminalRenderer(unittest.TestCase):
+    """TerminalRenderer Test Suite"""
+
+    def test_refresh_repaints_changed_cells(self):
+        """Test refresh writes only recolored cells and matches a full redraw."""
+        graph, start, color = load_graph("flags.in")
+        stream = io.StringIO()
+        renderer = TerminalRenderer(graph, stream, top=3, left=2)
+        renderer.draw()
+        screen = emulate(stream.getvalue())
+        self.assertEqual(renderer.refresh(), 0)
+
+        stream.seek(0)
+        stream.truncate()
+        recolored = graph.bfs(start, color, verbose=False)
+        self.assertEqual(renderer.refresh(), recolored)
+        self.assertEqual(stream.getvalue().count(BLOCK_CHAR), 2 * recolored)
+        emulate(stream.getvalue(), screen)
+
+        stream.seek(0)
+        stream.truncate()
+        fill(graph, 0, "cyan", "levels")
+        graph.fill_region(len(graph.vertices) - 1, "yellow")
+        task = FillTask(graph, 3, "magenta")
+        task.run()
+        task.cancel()
+        renderer.refresh()
+        emulate(stream.getvalue(), screen)
+
+        expected = io.StringIO()
+        full = TerminalRenderer(graph, expected, top=3, left=2)
+        full.draw()
+        self.assertEqual(screen, emulate(expected.getvalue()))
+        renderer.close()
+        self.assertIsNotNone(graph.dirty)
+        full.close()
+        self.assertIsNone(graph.dirty)
+
+    def test_removed_vertex_painted_black(self):
+        """Test removing a vertex repaints its cell as missing."""
+        graph, _, _ = load_graph("small.in")
+        stream = io.StringIO()
+        renderer = TerminalRenderer(graph, stream)
+        renderer.draw()
+        screen = emulate(stream.getvalue())
+        self.assertEqual(screen[(2, 3)], "red")
+        graph.remove_vertex(0)
+        stream.seek(0)
+        stream.truncate()
+        self.assertEqual(renderer.refresh(), 1)
+        emulate(stream.getvalue(), screen)
+        self.assertEqual(screen[(2, 3)], "black")
+        renderer.close()
+
+    def test_color_names_normalized(self):
+        """Test cells accept color names in any case and with padding."""
+        graph, _, _ = load_graph("small.in")
+        graph.vertices[0].color = "Red"
+        stream = io.StringIO()
+        renderer = TerminalRenderer(graph, stream)
+        renderer.draw()
+        screen = emulate(stream.getvalue())
+        self.assertEqual(screen[(2, 3)], "red")
+        graph.vertices[0].color = " BLUE "
+        graph.mark_dirty([0])
+        self.assertEqual(renderer.refresh(), 1)
+        emulate(stream.getvalue(), screen)
+        self.assertEqual(screen[(2, 3)], "blue")
+        renderer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
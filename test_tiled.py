@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from fixtures import load_graph
+from tiled import TiledColorStore
+
+
+class TestTiledColorStore(unittest.TestCase):
+    """TiledColorStore Test Suite"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "image.tiles")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fill_matches_bfs(self):
+        """Test a fill with a tiny tile cache recolors the same pixels as bfs."""
+        for name in ("heart", "horns", "spiral", "smile"):
+            expected, start, color = load_graph(name + ".in")
+            vertex = expected.vertices[start]
+            TiledColorStore.from_image_graph(
+                expected, self.path, tile_size=4, max_tiles=2
+            ).close()
+            expected_count = expected.bfs(start, color, verbose=False)
+            with TiledColorStore(self.path, max_tiles=2) as store:
+                self.assertEqual(store.fill(vertex.x, vertex.y, color), expected_count, name)
+                self.assertLessEqual(len(store._cache), 2)
+            with TiledColorStore(self.path) as store:
+                for vertex in expected.vertices:
+                    self.assertEqual(store.get(vertex.x, vertex.y), vertex.color, name)
+
+    def test_round_trip_and_empty_pixels(self):
+        """Test conversion back to an ImageGraph keeps colors and grid edges."""
+        graph, _, _ = load_graph("small.in")
+        with TiledColorStore.from_image_graph(graph, self.path, tile_size=2) as store:
+            self.assertIsNone(store.get(0, 0))
+            loaded = store.to_image_graph()
+        self.assertEqual(
+            [(v.x, v.y, v.color) for v in loaded.vertices],
+            [(v.x, v.y, v.color) for v in graph.vertices],
+        )
+        self.assertEqual(
+            [sorted(v.edges) for v in loaded.vertices],
+            [sorted(v.edges) for v in graph.vertices],
+        )
+        with self.assertRaises(ValueError):
+            TiledColorStore(self.path, max_tiles=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
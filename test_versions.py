@@ -0,0 +1,90 @@
+import gc
+import threading
+import unittest
+
+from benchmark import make_grid_image
+from fixtures import load_graph
+from versions import VersionedColors
+
+
+class TestVersionedColors(unittest.TestCase):
+    """VersionedColors Test Suite"""
+
+    def test_publish_copies_changed_pages(self):
+        """Test fills appear only after publish and untouched pages are shared."""
+        graph, _ = make_grid_image(32, 64, block=8, seed=1)
+        versions = VersionedColors(graph, page_rows=8)
+        before = versions.snapshot()
+        self.assertEqual(before.get(5, 7), graph.vertices[7 * 32 + 5].color)
+
+        graph.vertices[0].color = "blue" if graph.vertices[0].color != "blue" else "red"
+        graph.mark_dirty([0])
+        graph.bfs(0, "magenta", verbose=False)
+        self.assertIs(versions.snapshot(), before)
+
+        after = versions.publish()
+        self.assertEqual(after.version, 1)
+        for vertex in graph.vertices:
+            self.assertEqual(after.get(vertex.x, vertex.y), vertex.color)
+        self.assertNotEqual(before.get(0, 0), after.get(0, 0))
+        shared = sum(a is b for a, b in zip(before._pages, after._pages))
+        self.assertEqual(shared + versions.pages_copied, len(after._pages))
+        self.assertGreater(shared, 0)
+        self.assertIs(versions.publish(), after)
+        versions.close()
+
+    def test_old_versions_reclaimed(self):
+        """Test a version lives exactly as long as a reader holds it."""
+        graph, start, _ = load_graph("flags.in")
+        versions = VersionedColors(graph)
+        held = versions.snapshot()
+        colors = [c for c in ("red", "green", "blue", "cyan") if c != graph.vertices[start].color]
+        for color in colors[:3]:
+            graph.bfs(start, color, verbose=False)
+            versions.publish()
+        gc.collect()
+        self.assertEqual(versions.live_versions(), [0, 3])
+        del held
+        gc.collect()
+        self.assertEqual(versions.live_versions(), [3])
+
+    def test_readers_never_see_torn_fills(self):
+        """Test concurrent readers only ever see whole fills."""
+        graph, start = make_grid_image(60, 60, block=6, seed=3)
+        versions = VersionedColors(graph)
+        before = [vertex.color for vertex in graph.vertices]
+        graph.bfs(start, "red", verbose=False)
+        region = [
+            (vertex.x, vertex.y)
+            for vertex, color in zip(graph.vertices, before)
+            if vertex.color != color
+        ]
+        self.assertGreater(len(region), 100)
+        versions.publish()
+
+        stop = threading.Event()
+        problems = []
+
+        def reader():
+            while not stop.is_set():
+                snapshot = versions.snapshot()
+                colors = {snapshot.get(x, y) for x, y in region}
+                if len(colors) != 1:
+                    problems.append((snapshot.version, colors))
+                    return
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for round_number in range(50):
+            graph.bfs(start, "blue" if round_number % 2 == 0 else "red", verbose=False)
+            versions.publish()
+        stop.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(problems, [])
+        self.assertEqual(versions.snapshot().version, 51)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+"""
+Out-of-core tiled color storage.
+
+A TiledColorStore keeps an image's colors in a memory-mapped file split into
+square tiles, one byte per pixel, with an implicit 4-neighbor grid topology.
+Only a bounded LRU of tiles is held in memory; dirty tiles are written back
+when they are evicted and on flush(). Bucket fills run a scanline flood fill
+that uses the pixel colors themselves as the visited marks, so their memory is
+bounded by the tile cache and the span stack rather than by the image size.
+
+File layout: a 16-byte header (magic b"TILE", width, height, tile size as
+little-endian uint32) followed by the tiles in row-major tile order, each
+tile_size * tile_size bytes in row-major pixel order.
+"""
+
+import mmap
+import struct
+from collections import OrderedDict
+
+from graph import COLOR_DICT, grid_graph
+
+HEADER = struct.Struct("<4sIII")
+MAGIC = b"TILE"
+
+# Palette codes: index into COLOR_NAMES; EMPTY marks a pixel without a vertex.
+COLOR_NAMES = list(COLOR_DICT)
+COLOR_CODES = {name: code for code, name in enumerate(COLOR_NAMES)}
+EMPTY = 255
+
+
+class TiledColorStore:
+    """
+    Memory-mapped, tiled color storage with a bounded tile cache.
+
+    Instance Variables:
+        width: The image width in pixels.
+        height: The image height in pixels.
+        tile_size: The width and height of a tile in pixels.
+        max_tiles: The most tiles kept in memory at once.
+        tile_loads: The number of tiles read from the file so far.
+    """
+
+    def __init__(self, path, max_tiles=64):
+        """
+        Opens an existing tile file created with TiledColorStore.create.
+
+        pre: max_tiles is at least 1; raises ValueError otherwise.
+        """
+        if max_tiles < 1:
+            raise ValueError(f"max_tiles must be at least 1, got {max_tiles}.")
+        self._file = open(path, "r+b")  # pylint: disable=consider-using-with
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.width, self.height, self.tile_size = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a tile file.")
+        self.max_tiles = max_tiles
+        self.tile_loads = 0
+        self._tiles_wide = (self.width + self.tile_size - 1) // self.tile_size
+        self._tile_bytes = self.tile_size * self.tile_size
+        self._cache = OrderedDict()
+        self._dirty = set()
+
+    @classmethod
+    def create(cls, path, width, height, tile_size=256, max_tiles=64):
+        """
+        Creates a new tile file with every pixel empty and opens it.
+        """
+        tiles_wide = (width + tile_size - 1) // tile_size
+        tiles_high = (height + tile_size - 1) // tile_size
+        tile_bytes = tile_size * tile_size
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, width, height, tile_size))
+            empty_tile = bytes([EMPTY]) * tile_bytes
+            for _ in range(tiles_wide * tiles_high):
+                f.write(empty_tile)
+        return cls(path, max_tiles)
+
+    @classmethod
+    def from_image_graph(cls, graph, path, tile_size=256, max_tiles=64):
+        """
+        Creates a tile file holding the colors of an ImageGraph.
+        """
+        store = cls.create(path, graph.width, graph.height, tile_size, max_tiles)
+        for vertex in graph.vertices:
+            store.set(vertex.x, vertex.y, vertex.color)
+        store.flush()
+        return store
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _tile(self, tile_index):
+        """Return the cached tile, loading it (and evicting) as needed."""
+        tile = self._cache.get(tile_index)
+        if tile is not None:
+            self._cache.move_to_end(tile_index)
+            return tile
+        while len(self._cache) >= self.max_tiles:
+            evicted_index, evicted = self._cache.popitem(last=False)
+            if evicted_index in self._dirty:
+                self._write_tile(evicted_index, evicted)
+                self._dirty.discard(evicted_index)
+        offset = HEADER.size + tile_index * self._tile_bytes
+        tile = bytearray(self._map[offset : offset + self._tile_bytes])
+        self._cache[tile_index] = tile
+        self.tile_loads += 1
+        return tile
+
+    def _write_tile(self, tile_index, tile):
+        offset = HEADER.size + tile_index * self._tile_bytes
+        self._map[offset : offset + self._tile_bytes] = tile
+
+    def _locate(self, x, y):
+        tile_x, in_x = divmod(x, self.tile_size)
+        tile_y, in_y = divmod(y, self.tile_size)
+        return tile_y * self._tiles_wide + tile_x, in_y * self.tile_size + in_x
+
+    def get_code(self, x, y):
+        """Return the palette code at (x, y), EMPTY for a missing pixel."""
+        tile_index, offset = self._locate(x, y)
+        return self._tile(tile_index)[offset]
+
+    def set_code(self, x, y, code):
+        """Set the palette code at (x, y)."""
+        tile_index, offset = self._locate(x, y)
+        self._tile(tile_index)[offset] = code
+        self._dirty.add(tile_index)
+
+    def get(self, x, y):
+        """
+        Returns the color name at (x, y), or None if the pixel is empty.
+        """
+        code = self.get_code(x, y)
+        return None if code == EMPTY else COLOR_NAMES[code]
+
+    def set(self, x, y, color):
+        """
+        Sets the color at (x, y); None empties the pixel.
+        """
+        if color is None:
+            code = EMPTY
+        else:
+            code = COLOR_CODES.get(color.strip().lower())
+            if code is None:
+                raise ValueError(color + " is not a valid color!")
+        self.set_code(x, y, code)
+
+    def fill(self, x, y, color):
+        """
+        Bucket fills the 4-connected same-colored region containing (x, y).
+
+        Uses a scanline flood fill: each stacked seed is extended to a whole
+        horizontal span, recolored, and the rows above and below are scanned
+        for new seeds. Recolored pixels no longer match the initial color, so
+        no visited set is needed.
+
+        pre: (x, y) is inside the image and not empty.
+
+        post: recolors the same pixels as bfs/dfs would on the equivalent grid
+              ImageGraph; returns the number of recolored pixels.
+        """
+        initial = self.get_code(x, y)
+        if initial == EMPTY:
+            raise ValueError(f"Pixel ({x}, {y}) is empty.")
+        new = COLOR_CODES.get(color.strip().lower())
+        if new is None:
+            raise ValueError(color + " is not a valid color!")
+        if new == initial:
+            return 0
+
+        get_code = self.get_code
+        set_code = self.set_code
+        width = self.width
+        height = self.height
+        recolored = 0
+        stack = [(x, y)]
+        while stack:
+            seed_x, row = stack.pop()
+            if get_code(seed_x, row) != initial:
+                continue
+            left = seed_x
+            while left > 0 and get_code(left - 1, row) == initial:
+                left -= 1
+            right = seed_x
+            while right + 1 < width and get_code(right + 1, row) == initial:
+                right += 1
+            for span_x in range(left, right + 1):
+                set_code(span_x, row, new)
+            recolored += right - left + 1
+
+            for next_row in (row - 1, row + 1):
+                if not 0 <= next_row < height:
+                    continue
+                in_span = False
+                for span_x in range(left, right + 1):
+                    if get_code(span_x, next_row) == initial:
+                        if not in_span:
+                            stack.append((span_x, next_row))
+                            in_span = True
+                    else:
+                        in_span = False
+        return recolored
+
+    def to_image_graph(self):
+        """
+        Builds an in-memory ImageGraph with 4-neighbor edges from the store.
+
+        post: vertices are numbered in row-major order over non-empty pixels.
+        """
+        return grid_graph(
+            self.width,
+            self.height,
+            (
+                [self.get(x, y) for x in range(self.width)]
+                for y in range(self.height)
+            ),
+        )
+
+    def flush(self):
+        """Writes every dirty cached tile back to the file."""
+        for tile_index in self._dirty:
+            self._write_tile(tile_index, self._cache[tile_index])
+        self._dirty.clear()
+        self._map.flush()
+
+    def close(self):
+        """Flushes and closes the store."""
+        if self._map.closed:
+            return
+        if hasattr(self, "_dirty"):
+            self.flush()
+        self._map.close()
+        self._file.close()
@@ -0,0 +1,132 @@
+"""
+Versioned, copy-on-write color snapshots of an ImageGraph.
+
+Fills write the vertices' colors in place; those are the writer's working
+copy. A VersionedColors store keeps published versions of the image as
+immutable pages of rows. publish(), called by the writer after each fill,
+copies only the pages holding cells recolored since the previous version
+and swaps in the new version with one reference assignment. Readers in
+other threads call snapshot() and read from the ColorSnapshot they get: they
+never wait for a fill and never see a half-applied one.
+
+Pages that did not change are shared between versions. An old version, and
+any page only it uses, is freed as soon as no reader holds its snapshot.
+"""
+
+import threading
+import weakref
+
+
+class ColorSnapshot:
+    """
+    One immutable published version of an image's colors.
+
+    Instance Variables:
+        version: The version number, counting up from 0.
+        width: The image width in pixels.
+        height: The image height in pixels.
+        page_rows: The number of rows in every page.
+    """
+
+    __slots__ = ("version", "width", "height", "page_rows", "_pages", "__weakref__")
+
+    def __init__(self, version, width, height, page_rows, pages):
+        self.version = version
+        self.width = width
+        self.height = height
+        self.page_rows = page_rows
+        self._pages = pages
+
+    def get(self, x, y):
+        """Return the color at (x, y), or None if the pixel has no vertex."""
+        return self._pages[y // self.page_rows][y % self.page_rows][x]
+
+    def row(self, y):
+        """Return row y as a tuple of colors."""
+        return self._pages[y // self.page_rows][y % self.page_rows]
+
+    def rows(self):
+        """Yields every row as a tuple of colors, top to bottom."""
+        for page in self._pages:
+            yield from page
+
+
+class VersionedColors:
+    """
+    Publishes copy-on-write snapshots of an ImageGraph's colors.
+
+    Instance Variables:
+        graph: The ImageGraph whose colors are published.
+        page_rows: The number of image rows per copy-on-write page.
+        pages_copied: The number of pages copied by publish() so far.
+    """
+
+    def __init__(self, graph, page_rows=16):
+        self.graph = graph
+        self.page_rows = page_rows
+        self.pages_copied = 0
+        self._lock = threading.Lock()
+        self._live = weakref.WeakValueDictionary()
+
+        img = [[None] * graph.width for _ in range(graph.height)]
+        for vertex in graph.vertices:
+            img[vertex.y][vertex.x] = vertex.color
+        pages = tuple(
+            tuple(tuple(row) for row in img[top : top + page_rows])
+            for top in range(0, graph.height, page_rows)
+        )
+        graph.track_dirty(consumer=self)
+        graph.take_dirty(self)
+        self._current = self._make(0, pages)
+
+    def _make(self, version, pages):
+        snapshot = ColorSnapshot(
+            version, self.graph.width, self.graph.height, self.page_rows, pages
+        )
+        self._live[version] = snapshot
+        return snapshot
+
+    def snapshot(self):
+        """
+        Returns the latest published version without blocking.
+
+        post: an immutable ColorSnapshot.
+        """
+        return self._current
+
+    def publish(self):
+        """
+        Publishes the colors recolored since the last version.
+
+        Must be called from the thread that runs the fills.
+
+        post: returns the current snapshot, a new one if anything changed.
+        """
+        with self._lock:
+            changes = self.graph.take_dirty(self)
+            if not changes:
+                return self._current
+
+            by_page = {}
+            for (x, y), color in changes.items():
+                by_page.setdefault(y // self.page_rows, []).append((x, y, color))
+
+            current = self._current
+            pages = list(current._pages)
+            page_rows = self.page_rows
+            for page_index, cells in by_page.items():
+                rows = [list(row) for row in pages[page_index]]
+                for x, y, color in cells:
+                    rows[y % page_rows][x] = color
+                pages[page_index] = tuple(tuple(row) for row in rows)
+            self.pages_copied += len(by_page)
+            self._current = self._make(current.version + 1, tuple(pages))
+            return self._current
+
+    def live_versions(self):
+        """Return the sorted version numbers still held by someone."""
+        return sorted(self._live.keys())
+
+    def close(self):
+        """Stops tracking changes on the graph."""
+        self.graph.track_dirty(False, self)